@@ -19,7 +19,10 @@ from app.api.views.inflearn import router as inflearn_router
 from app.api.views.message import router as message_router
 from slack_bolt.adapter.socket_mode.aiohttp import AsyncSocketModeHandler
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from app.slack.services.background import BackgroundService
+from app.slack.dispatcher import Priority, slack_dispatcher
 
 
 from slack_bolt.async_app import AsyncApp
@@ -29,7 +32,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -41,7 +44,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
+# 종이비행기, 콘텐츠 목록처럼 큰 응답만 압축합니다.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 slack_handler = AsyncSocketModeHandler(
     app=slack_app,
@@ -92,6 +98,8 @@ if settings.ENV == "prod":
         async_schedule.add_job(
             subscribe_job, trigger=subscribe_trigger, args=[slack_app]
         )
+        # 서버가 재시작되기 전에 끝나지 않은 오늘 구독 알림 작업을 이어서 전송합니다.
+        async_schedule.add_job(subscribe_job, args=[slack_app], kwargs={"resume": True})
 
         # 스케줄러 시작
         async_schedule.start()
@@ -110,7 +118,9 @@ if settings.ENV == "prod":
             logger.error(message)
 
             # 관리자에게 에러를 알립니다.
-            await slack_app.client.chat_postMessage(
+            await slack_dispatcher.post_message(
+                slack_app.client,
+                Priority.ADMIN,
                 channel=settings.ADMIN_CHANNEL,
                 text=message,
             )
@@ -128,15 +138,18 @@ if settings.ENV == "prod":
             message = f"🫢: {error=} 🕊️: {trace=}"
             logger.error(message)
 
-            await slack_app.client.chat_postMessage(
+            await slack_dispatcher.post_message(
+                slack_app.client,
+                Priority.ADMIN,
                 channel=settings.ADMIN_CHANNEL,
                 text=message,
             )
 
-    async def subscribe_job(slack_app: AsyncApp) -> None:
+    async def subscribe_job(slack_app: AsyncApp, resume: bool = False) -> None:
         slack_service = BackgroundService(repo=SlackRepository())
         try:
-            await slack_service.prepare_subscribe_message_data()
+            if not resume:
+                await slack_service.prepare_subscribe_message_data()
             await slack_service.send_subscription_messages(slack_app)
         except Exception as e:
             trace = traceback.format_exc()
@@ -144,7 +157,9 @@ if settings.ENV == "prod":
             message = f"🫢: {error=} 🕊️: {trace=}"
             logger.error(message)
 
-            await slack_app.client.chat_postMessage(
+            await slack_dispatcher.post_message(
+                slack_app.client,
+                Priority.JOB_STATUS,
                 channel=settings.ADMIN_CHANNEL,
                 text=message,
             )
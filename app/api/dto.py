@@ -4,6 +4,9 @@ from pydantic import BaseModel, Field
 
 class ContentResponse(BaseModel):
     count: int = Field(..., description="조건에 맞는 콘텐츠의 총 개수", examples=[1])
+    next_cursor: str | None = Field(
+        None, description="다음 페이지 커서, 마지막 페이지라면 null"
+    )
     data: list[dict[str, Any]] = Field(
         ...,
         description="조회된 콘텐츠의 배열",
@@ -20,7 +23,7 @@ class ContentResponse(BaseModel):
                     "name": "김은찬",
                     "cohort": "10기",
                     "job_category": "풀스택",
-                    "relevance": 0,
+                    "relevance": 0.0,
                 }
             ]
         ],
@@ -28,8 +31,13 @@ class ContentResponse(BaseModel):
 
 
 class PaperPlaneResponse(BaseModel):
-    count: int = Field(
-        ..., description="조건에 맞는 종이비행기의 총 개수", examples=[1]
+    count: int | None = Field(
+        ...,
+        description="조건에 맞는 종이비행기의 총 개수, with_count=false 라면 null",
+        examples=[1],
+    )
+    next_cursor: str | None = Field(
+        None, description="다음 페이지 커서, 마지막 페이지라면 null"
     )
     data: list[dict[str, Any]] = Field(
         ...,
@@ -59,3 +67,20 @@ class PaperPlaneResponse(BaseModel):
 class SendMessageDTO(BaseModel):
     channel_id: str = Field(..., description="채널 ID")
     message: str = Field(..., description="메시지")
+
+
+class PointLeaderboardResponse(BaseModel):
+    data: list[dict[str, Any]] = Field(
+        ...,
+        description="총 포인트 내림차순 순위의 배열, 공동 순위는 같은 rank 를 가집니다.",
+        examples=[
+            [
+                {
+                    "rank": 1,
+                    "user_id": "U07NTP9MGH4",
+                    "name": "김은찬",
+                    "total_point": 1200,
+                }
+            ]
+        ],
+    )
@@ -0,0 +1,46 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+# 글 게시판은 누구나 볼 수 있으므로 공유 캐시를 허용하고, 짧게 캐시한 뒤 재검증합니다.
+PUBLIC_CACHE_CONTROL = "public, max-age=30, must-revalidate"
+# 종이비행기는 유저별 데이터이므로 브라우저에만 저장하고 매번 재검증합니다.
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+# 일부 기능이 실패하여 불완전한 응답은 저장하지 않습니다. 예) 검색어 번역 실패
+NO_STORE_CACHE_CONTROL = "no-store"
+
+
+def make_etag(request: Request, *values: Any) -> str:
+    """저장소 세대 등의 값과 쿼리 파라미터로 약한(weak) ETag 를 만듭니다."""
+    query_params = sorted(request.query_params.multi_items())
+    digest = hashlib.blake2b(
+        repr((values, query_params)).encode("utf-8"), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """요청의 If-None-Match 헤더가 ETag 와 일치하는지 확인합니다."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    # 약한 비교: W/ 접두사를 무시합니다.
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str) -> None:
+    """응답에 ETag 와 Cache-Control 헤더를 추가합니다."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """본문 없는 304 응답을 반환합니다."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(response, etag, cache_control)
+    return response
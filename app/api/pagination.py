@@ -0,0 +1,25 @@
+import base64
+import binascii
+
+import orjson
+from fastapi import HTTPException, status
+
+
+def encode_cursor(*values: str | int | float) -> str:
+    """다음 페이지 조회에 사용할 커서를 만듭니다. 클라이언트는 커서를 그대로 전달해야 합니다."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> list[str | int | float]:
+    """커서를 값 목록으로 변환합니다. 잘못된 커서라면 400 에러를 반환합니다."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, binascii.Error, orjson.JSONDecodeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다.",
+        )
+    return values
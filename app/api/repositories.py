@@ -1,5 +1,5 @@
 import csv
-from app import models
+from app import models, paper_planes, store
 import polars as pl
 
 
@@ -25,44 +25,50 @@ class ApiRepository:
         sender_id: str,
         offset: int,
         limit: int,
-    ) -> tuple[int, list[models.PaperPlane]]:
+        cursor: tuple[str, str] | None = None,
+    ) -> paper_planes.PaperPlanePage:
         """유저가 보낸 종이비행기를 가져옵니다."""
-        df = pl.read_csv("store/paper_plane.csv")
-        data = df.filter(pl.col("sender_id") == sender_id).sort(
-            "created_at", descending=True
+        return paper_planes.get_paper_plane_index().fetch_sent(
+            sender_id, offset, limit, cursor
         )
-        count = len(data)
-        paper_planes = data.slice(offset, limit).to_dicts()
-        return count, [models.PaperPlane(**paper_plane) for paper_plane in paper_planes]
 
     def fetch_received_paper_planes(
         self,
         receiver_id: str,
         offset: int,
         limit: int,
-    ) -> tuple[int, list[models.PaperPlane]]:
+        cursor: tuple[str, str] | None = None,
+    ) -> paper_planes.PaperPlanePage:
         """유저가 받은 종이비행기를 가져옵니다."""
-        df = pl.read_csv("store/paper_plane.csv")
-        data = df.filter(pl.col("receiver_id") == receiver_id).sort(
-            "created_at", descending=True
+        return paper_planes.get_paper_plane_index().fetch_received(
+            receiver_id, offset, limit, cursor
         )
-        count = len(data)
-        paper_planes = data.slice(offset, limit).to_dicts()
-        return count, [models.PaperPlane(**paper_plane) for paper_plane in paper_planes]
 
-    def fetch_paper_planes(self, sender_id: str) -> list[models.PaperPlane]:
-        """종이비행기를 가져옵니다."""
-        with open("store/paper_plane.csv") as f:
-            reader = csv.DictReader(f)
-            paper_planes = [
-                models.PaperPlane(**paper_plane)  # type: ignore
-                for paper_plane in reader
-                if paper_plane["sender_id"] == sender_id
-            ]
-            return paper_planes
+    def fetch_conversation_paper_planes(
+        self,
+        user_id: str,
+        other_user_id: str,
+        offset: int,
+        limit: int,
+        cursor: tuple[str, str] | None = None,
+    ) -> paper_planes.PaperPlanePage:
+        """두 유저가 주고받은 종이비행기를 가져옵니다."""
+        return paper_planes.get_paper_plane_index().fetch_conversation(
+            user_id, other_user_id, offset, limit, cursor
+        )
 
     def create_paper_plane(self, paper_plane: models.PaperPlane) -> None:
         """종이비행기를 생성합니다."""
+        generation = paper_planes.get_paper_plane_index().generation
         with open("store/paper_plane.csv", "a", newline="", encoding="utf-8") as f:
             writer = csv.writer(f, quoting=csv.QUOTE_ALL)
             writer.writerow(paper_plane.to_list_for_csv())
+        paper_planes.paper_plane_index.add(
+            paper_plane,
+            from_generation=generation,
+            to_generation=store.get_table_generation("paper_plane"),
+        )
+
+    def count_current_week_paper_planes(self, sender_id: str) -> int:
+        """이번 주에 보낸 종이비행기 수를 가져옵니다."""
+        return paper_planes.get_paper_plane_index().count_current_week(sender_id)
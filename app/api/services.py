@@ -1,11 +1,10 @@
-from datetime import datetime, timedelta
 import random
-from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException, status
 from app import models, store
 from app.api.repositories import ApiRepository
-from app.utils import tz_now
+from app.paper_planes import PaperPlanePage
+from app.slack.dispatcher import slack_dispatcher
 from app.config import settings
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.models.blocks import (
@@ -53,7 +52,8 @@ class ApiService:
         self._repo.create_paper_plane(model)
         store.paper_plane_upload_queue.append(model.to_list_for_sheet())
 
-        await client.chat_postMessage(
+        await slack_dispatcher.post_message(
+            client,
             channel=settings.THANKS_CHANNEL,
             text=f"💌 *<@{receiver_id}>* 님에게 종이비행기가 도착했어요!",
             blocks=[
@@ -70,7 +70,8 @@ class ApiService:
             ],
         )
 
-        await client.chat_postMessage(
+        await slack_dispatcher.post_message(
+            client,
             channel=sender_id,
             text=f"💌 *<@{sender_id}>* 님에게 종이비행기를 보냈어요!",
             blocks=[
@@ -94,12 +95,11 @@ class ApiService:
         user_id: str,
         offset: int,
         limit: int,
-    ) -> tuple[int, list[models.PaperPlane]]:
+        cursor: tuple[str, str] | None = None,
+    ) -> PaperPlanePage:
         """유저가 보낸 종이비행기를 가져옵니다."""
         return self._repo.fetch_sent_paper_planes(
-            sender_id=user_id,
-            offset=offset,
-            limit=limit,
+            sender_id=user_id, offset=offset, limit=limit, cursor=cursor
         )
 
     def fetch_received_paper_planes(
@@ -107,33 +107,30 @@ class ApiService:
         user_id: str,
         offset: int,
         limit: int,
-    ) -> tuple[int, list[models.PaperPlane]]:
+        cursor: tuple[str, str] | None = None,
+    ) -> PaperPlanePage:
         """유저가 받은 종이비행기를 가져옵니다."""
         return self._repo.fetch_received_paper_planes(
-            receiver_id=user_id, offset=offset, limit=limit
+            receiver_id=user_id, offset=offset, limit=limit, cursor=cursor
         )
 
-    def fetch_current_week_paper_planes(
+    def fetch_conversation_paper_planes(
         self,
         user_id: str,
-    ) -> list[models.PaperPlane]:
-        """이번 주 종이비행기를 가져옵니다."""
-        today = tz_now()
-
-        # 지난주 토요일 00시 계산
-        last_saturday = today - timedelta(days=(today.weekday() + 2) % 7)
-        start_dt = last_saturday.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        # 이번주 금요일 23:59:59 계산
-        this_friday = start_dt + timedelta(days=6)
-        end_dt = this_friday.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        paper_planes = []
-        for plane in self._repo.fetch_paper_planes(sender_id=user_id):
-            plane_created_ad = datetime.fromisoformat(plane.created_at).replace(
-                tzinfo=ZoneInfo("Asia/Seoul")
-            )
-            if start_dt <= plane_created_ad <= end_dt:
-                paper_planes.append(plane)
+        other_user_id: str,
+        offset: int,
+        limit: int,
+        cursor: tuple[str, str] | None = None,
+    ) -> PaperPlanePage:
+        """두 유저가 주고받은 종이비행기를 가져옵니다."""
+        return self._repo.fetch_conversation_paper_planes(
+            user_id=user_id,
+            other_user_id=other_user_id,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+        )
 
-        return paper_planes
+    def count_current_week_paper_planes(self, user_id: str) -> int:
+        """이번 주에 보낸 종이비행기 수를 가져옵니다."""
+        return self._repo.count_current_week_paper_planes(sender_id=user_id)
@@ -1,37 +1,40 @@
-from enum import StrEnum
 from typing import Any, Literal
 import polars as pl
 
 from starlette import status
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from app.api.auth import current_user
-from app.constants import ContentCategoryEnum, ContentSortEnum
+from app.constants import ContentCategoryEnum, ContentSortEnum, JobCategoryEnum
 from app.api import dto
+from app.api.etag import (
+    NO_STORE_CACHE_CONTROL,
+    PUBLIC_CACHE_CONTROL,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+)
+from app.api.pagination import decode_cursor, encode_cursor
 from app.models import SimpleUser
-from app.utils import translate_keywords
+from app.permalinks import get_permalink
+from app.search.frame import HIDDEN_COLUMNS, ContentsSnapshot, contents_frame
+from app.search.result_cache import SearchResultCache
+from app.search.tokenizer import has_symbol
+from app.slack.dispatcher import slack_dispatcher
+from app.translation import translate_keywords
 from app.config import settings
 from app.slack.event_handler import app as slack_app
 from slack_sdk.errors import SlackApiError
 
 
-class JobCategoryEnum(StrEnum):
-    DATA_SCIENCE = "데이터과학"
-    DATA_ANALYSIS = "데이터분석"
-    DATA_ENGINEERING = "데이터엔지니어"
-    BACKEND = "백엔드"
-    ANDROID = "안드"
-    INFRA = "인프라"
-    FULL_STACK = "풀스택"
-    FRONTEND = "프론트"
-    FLUTTER = "플러터"
-    AI = "ai"
-    IOS = "ios"
-    ML = "ml"
-    PMPO = "pmpo"
-
-
 router = APIRouter()
 
+# 글 게시판 검색 조건별 검색 결과(행 번호, 관련도) 캐시
+post_search_cache: SearchResultCache[tuple[list[int], list[float]]] = (
+    SearchResultCache()
+)
+
 
 @router.get(
     "/contents",
@@ -39,106 +42,183 @@ router = APIRouter()
     response_model=dto.ContentResponse,
 )
 async def fetch_contents(
+    request: Request,
     keyword: str,
     offset: int = 0,
     limit: int = Query(default=50, le=50),
+    cursor: str | None = None,
     category: ContentCategoryEnum | None = None,
     order_by: ContentSortEnum = ContentSortEnum.DT,
     descending: bool = True,
     job_category: JobCategoryEnum | None = None,
-) -> dto.ContentResponse:
-    """조건에 맞는 콘텐츠를 가져옵니다."""
+) -> Response:
+    """조건에 맞는 콘텐츠를 가져옵니다. 무한 스크롤은 next_cursor 를 cursor 로 전달합니다."""
     # TODO: LIKE 컬럼 추가하기
     # TODO: 결과가 없을 경우, 글감 추천하기 <- 클라이언트가 처리
     # TODO: 북마크 글 연동하기
     # TODO: 큐레이션 탭 추가하기
 
-    # 원본 데이터 불러오기
-    users_df = pl.read_csv(
-        "store/users.csv",
-        columns=["user_id", "name", "cohort", "channel_name"],
-    )
-    contents_df = pl.read_csv(
-        "store/contents.csv",
-        columns=[
-            "user_id",
-            "title",
-            "content_url",
-            "dt",
-            "category",
-            "tags",
-            "ts",
-        ],
+    # 미리 조인해 둔 데이터 불러오기 (생성일시 내림차순)
+    # 검색 중에 저장소가 바뀌더라도 같은 세대의 데이터로 검색하고 캐시하도록 한 번만 가져온다.
+    snapshot = contents_frame.get_snapshot()
+    contents_df = snapshot.df
+
+    # 저장소와 요청 파라미터가 같다면 클라이언트가 가진 응답을 그대로 사용한다.
+    etag = make_etag(request, snapshot.generation)
+    if is_not_modified(request, etag):
+        return not_modified(etag, PUBLIC_CACHE_CONTROL)
+
+    # 키워드 추출, TODO: 명사 단위로 쪼개서 검색하기
+    keywords = [
+        keyword.lower()
+        for keyword in keyword.replace(",", " ").replace("/", " ").split(" ")
+        if keyword
+    ]
+
+    # 같은 조건이라면 캐시된 검색 결과(행 번호, 관련도)를 잘라서 반환한다.
+    cache_key = (frozenset(keywords), category, job_category, order_by, descending)
+    result = post_search_cache.get(cache_key, snapshot.generation)
+    is_degraded = False
+    if result is None:
+        row_nrs, relevances, is_degraded = await _search_contents(
+            snapshot,
+            keywords,
+            category,
+            order_by,
+            descending,
+            job_category,
+        )
+        result = (row_nrs, relevances)
+        # 번역 없이 검색한 불완전한 결과는 캐시하지 않는다.
+        if not is_degraded:
+            post_search_cache.set(cache_key, snapshot.generation, result)
+
+    row_nrs, relevances = result
+    # 커서가 있다면 offset 은 무시하고 커서 위치부터 가져온다. (종이비행기 API 와 같다.)
+    if cursor:
+        offset = _get_cursor_position(contents_df, row_nrs, cursor)
+    page_df = contents_df[
+        pl.Series(row_nrs[offset : offset + limit], dtype=pl.UInt32)
+    ].with_columns(pl.Series("relevance", relevances[offset : offset + limit]))
+    if job_category:
+        page_df = page_df.with_columns(pl.lit(job_category.value).alias("job_category"))
+
+    next_cursor = None
+    if offset + limit < len(row_nrs):
+        last = page_df.row(-1, named=True)
+        next_cursor = encode_cursor(offset + limit, last["dt"], last["content_url"])
+
+    # 이미 검증한 데이터이므로 response_model 검증 없이 바로 직렬화합니다.
+    response = ORJSONResponse(
+        {
+            "count": len(row_nrs),
+            "data": page_df.drop(HIDDEN_COLUMNS).to_dicts(),
+            "next_cursor": next_cursor,
+        }
     )
+    if is_degraded:
+        # 클라이언트가 불완전한 결과를 ETag 로 재사용하지 않도록 저장하지 않게 한다.
+        response.headers["Cache-Control"] = NO_STORE_CACHE_CONTROL
+    else:
+        set_cache_headers(response, etag, PUBLIC_CACHE_CONTROL)
+    return response
+
+
+def _get_cursor_position(
+    contents_df: pl.DataFrame, row_nrs: list[int], cursor: str
+) -> int:
+    """
+    커서가 가리키는 다음 페이지의 시작 위치를 반환합니다.
+    커서는 (다음 위치, 이전 페이지 마지막 콘텐츠의 생성일시, url)이며,
+    저장소가 바뀌어 위치가 달라졌다면 마지막 콘텐츠를 찾아 그 다음부터 가져옵니다.
+    """
+    position, dt, content_url = decode_cursor(cursor, size=3)
+    if not isinstance(position, int) or position < 1:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+    if position <= len(row_nrs):
+        last = contents_df.row(row_nrs[position - 1], named=True)
+        if (last["dt"], last["content_url"]) == (dt, content_url):
+            return position
+
+    content_urls = contents_df["content_url"]
+    for index, row_nr in enumerate(row_nrs):
+        if content_urls[row_nr] == content_url:
+            return index + 1
+    # 마지막 콘텐츠가 사라졌다면 같은 위치부터 가져온다.
+    return min(position, len(row_nrs))
+
+
+async def _search_contents(
+    snapshot: ContentsSnapshot,
+    keywords: list[str],
+    category: ContentCategoryEnum | None,
+    order_by: ContentSortEnum,
+    descending: bool,
+    job_category: JobCategoryEnum | None,
+) -> tuple[list[int], list[float], bool]:
+    """
+    조건에 맞는 콘텐츠의 행 번호와 관련도를 정렬하여 반환합니다.
+    검색어를 번역하지 못해 번역 없이 검색했는지 여부를 함께 반환합니다.
+    """
+    contents_df = snapshot.df
 
     # 직군 필터링
     if job_category:
-        users_df = (
-            users_df.filter(pl.col("channel_name").str.contains(f"(?i){job_category}"))
-            .with_columns(pl.lit(job_category).alias("job_category"))
-            .drop("channel_name")
+        contents_df = contents_df.filter(
+            pl.col("channel_name").str.contains(job_category.value, literal=True)
         )
-    else:
-        job_categories = [category.value for category in JobCategoryEnum]
-        users_df = users_df.with_columns(
-            pl.col("channel_name")
-            .apply(lambda x: next((cat for cat in job_categories if cat in x), None))
-            .alias("job_category")
-        ).drop("channel_name")
-
-    # 유니크한 콘텐츠만 가져오기
-    joined_df = contents_df.unique(subset=["content_url"]).join(
-        users_df, on="user_id", how="inner"
-    )
 
-    if keyword == "전체보기":
+    if keywords == ["전체보기"]:
         # '전체보기'는 최신순으로 정렬하여 반환
-        contents = joined_df.sort(["dt"], descending=descending)
-        count = len(contents)
-        data = list(
-            map(
-                lambda x: {**x, "relevance": 0},
-                contents.slice(offset, limit).to_dicts(),
-            )
-        )
-        return dto.ContentResponse(count=count, data=data)
+        row_nrs = contents_df["row_nr"].to_list()
+        if not descending:
+            row_nrs.reverse()
+        return row_nrs, [0.0] * len(row_nrs), False
 
     if category:
-        contents_df = contents_df.filter(contents_df["category"] == category)
+        contents_df = contents_df.filter(pl.col("category") == category.value)
 
-    # 키워드 추출, TODO: 명사 단위로 쪼개서 검색하기
-    keywords = [
-        keyword.lower()
-        for keyword in keyword.replace(",", " ").replace("/", " ").split(" ")
-        if keyword
-    ]
-    keywords.extend(translate_keywords(keywords))
+    translated = await translate_keywords(keywords)
+    keywords = keywords + translated.keywords
 
-    # 키워드 매칭
+    # 키워드 매칭 및 관련도(BM25) 계산
+    # 토큰으로 나눌 수 없는 문자가 포함된 키워드(예: c++, node.js, 日本)는 문자열 포함 여부로 찾는다.
+    token_keywords = {keyword for keyword in keywords if not has_symbol(keyword)}
+    literal_keywords = set(keywords) - token_keywords
     matched_dfs = [
-        joined_df.filter(
-            joined_df.apply(lambda row: match_keyword(keyword, row)).to_series()
+        pl.DataFrame(
+            contents_frame.get_post_index(snapshot).search(token_keywords),
+            schema={"content_url": pl.Utf8, "relevance": pl.Float64},
+            orient="row",
         )
-        for keyword in set(keywords)
     ]
-    if not matched_dfs:
-        return dto.ContentResponse(count=0, data=[])
-
-    # 관련도 추가
-    combined_df: pl.DataFrame = pl.concat(matched_dfs)
-    grouped_df = combined_df.groupby("content_url").agg(pl.count().alias("relevance"))
-
-    contents = joined_df.join(grouped_df, on="content_url", how="inner").sort(
-        [order_by, "dt"], descending=[descending, True]
+    matched_dfs.extend(
+        contents_df.filter(
+            pl.col("search_text").str.contains(keyword, literal=True)
+        ).select("content_url", pl.lit(1.0).alias("relevance"))
+        for keyword in literal_keywords
+    )
+    grouped_df = (
+        pl.concat(matched_dfs)
+        .group_by("content_url")
+        .agg(pl.col("relevance").sum().round(4))
     )
 
-    count = len(contents)
-    data = contents.slice(offset, limit).to_dicts()
-    return dto.ContentResponse(count=count, data=data)
-
-
-def match_keyword(keyword: str, row: tuple) -> bool:
-    return keyword in f"{row[1]},{row[5]},{row[7]}".lower()  # title, tags, name
+    # left join 은 생성일시 내림차순을 유지한다.
+    contents = contents_df.join(grouped_df, on="content_url", how="left").filter(
+        pl.col("relevance").is_not_null()
+    )
+    if order_by == ContentSortEnum.RELEVANCE:
+        contents = contents.sort(["relevance", "dt"], descending=[descending, True])
+    elif not descending:
+        contents = contents.reverse()
+
+    return (
+        contents["row_nr"].to_list(),
+        contents["relevance"].to_list(),
+        translated.is_degraded,
+    )
 
 
 @router.get(
@@ -217,7 +297,9 @@ async def update_message(
         raise HTTPException(status_code=403, detail="수정 권한이 없습니다.")
 
     try:
-        await slack_app.client.chat_update(
+        await slack_dispatcher.call(
+            slack_app.client,
+            "chat.update",
             channel=channel_id,
             ts=ts,
             text=data.text,
@@ -225,12 +307,10 @@ async def update_message(
             attachments=data.attachments,
         )
 
-        permalink_res = await slack_app.client.chat_getPermalink(
-            channel=channel_id,
-            message_ts=ts,
-        )
+        # 메시지를 수정해도 링크는 바뀌지 않으므로 캐시된 링크를 사용한다.
+        permalink = await get_permalink(slack_app.client, channel_id, ts)
 
-        return {"permalink": permalink_res["permalink"]}
+        return {"permalink": permalink}
 
     except SlackApiError as e:
         raise HTTPException(status_code=409, detail=str(e))
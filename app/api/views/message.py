@@ -5,6 +5,7 @@ from app.api.auth import current_user
 from app.api.dto import SendMessageDTO
 from app.models import SimpleUser
 from app.config import settings
+from app.slack.dispatcher import slack_dispatcher
 from app.slack.event_handler import app as slack_app
 
 
@@ -23,10 +24,29 @@ async def send_messages(
     if user.user_id not in settings.ADMIN_IDS:
         raise HTTPException(status_code=403, detail="메시지 전송 권한이 없습니다.")
 
-    for dto in dto_list:
-        await slack_app.client.chat_postMessage(
-            channel=dto.channel_id,
-            text=dto.message,
-        )
+    # 슬랙 호출 제한에 맞춰 대량 DM 우선순위로 동시에 전송한다.
+    errors = await slack_dispatcher.post_messages(
+        slack_app.client,
+        [{"channel": dto.channel_id, "text": dto.message} for dto in dto_list],
+    )
+    failed_channel_ids = [
+        dto.channel_id for dto, error in zip(dto_list, errors) if error is not None
+    ]
+    return {
+        "message": "메시지를 보냈습니다.",
+        "failed_channel_ids": failed_channel_ids,
+    }
 
-    return {"message": "메시지를 보냈습니다."}
+
+@router.get(
+    "/dispatcher-metrics",
+    status_code=status.HTTP_200_OK,
+)
+async def get_dispatcher_metrics(
+    user: SimpleUser = Depends(current_user),
+) -> dict[str, Any]:
+    """슬랙 API 메서드별 호출, 실패, 재시도, 대기 지표를 가져옵니다."""
+    if user.user_id not in settings.ADMIN_IDS:
+        raise HTTPException(status_code=403, detail="조회 권한이 없습니다.")
+
+    return slack_dispatcher.get_metrics()
@@ -1,11 +1,22 @@
 from pydantic import BaseModel
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from app.api.auth import current_user
 from app.api.deps import api_service
+from app.api.etag import (
+    PRIVATE_CACHE_CONTROL,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+)
+from app.api.pagination import decode_cursor, encode_cursor
 from app.api.services import ApiService
 from app.api import dto
 from app.constants import BOT_IDS
 from app.models import SimpleUser
+from app.paper_planes import PaperPlanePage
+from app.store import get_table_generation
 from app.config import settings
 from app.slack.event_handler import app as slack_app
 
@@ -48,8 +59,8 @@ async def send_paper_plane(
     if user.user_id == settings.SUPER_ADMIN:
         pass
     else:
-        paper_planes = service.fetch_current_week_paper_planes(user_id=user.user_id)
-        if len(paper_planes) >= 7:
+        paper_plane_count = service.count_current_week_paper_planes(user.user_id)
+        if paper_plane_count >= 7:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="종이비행기는 한 주에 7개까지 보낼 수 있어요. (토요일 00시에 충전)",
@@ -71,18 +82,26 @@ async def send_paper_plane(
     response_model=dto.PaperPlaneResponse,
 )
 async def fetch_sent_paper_planes(
+    request: Request,
     offset: int = 0,
     limit: int = Query(default=1000, le=1000),  # TODO: 무한 스크롤 구현 시 수정
+    cursor: str | None = None,
+    with_count: bool = True,
     service: ApiService = Depends(api_service),
     user: SimpleUser = Depends(current_user),
-) -> dto.PaperPlaneResponse:
-    """조건에 맞는 종이비행기를 가져옵니다."""
-    count, data = service.fetch_sent_paper_planes(
-        user_id=user.user_id, offset=offset, limit=limit
-    )
-    return dto.PaperPlaneResponse(
-        count=count, data=[each.model_dump() for each in data]
+) -> Response:
+    """조건에 맞는 종이비행기를 가져옵니다. 무한 스크롤은 next_cursor 를 cursor 로 전달합니다."""
+    etag = make_etag(request, get_table_generation("paper_plane"), user.user_id)
+    if is_not_modified(request, etag):
+        return not_modified(etag, PRIVATE_CACHE_CONTROL)
+
+    page = service.fetch_sent_paper_planes(
+        user_id=user.user_id,
+        offset=offset,
+        limit=limit,
+        cursor=_decode_paper_plane_cursor(cursor),
     )
+    return _paper_plane_response(page, with_count, etag)
 
 
 @router.get(
@@ -91,15 +110,82 @@ async def fetch_sent_paper_planes(
     response_model=dto.PaperPlaneResponse,
 )
 async def fetch_received_paper_planes(
+    request: Request,
     offset: int = 0,
     limit: int = Query(default=1000, le=1000),  # TODO: 무한 스크롤 구현 시 수정
+    cursor: str | None = None,
+    with_count: bool = True,
     service: ApiService = Depends(api_service),
     user: SimpleUser = Depends(current_user),
-) -> dto.PaperPlaneResponse:
-    """조건에 맞는 종이비행기를 가져옵니다."""
-    count, data = service.fetch_received_paper_planes(
-        user_id=user.user_id, offset=offset, limit=limit
+) -> Response:
+    """조건에 맞는 종이비행기를 가져옵니다. 무한 스크롤은 next_cursor 를 cursor 로 전달합니다."""
+    etag = make_etag(request, get_table_generation("paper_plane"), user.user_id)
+    if is_not_modified(request, etag):
+        return not_modified(etag, PRIVATE_CACHE_CONTROL)
+
+    page = service.fetch_received_paper_planes(
+        user_id=user.user_id,
+        offset=offset,
+        limit=limit,
+        cursor=_decode_paper_plane_cursor(cursor),
     )
-    return dto.PaperPlaneResponse(
-        count=count, data=[each.model_dump() for each in data]
+    return _paper_plane_response(page, with_count, etag)
+
+
+@router.get(
+    "/paper-planes/conversations/{other_user_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=dto.PaperPlaneResponse,
+)
+async def fetch_conversation_paper_planes(
+    request: Request,
+    other_user_id: str,
+    offset: int = 0,
+    limit: int = Query(default=50, le=1000),
+    cursor: str | None = None,
+    with_count: bool = True,
+    service: ApiService = Depends(api_service),
+    user: SimpleUser = Depends(current_user),
+) -> Response:
+    """다른 유저와 주고받은 종이비행기를 가져옵니다. 무한 스크롤은 next_cursor 를 cursor 로 전달합니다."""
+    etag = make_etag(request, get_table_generation("paper_plane"), user.user_id)
+    if is_not_modified(request, etag):
+        return not_modified(etag, PRIVATE_CACHE_CONTROL)
+
+    page = service.fetch_conversation_paper_planes(
+        user_id=user.user_id,
+        other_user_id=other_user_id,
+        offset=offset,
+        limit=limit,
+        cursor=_decode_paper_plane_cursor(cursor),
     )
+    return _paper_plane_response(page, with_count, etag)
+
+
+def _paper_plane_response(
+    page: PaperPlanePage, with_count: bool, etag: str
+) -> Response:
+    """종이비행기 한 페이지를 응답으로 변환합니다."""
+    data = page.paper_planes
+    # 이미 검증한 데이터이므로 response_model 검증 없이 바로 직렬화합니다.
+    response = ORJSONResponse(
+        {
+            "count": page.total if with_count else None,
+            "data": [each.model_dump() for each in data],
+            "next_cursor": (
+                encode_cursor(data[-1].created_at, data[-1].id)
+                if page.has_next
+                else None
+            ),
+        }
+    )
+    set_cache_headers(response, etag, PRIVATE_CACHE_CONTROL)
+    return response
+
+
+def _decode_paper_plane_cursor(cursor: str | None) -> tuple[str, str] | None:
+    """종이비행기 커서를 (생성일시, 아이디)로 변환합니다."""
+    if not cursor:
+        return None
+    created_at, id = decode_cursor(cursor, size=2)
+    return str(created_at), str(id)
@@ -1,14 +1,23 @@
-import asyncio
 from enum import StrEnum
 from typing import Any
 
 from starlette import status
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from app.api import dto
 from app.api.auth import current_user
 from app.api.deps import point_service
+from app.api.etag import (
+    PRIVATE_CACHE_CONTROL,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+)
+from app.store import get_table_generation
 from app.models import SimpleUser
 from app.slack.services.point import PointService
-from app.slack_notification import send_point_noti_message
+from app.slack_notification import send_point_noti_messages
 from app.config import settings
 from app.slack.event_handler import app as slack_app
 
@@ -38,24 +47,54 @@ async def grant_points(
     if user.user_id not in settings.ADMIN_IDS:
         raise HTTPException(status_code=403, detail="지급 권한이 없습니다.")
 
+    # 포인트는 순서대로 지급하고, 알림은 슬랙 호출 제한에 맞춰 동시에 전송한다.
     if point_type == PointTypeEnum.CURATION:
-        for user_id in user_ids:
-            message = point_service.grant_if_curation_selected(user_id)
-            await send_point_noti_message(
-                client=slack_app.client,
-                channel=user_id,
-                text=text + "\n" + message,
-            )
-            await asyncio.sleep(1)
+        messages = [
+            {
+                "channel": user_id,
+                "text": text + "\n" + point_service.grant_if_curation_selected(user_id),
+            }
+            for user_id in user_ids
+        ]
+        await send_point_noti_messages(slack_app.client, messages)
         return {"message": "큐레이션 선정 포인트를 지급했습니다."}
 
     elif point_type == PointTypeEnum.VILLAGE_CONFERENCE:
-        for user_id in user_ids:
-            message = point_service.grant_if_village_conference_participated(user_id)
-            await send_point_noti_message(
-                client=slack_app.client,
-                channel=user_id,
-                text=text + "\n" + message,
-            )
-            await asyncio.sleep(1)
+        messages = [
+            {
+                "channel": user_id,
+                "text": text
+                + "\n"
+                + point_service.grant_if_village_conference_participated(user_id),
+            }
+            for user_id in user_ids
+        ]
+        await send_point_noti_messages(slack_app.client, messages)
         return {"message": "빌리지 반상회 참여 포인트를 지급했습니다."}
+
+
+@router.get(
+    "/points/leaderboard",
+    status_code=status.HTTP_200_OK,
+    response_model=dto.PointLeaderboardResponse,
+)
+async def fetch_point_leaderboard(
+    request: Request,
+    limit: int = Query(default=10, ge=1, le=100),
+    cohort: str | None = None,
+    user: SimpleUser = Depends(current_user),
+    point_service: PointService = Depends(point_service),
+) -> Response:
+    """총 포인트 상위 유저의 순위를 가져옵니다. cohort 가 주어지면 해당 기수 내 순위를 가져옵니다."""
+    etag = make_etag(
+        request,
+        get_table_generation("point_histories"),
+        get_table_generation("users"),
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag, PRIVATE_CACHE_CONTROL)
+
+    leaderboard, _ = point_service.fetch_leaderboard(limit=limit, cohort=cohort)
+    response = ORJSONResponse({"data": [each.model_dump() for each in leaderboard]})
+    set_cache_headers(response, etag, PRIVATE_CACHE_CONTROL)
+    return response
@@ -1,5 +1,5 @@
 import datetime
-from enum import Enum
+from enum import Enum, StrEnum
 
 
 URL_REGEX = r"((http|https):\/\/)?[a-zA-Z0-9.-]+(\.[a-zA-Z]{2,})"
@@ -41,6 +41,22 @@ class ContentSortEnum(str, Enum):
     # LIKE = "like" # TODO: 추후 추가하기
 
 
+class JobCategoryEnum(StrEnum):
+    DATA_SCIENCE = "데이터과학"
+    DATA_ANALYSIS = "데이터분석"
+    DATA_ENGINEERING = "데이터엔지니어"
+    BACKEND = "백엔드"
+    ANDROID = "안드"
+    INFRA = "인프라"
+    FULL_STACK = "풀스택"
+    FRONTEND = "프론트"
+    FLUTTER = "플러터"
+    AI = "ai"
+    IOS = "ios"
+    ML = "ml"
+    PMPO = "pmpo"
+
+
 remind_message = """👋 안녕하세요! 오늘은 글 제출 마감일이에요.
 지난 2주 동안 배우고 경험한 것들을 자정까지 나눠주세요.
 {user_name} 님의 이야기를 기다릴게요!🙂"""
@@ -17,7 +17,10 @@ def filter(record):
     return True
 
 
-logger.add("store/logs.csv", format="{time},{level},{message}", filter=filter)
+# 첫 로그를 남길 때 파일을 엽니다. (테스트처럼 로그 파일을 쓰지 않는 경우 파일을 만들지 않습니다.)
+logger.add(
+    "store/logs.csv", format="{time},{level},{message}", filter=filter, delay=True
+)
 
 
 def default(obj: Any) -> str | list[Any] | dict[str, Any]:
@@ -3,13 +3,34 @@ from __future__ import annotations
 from abc import abstractmethod
 
 from enum import Enum
-from zoneinfo import ZoneInfo
+from functools import cached_property, lru_cache
+from typing import Any, NamedTuple, Self
 from pydantic import BaseModel, Field, field_validator
 import datetime
 from app.constants import DUE_DATES, MAX_PASS_COUNT
 from app.exception import BotException
+from app.submission import SubmissionMatrix, get_round_calendar
 
-from app.utils import generate_unique_id, tz_now, tz_now_to_str
+from app.utils import generate_unique_id, str_to_dt, tz_now, tz_now_to_str
+
+
+@lru_cache
+def _get_field_names(model: type[BaseModel]) -> frozenset[str]:
+    """모델의 필드 이름을 반환합니다."""
+    return frozenset(model.model_fields)
+
+
+def _construct_from_row(model: type[BaseModel], row: dict[str, Any]) -> Any:
+    """
+    저장소의 행에서 모델 필드만 골라 검증 없이 객체를 생성합니다.
+    기본값은 model_construct 가 채우며, 검증기(field_validator)는 실행하지 않습니다.
+    """
+    field_names = _get_field_names(model)
+    if row.keys() <= field_names:
+        return model.model_construct(**row)
+    return model.model_construct(
+        **{name: value for name, value in row.items() if name in field_names}
+    )
 
 
 class User(BaseModel):
@@ -27,6 +48,14 @@ class User(BaseModel):
         """콘텐츠를 생성일시 오름차순으로 정렬하여 반환합니다."""
         return sorted(v, key=lambda content: content.dt_)
 
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> Self:
+        """
+        저장소의 행으로 검증 없이 유저를 생성합니다.
+        서버가 직접 저장한 데이터에만 사용해야 합니다.
+        """
+        return _construct_from_row(cls, row)
+
     @property
     def pass_count(self) -> int:
         """pass 횟수를 반환합니다."""
@@ -48,11 +77,12 @@ class User(BaseModel):
     def _is_prev_pass(self, recent_content: Content) -> bool:
         """전전회차 마감일 초과, 현재 날짜 이하 사이에 pass 했는지 여부를 반환합니다."""
         now_date = tz_now().date()
-        second_latest_due_date = DUE_DATES[-2]
-        for i, due_date in enumerate(DUE_DATES):
-            if now_date <= due_date:
-                second_latest_due_date = DUE_DATES[i - 2]
-                break
+        calendar = get_round_calendar(DUE_DATES)
+        round = calendar.get_round(now_date)
+        if calendar.is_in_season(round):
+            second_latest_due_date = DUE_DATES[round - 2]
+        else:
+            second_latest_due_date = DUE_DATES[-2]
         return second_latest_due_date < recent_content.date <= now_date
 
     @property
@@ -74,11 +104,11 @@ class User(BaseModel):
     def get_due_date(self) -> tuple[int, datetime.date]:
         """현재 회차와 마감일을 반환합니다."""
         now_date = tz_now().date()
-        for i, due_date in enumerate(DUE_DATES):
-            if now_date <= due_date:
-                round = i
-                return round, due_date
-        raise BotException("지금은 글또 글 제출 기간이 아니에요.")
+        calendar = get_round_calendar(DUE_DATES)
+        round = calendar.get_round(now_date)
+        if not calendar.is_in_season(round):
+            raise BotException("지금은 글또 글 제출 기간이 아니에요.")
+        return round, DUE_DATES[round]
 
     @property
     def is_submit(self) -> bool:
@@ -92,55 +122,22 @@ class User(BaseModel):
             return False
 
         now_date = tz_now().date()
-        for i, due_date in enumerate(DUE_DATES):
-            if now_date <= due_date:  # 현재 날짜가 보다 같거나 크면 현재 마감일이다.
-                # 현재 마감일의 직전 마감일을 구한다.
-                latest_due_date = DUE_DATES[i - 1]
-                break
+        calendar = get_round_calendar(DUE_DATES)
+        round = calendar.get_round(now_date)
+        if not 0 < round < len(calendar):
+            return False
 
         # 최근 제출한 콘텐츠의 날짜가 직전 마감일 초과, 현재 날짜 이하 라면 제출했다고 판단한다.
-        return latest_due_date < recent_content.date <= now_date
+        recent_date = recent_content.date
+        return calendar.get_round(recent_date) == round and recent_date <= now_date
 
     def get_submit_status(self) -> dict[int, str]:
         """현재 회차는 제외한 회차별 제출 여부를 반환합니다."""
-        submit_status = {}
-        for i, due_date in enumerate(DUE_DATES):
-            # 0회차는 시작일이므로 제외한다.
-            if i == 0:
-                continue
-
-            # 현재 회차는 제출 여부를 판단하지 않는다.
-            if due_date >= tz_now().date():
-                break
-
-            # 기본값은 미제출
-            submit_status[i] = "미제출"
-
-            # 콘텐츠의 제출 날짜가 직전 마감일 초과, 마감일 이하 라면 제출했다고 판단한다.
-            for content in self.fetch_contents():
-                latest_due_date = DUE_DATES[i - 1]
-                if latest_due_date < content.date <= due_date:
-                    if content.type == "submit":
-                        submit_status[i] = "제출"
-                    elif content.type == "pass":
-                        submit_status[i] = "패스"
-                    else:
-                        submit_status[i] = "미제출"
-
-        return submit_status
+        return build_submission_matrix([self]).get_submit_status(self.user_id)
 
     def get_continuous_submit_count(self) -> int:
         """내림차순으로 연속으로 제출한 횟수를 반환합니다."""
-        count = 0
-        submit_status = self.get_submit_status()
-        for _, v in sorted(submit_status.items(), reverse=True):
-            if v == "제출":
-                count += 1
-            elif v == "패스":  # 패스는 연속 제출 횟수에 포함하지 않는다.
-                continue
-            else:  # 미제출은 연속 제출 횟수를 끊는다.
-                break
-        return count
+        return build_submission_matrix([self]).get_continuous_submit_count(self.user_id)
 
     def check_channel(self, channel_id: str) -> None:
         """코어 채널이 일치하는지 체크합니다."""
@@ -189,6 +186,18 @@ class User(BaseModel):
         ]
 
 
+def build_submission_matrix(users: list[User] | list[UserRecord]) -> SubmissionMatrix:
+    """유저들의 회차별 제출 상태 행렬을 생성합니다."""
+    return SubmissionMatrix.from_columns(
+        [user.user_id for user in users],
+        [user.user_id for user in users for _ in user.contents],
+        [content.dt for user in users for content in user.contents],
+        [content.type for user in users for content in user.contents],
+        due_dates=DUE_DATES,
+        now_date=tz_now().date(),
+    )
+
+
 class SimpleUser(BaseModel):
     user_id: str
     name: str
@@ -199,7 +208,13 @@ class SimpleUser(BaseModel):
 
 
 class StoreModel(BaseModel):
-    ...
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> Self:
+        """
+        저장소의 행으로 검증 없이 객체를 생성합니다.
+        서버가 직접 저장한 데이터에만 사용해야 합니다.
+        """
+        return _construct_from_row(cls, row)
 
     @abstractmethod
     def to_list_for_csv(self) -> list[str]:
@@ -233,14 +248,12 @@ class Content(StoreModel):
             return NotImplemented
         return self.ts == other.ts
 
-    @property
+    @cached_property
     def dt_(self) -> datetime.datetime:
-        """생성일시를 datetime 객체로 반환합니다."""
-        return datetime.datetime.strptime(self.dt, "%Y-%m-%d %H:%M:%S").replace(
-            tzinfo=ZoneInfo("Asia/Seoul")
-        )
+        """생성일시를 datetime 객체로 반환합니다. 한 번만 변환하고 재사용합니다."""
+        return str_to_dt(self.dt)
 
-    @property
+    @cached_property
     def date(self) -> datetime.date:
         """생성일시를 date 객체로 반환합니다."""
         return self.dt_.date()
@@ -275,12 +288,17 @@ class Content(StoreModel):
             self.ts,
         ]
 
+    def to_record(self) -> ContentRecord:
+        """읽기 전용 레코드로 반환합니다."""
+        return ContentRecord._make(self.to_list_for_csv())
+
     def get_round(self) -> int:
         """컨텐츠의 회차를 반환합니다."""
-        for i, due_date in enumerate(DUE_DATES):
-            if self.date <= due_date:
-                return i
-        raise BotException("글또 활동 기간이 아니에요.")
+        calendar = get_round_calendar(DUE_DATES)
+        round = calendar.get_round(self.date)
+        if not calendar.is_in_season(round):
+            raise BotException("글또 활동 기간이 아니에요.")
+        return round
 
     @classmethod
     def fieldnames(self) -> list[str]:
@@ -299,6 +317,46 @@ class Content(StoreModel):
         ]
 
 
+class ContentRecord(NamedTuple):
+    """
+    읽기 전용 콘텐츠 레코드입니다.
+    검색, 리마인드, 순위 계산처럼 많은 콘텐츠를 읽기만 하는 내부 조회 경로에서 사용합니다.
+    """
+
+    user_id: str
+    username: str
+    title: str
+    content_url: str
+    dt: str
+    category: str
+    description: str
+    type: str
+    tags: str
+    curation_flag: str
+    ts: str
+
+
+class UserRecord(NamedTuple):
+    """
+    읽기 전용 유저 레코드입니다.
+    contents 는 생성일시 오름차순(저장된 순서)의 콘텐츠 레코드입니다.
+    """
+
+    user_id: str
+    name: str
+    channel_name: str
+    channel_id: str
+    intro: str
+    deposit: str
+    cohort: str
+    contents: list[ContentRecord]
+
+    @property
+    def recent_content(self) -> ContentRecord:
+        """최근 콘텐츠를 반환합니다."""
+        return self.contents[-1]
+
+
 class BookmarkStatusEnum(str, Enum):
     ACTIVE = "ACTIVE"
     DELETED = "DELETED"
@@ -313,6 +371,15 @@ class Bookmark(StoreModel):
     created_at: str = Field(default_factory=tz_now_to_str)
     updated_at: str = Field(default_factory=tz_now_to_str)
 
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> Self:
+        return super().from_row({**row, "status": BookmarkStatusEnum(row["status"])})
+
+    @cached_property
+    def created_at_(self) -> datetime.datetime:
+        """생성일시를 datetime 객체로 반환합니다. 한 번만 변환하고 재사용합니다."""
+        return str_to_dt(self.created_at)
+
     def to_list_for_csv(self) -> list[str]:
         return [
             self.user_id,
@@ -399,6 +466,14 @@ class PointHistory(BaseModel):
     category: PointCategory | str
     created_at: str = Field(default_factory=tz_now_to_str)
 
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> Self:
+        """
+        저장소의 행으로 검증 없이 포인트 내역을 생성합니다.
+        서버가 직접 저장한 데이터에만 사용해야 합니다.
+        """
+        return _construct_from_row(cls, {**row, "point": int(row["point"])})
+
     def to_list_for_csv(self) -> list[str]:
         return [
             self.id,
@@ -443,6 +518,11 @@ class PaperPlane(StoreModel):
     color_label: str
     created_at: str = Field(default_factory=tz_now_to_str)
 
+    @cached_property
+    def created_at_(self) -> datetime.datetime:
+        """생성일시를 datetime 객체로 반환합니다. 한 번만 변환하고 재사용합니다."""
+        return str_to_dt(self.created_at)
+
     def to_list_for_csv(self) -> list[str]:
         return [
             self.id,
@@ -477,6 +557,12 @@ class SubscriptionStatusEnum(str, Enum):
     CANCELED = "CANCELED"
 
 
+class SubscriptionJobStatusEnum(str, Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
 class Subscription(StoreModel):
     id: str = Field(default_factory=generate_unique_id)
     user_id: str
@@ -486,6 +572,17 @@ class Subscription(StoreModel):
     created_at: str = Field(default_factory=tz_now_to_str)
     updated_at: str = ""
 
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> Self:
+        return super().from_row(
+            {**row, "status": SubscriptionStatusEnum(row["status"])}
+        )
+
+    @cached_property
+    def created_at_(self) -> datetime.datetime:
+        """생성일시를 datetime 객체로 반환합니다. 한 번만 변환하고 재사용합니다."""
+        return str_to_dt(self.created_at)
+
     def to_list_for_sheet(self) -> list[str]:
         return [
             self.id,
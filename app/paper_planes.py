@@ -0,0 +1,167 @@
+import bisect
+import csv
+import datetime
+from typing import NamedTuple
+
+from app import models, store
+from app.utils import tz_now
+
+
+def get_week_start(date: datetime.date) -> datetime.date:
+    """date 가 속한 주의 시작일(토요일)을 반환합니다. 종이비행기는 토요일 0시에 충전됩니다."""
+    return date - datetime.timedelta(days=(date.weekday() + 2) % 7)
+
+
+def _sort_key(paper_plane: models.PaperPlane) -> tuple[str, str]:
+    # created_at 은 '%Y-%m-%d %H:%M:%S' 형식이므로 문자열 정렬이 시간순 정렬과 같다.
+    return paper_plane.created_at, paper_plane.id
+
+
+class PaperPlanePage(NamedTuple):
+    total: int  # 타임라인의 전체 종이비행기 수
+    paper_planes: list[models.PaperPlane]  # 생성일시 내림차순
+    has_next: bool  # 다음 페이지 존재 여부
+
+
+class PaperPlaneIndex:
+    """
+    종이비행기 색인입니다.
+    - (보낸 사람 아이디, 주 시작일) 별 보낸 종이비행기 수를 가지고 있습니다.
+    - 보낸 사람별, 받은 사람별, 두 사람 간 대화별 타임라인을 (생성일시, 아이디) 오름차순으로 가지고 있습니다.
+    - 저장소의 세대(generation)가 바뀌면 다시 생성하고, 종이비행기를 보내면 증분으로 추가합니다.
+    """
+
+    def __init__(self) -> None:
+        self.generation: tuple[int, int] | None = None
+        self._weekly_counts: dict[tuple[str, datetime.date], int] = {}
+        self._sent: dict[str, list[models.PaperPlane]] = {}
+        self._received: dict[str, list[models.PaperPlane]] = {}
+        self._conversations: dict[tuple[str, str], list[models.PaperPlane]] = {}
+
+    def build(self, rows: list[dict[str, str]], generation: tuple[int, int]) -> None:
+        """종이비행기 행으로 색인을 새로 생성합니다."""
+        self._weekly_counts = {}
+        self._sent = {}
+        self._received = {}
+        self._conversations = {}
+        paper_planes = [models.PaperPlane.from_row(row) for row in rows]
+        for paper_plane in sorted(paper_planes, key=_sort_key):
+            self._add(paper_plane)
+        self.generation = generation
+
+    def add(
+        self,
+        paper_plane: models.PaperPlane,
+        *,
+        from_generation: tuple[int, int] | None,
+        to_generation: tuple[int, int],
+    ) -> None:
+        """
+        새로 보낸 종이비행기를 색인에 추가합니다.
+        색인이 추가 전 저장소 세대와 다르다면 다음 조회 때 다시 생성하도록 그대로 둡니다.
+        """
+        if self.generation != from_generation:
+            return
+        self._add(paper_plane)
+        self.generation = to_generation
+
+    def _add(self, paper_plane: models.PaperPlane) -> None:
+        # created_at 은 '%Y-%m-%d %H:%M:%S' 형식이므로 날짜만 변환합니다.
+        week_start = get_week_start(
+            datetime.date.fromisoformat(paper_plane.created_at[:10])
+        )
+        key = (paper_plane.sender_id, week_start)
+        self._weekly_counts[key] = self._weekly_counts.get(key, 0) + 1
+
+        for timeline in (
+            self._sent.setdefault(paper_plane.sender_id, []),
+            self._received.setdefault(paper_plane.receiver_id, []),
+            self._conversations.setdefault(
+                _conversation_key(paper_plane.sender_id, paper_plane.receiver_id), []
+            ),
+        ):
+            # 대부분 가장 최근 종이비행기이므로 끝에 추가된다.
+            bisect.insort(timeline, paper_plane, key=_sort_key)
+
+    def count_current_week(self, sender_id: str) -> int:
+        """이번 주에 보낸 종이비행기 수를 반환합니다."""
+        week_start = get_week_start(tz_now().date())
+        return self._weekly_counts.get((sender_id, week_start), 0)
+
+    def fetch_sent(
+        self,
+        sender_id: str,
+        offset: int,
+        limit: int,
+        cursor: tuple[str, str] | None = None,
+    ) -> PaperPlanePage:
+        """유저가 보낸 종이비행기를 생성일시 내림차순으로 한 페이지 반환합니다."""
+        return _slice_page(self._sent.get(sender_id, []), offset, limit, cursor)
+
+    def fetch_received(
+        self,
+        receiver_id: str,
+        offset: int,
+        limit: int,
+        cursor: tuple[str, str] | None = None,
+    ) -> PaperPlanePage:
+        """유저가 받은 종이비행기를 생성일시 내림차순으로 한 페이지 반환합니다."""
+        return _slice_page(self._received.get(receiver_id, []), offset, limit, cursor)
+
+    def fetch_conversation(
+        self,
+        user_id: str,
+        other_user_id: str,
+        offset: int,
+        limit: int,
+        cursor: tuple[str, str] | None = None,
+    ) -> PaperPlanePage:
+        """두 유저가 주고받은 종이비행기를 생성일시 내림차순으로 한 페이지 반환합니다."""
+        timeline = self._conversations.get(
+            _conversation_key(user_id, other_user_id), []
+        )
+        return _slice_page(timeline, offset, limit, cursor)
+
+
+def _conversation_key(user_id: str, other_user_id: str) -> tuple[str, str]:
+    """보낸 사람과 받은 사람 순서에 상관없이 같은 대화 키를 반환합니다."""
+    return (
+        (user_id, other_user_id)
+        if user_id < other_user_id
+        else (other_user_id, user_id)
+    )
+
+
+def _slice_page(
+    timeline: list[models.PaperPlane],
+    offset: int,
+    limit: int,
+    cursor: tuple[str, str] | None,
+) -> PaperPlanePage:
+    """
+    오름차순 타임라인에서 최신순으로 한 페이지를 잘라 반환합니다.
+    cursor 는 이전 페이지의 마지막 (생성일시, 아이디)이며, 이보다 앞선 종이비행기부터 가져옵니다.
+    콘텐츠 API 와 같이 cursor 가 있다면 offset 은 무시합니다.
+    """
+    if cursor:
+        end = bisect.bisect_left(timeline, cursor, key=_sort_key)
+    else:
+        end = max(len(timeline) - offset, 0)
+    start = max(end - limit, 0)
+    return PaperPlanePage(
+        total=len(timeline),
+        paper_planes=timeline[start:end][::-1],
+        has_next=start > 0,
+    )
+
+
+paper_plane_index = PaperPlaneIndex()
+
+
+def get_paper_plane_index() -> PaperPlaneIndex:
+    """종이비행기 색인을 반환합니다. 저장소가 바뀌었다면 색인을 다시 생성합니다."""
+    generation = store.get_table_generation("paper_plane")
+    if paper_plane_index.generation != generation:
+        with open("store/paper_plane.csv") as f:
+            paper_plane_index.build(list(csv.DictReader(f)), generation)
+    return paper_plane_index
@@ -0,0 +1,128 @@
+import asyncio
+import csv
+import os
+from functools import partial
+from typing import Iterable
+
+from slack_sdk.web.async_client import AsyncWebClient
+
+from app import store
+from app.logging import log_event
+from app.slack.dispatcher import Priority, slack_dispatcher
+
+PERMALINK_FIELDS = ("channel_id", "ts", "permalink")
+
+
+class PermalinkCache:
+    """
+    (채널 아이디, 메시지 ts) 별 메시지 링크 캐시입니다.
+    - 메시지 링크는 메시지를 수정해도 바뀌지 않으므로 한 번 가져온 링크는 계속 사용합니다.
+    - 저장소의 세대(generation)가 바뀌면 다시 생성하고, 링크를 추가하면 증분으로 갱신합니다.
+    """
+
+    def __init__(self) -> None:
+        self.generation: tuple[int, int] | None = None
+        self._permalinks: dict[tuple[str, str], str] = {}
+
+    def build(
+        self, rows: Iterable[dict[str, str]], generation: tuple[int, int]
+    ) -> None:
+        """링크 행으로 캐시를 새로 생성합니다."""
+        self._permalinks = {
+            (row["channel_id"], row["ts"]): row["permalink"] for row in rows
+        }
+        self.generation = generation
+
+    def add(
+        self,
+        channel_id: str,
+        ts: str,
+        permalink: str,
+        *,
+        from_generation: tuple[int, int] | None,
+        to_generation: tuple[int, int],
+    ) -> None:
+        """
+        새로 저장한 링크를 캐시에 반영합니다.
+        캐시가 추가 전 저장소 세대와 다르다면 다음 조회 때 다시 생성하도록 그대로 둡니다.
+        """
+        if self.generation != from_generation:
+            return
+        self._permalinks[(channel_id, ts)] = permalink
+        self.generation = to_generation
+
+    def get(self, channel_id: str, ts: str) -> str | None:
+        """메시지 링크를 반환합니다. 캐시에 없다면 None 을 반환합니다."""
+        return self._permalinks.get((channel_id, ts))
+
+
+permalink_cache = PermalinkCache()
+
+
+def get_permalink_cache() -> PermalinkCache:
+    """메시지 링크 캐시를 반환합니다. 저장소가 바뀌었다면 캐시를 다시 생성합니다."""
+    if not os.path.exists("store/_permalinks.csv"):
+        with open("store/_permalinks.csv", "w", newline="", encoding="utf-8") as f:
+            csv.writer(f, quoting=csv.QUOTE_ALL).writerow(PERMALINK_FIELDS)
+
+    generation = store.get_table_generation("_permalinks")
+    if permalink_cache.generation != generation:
+        with open("store/_permalinks.csv") as f:
+            permalink_cache.build(csv.DictReader(f), generation)
+    return permalink_cache
+
+
+def save_permalink(channel_id: str, ts: str, permalink: str) -> None:
+    """메시지 링크를 저장소와 캐시에 저장합니다."""
+    generation = get_permalink_cache().generation
+    with open("store/_permalinks.csv", "a", newline="", encoding="utf-8") as f:
+        csv.writer(f, quoting=csv.QUOTE_ALL).writerow([channel_id, ts, permalink])
+    permalink_cache.add(
+        channel_id,
+        ts,
+        permalink,
+        from_generation=generation,
+        to_generation=store.get_table_generation("_permalinks"),
+    )
+
+
+async def get_permalink(
+    client: AsyncWebClient,
+    channel_id: str,
+    ts: str,
+    priority: Priority = Priority.INTERACTIVE,
+) -> str:
+    """메시지 링크를 반환합니다. 캐시에 없을 때만 chat.getPermalink 를 호출하고 저장합니다."""
+    if permalink := get_permalink_cache().get(channel_id, ts):
+        return permalink
+
+    res = await slack_dispatcher.call(
+        client, "chat.getPermalink", priority, channel=channel_id, message_ts=ts
+    )
+    save_permalink(channel_id, ts, res["permalink"])
+    return res["permalink"]
+
+
+# 백그라운드에서 링크를 가져오는 작업입니다. 작업이 끝날 때까지 참조를 유지합니다.
+_background_tasks: set[asyncio.Task[str]] = set()
+
+
+def prefetch_permalink(client: AsyncWebClient, channel_id: str, ts: str) -> None:
+    """
+    메시지 링크를 백그라운드에서 가져와 저장합니다.
+    응답을 기다리지 않으며, 대량 DM 우선순위로 호출하여 유저 동작에 대한 응답을 늦추지 않습니다.
+    """
+    task = asyncio.create_task(get_permalink(client, channel_id, ts, Priority.BULK))
+    _background_tasks.add(task)
+    task.add_done_callback(partial(_log_prefetch_error, channel_id, ts))
+
+
+def _log_prefetch_error(channel_id: str, ts: str, task: asyncio.Task[str]) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and (error := task.exception()) is not None:
+        log_event(
+            actor="permalinks",
+            event="save_permalink",
+            type="error",
+            description=f"{channel_id} 채널의 {ts} 메시지 링크를 저장하지 못했습니다. {error}",
+        )
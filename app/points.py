@@ -0,0 +1,112 @@
+import bisect
+import csv
+from typing import Iterable, Iterator, NamedTuple
+
+from app import models, store
+
+
+class LeaderboardEntry(NamedTuple):
+    rank: int  # 공동 순위는 같은 순위를 가지며, 다음 순위는 건너뛴다. (1, 2, 2, 4)
+    user_id: str
+    total_point: int
+
+
+class PointLedger:
+    """
+    포인트 원장입니다.
+    - 유저별 총 포인트를 가지고 있습니다.
+    - 리더보드를 위해 (-총 포인트, 유저 아이디) 오름차순으로 정렬된 순위표를 가지고 있습니다.
+    - 저장소의 세대(generation)가 바뀌면 다시 생성하고, 포인트를 추가하면 증분으로 갱신합니다.
+    """
+
+    def __init__(self) -> None:
+        self.generation: tuple[int, int] | None = None
+        self._totals: dict[str, int] = {}
+        self._ranking: list[tuple[int, str]] = []
+
+    def build(
+        self, rows: Iterable[dict[str, str]], generation: tuple[int, int]
+    ) -> None:
+        """포인트 내역 행으로 원장을 새로 생성합니다."""
+        self._totals = {}
+        for row in rows:
+            self._accumulate(row["user_id"], int(row["point"]))
+        self._ranking = sorted(
+            (-total, user_id) for user_id, total in self._totals.items()
+        )
+        self.generation = generation
+
+    def add(
+        self,
+        point_history: models.PointHistory,
+        *,
+        from_generation: tuple[int, int] | None,
+        to_generation: tuple[int, int],
+    ) -> None:
+        """
+        새로 추가한 포인트 내역을 원장에 반영합니다.
+        원장이 추가 전 저장소 세대와 다르다면 다음 조회 때 다시 생성하도록 그대로 둡니다.
+        """
+        if self.generation != from_generation:
+            return
+
+        user_id = point_history.user_id
+        if user_id in self._totals:
+            # 순위표에서 이전 합계를 빼고 새 합계를 넣는다.
+            old_key = (-self._totals[user_id], user_id)
+            del self._ranking[bisect.bisect_left(self._ranking, old_key)]
+        self._accumulate(user_id, point_history.point)
+        bisect.insort(self._ranking, (-self._totals[user_id], user_id))
+        self.generation = to_generation
+
+    def _accumulate(self, user_id: str, point: int) -> None:
+        self._totals[user_id] = self._totals.get(user_id, 0) + point
+
+    def get_total_point(self, user_id: str) -> int:
+        """유저의 총 포인트를 반환합니다."""
+        return self._totals.get(user_id, 0)
+
+    def fetch_leaderboard(
+        self, limit: int, user_ids: set[str] | None = None
+    ) -> list[LeaderboardEntry]:
+        """
+        총 포인트 상위 limit 명의 순위를 반환합니다.
+        user_ids 가 주어지면 해당 유저들(예: 같은 기수) 사이의 순위를 반환합니다.
+        """
+        leaderboard: list[LeaderboardEntry] = []
+        for entry in self._iter_ranking(user_ids):
+            if len(leaderboard) >= limit:
+                break
+            leaderboard.append(entry)
+        return leaderboard
+
+    def get_rank(self, user_id: str, user_ids: set[str] | None = None) -> int | None:
+        """유저의 순위를 반환합니다. 포인트 내역이 없다면 None 을 반환합니다."""
+        for entry in self._iter_ranking(user_ids):
+            if entry.user_id == user_id:
+                return entry.rank
+        return None
+
+    def _iter_ranking(self, user_ids: set[str] | None) -> Iterator[LeaderboardEntry]:
+        rank = 0
+        previous_total: int | None = None
+        for count, (negative_total, user_id) in enumerate(
+            (key for key in self._ranking if user_ids is None or key[1] in user_ids),
+            start=1,
+        ):
+            if -negative_total != previous_total:
+                rank = count
+                previous_total = -negative_total
+            yield LeaderboardEntry(rank, user_id, -negative_total)
+
+
+point_ledger = PointLedger()
+
+
+def get_point_ledger() -> PointLedger:
+    """포인트 원장을 반환합니다. 저장소가 바뀌었다면 원장을 다시 생성합니다."""
+    generation = store.get_table_generation("point_histories")
+    if point_ledger.generation != generation:
+        with open("store/point_histories.csv") as f:
+            point_ledger.build(csv.DictReader(f), generation)
+    return point_ledger
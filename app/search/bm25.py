@@ -0,0 +1,117 @@
+import math
+from typing import Hashable, Iterable
+
+import numpy as np
+
+from app.search.index import TokenIndex
+from app.search.tokenizer import tokenize, tokenize_query
+
+# 필드별 가중치입니다. 제목에 나온 단어를 태그나 작성자 이름에 나온 단어보다 중요하게 봅니다.
+FIELD_WEIGHTS = {"title": 2.0, "tags": 1.5, "name": 1.0}
+
+
+class BM25Index:
+    """
+    필드 가중치를 적용한 BM25 색인입니다.
+    - 토큰별 문서 아이디와 단어 빈도, 문서 길이를 NumPy 배열로 미리 계산해 둡니다.
+    - 검색어의 모든 토큰이 포함된 문서만 찾고, 검색어별 BM25 점수의 합을 관련도로 사용합니다.
+    - 영문은 단어 중간의 검색어도 찾도록 접미어로 색인합니다. 예) "script" -> "JavaScript"
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self) -> None:
+        self.generation: Hashable = None
+        self._keys: list[Hashable] = []
+        self._token_index = TokenIndex()
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._idfs: dict[str, float] = {}
+        self._length_norms = np.empty(0, dtype=np.float32)
+
+    def build(
+        self,
+        documents: Iterable[tuple[Hashable, dict[str, str]]],
+        generation: Hashable,
+    ) -> None:
+        """(키, 필드별 문자열) 목록으로 색인을 새로 생성합니다."""
+        keys: list[Hashable] = []
+        token_index = TokenIndex()
+        postings: dict[str, tuple[list[int], list[float]]] = {}
+        lengths: list[float] = []
+        for doc_id, (key, fields) in enumerate(documents):
+            term_freqs: dict[str, float] = {}
+            length = 0.0
+            for field, weight in FIELD_WEIGHTS.items():
+                text = fields.get(field) or ""
+                for token in tokenize(text, substring=True):
+                    term_freqs[token] = term_freqs.get(token, 0.0) + weight
+                # 접미어 토큰 수만큼 긴 단어의 문서가 길어지지 않도록 문서 길이는 단어 토큰으로 계산한다.
+                length += weight * len(tokenize(text))
+
+            token_index.add(doc_id, term_freqs)
+            for token, term_freq in term_freqs.items():
+                doc_ids, freqs = postings.setdefault(token, ([], []))
+                doc_ids.append(doc_id)
+                freqs.append(term_freq)
+            lengths.append(length)
+            keys.append(key)
+
+        doc_count = len(keys)
+        doc_lengths = np.array(lengths, dtype=np.float32)
+        avg_length = float(doc_lengths.mean()) if doc_count else 0.0
+        # 점수 계산식의 분모 중 문서 길이에 따른 값: k1 * (1 - b + b * dl / avgdl)
+        self._length_norms = self.k1 * (
+            1 - self.b + self.b * doc_lengths / (avg_length or 1.0)
+        )
+        self._postings = {
+            token: (np.array(doc_ids, dtype=np.int32), np.array(freqs, np.float32))
+            for token, (doc_ids, freqs) in postings.items()
+        }
+        self._idfs = {
+            token: math.log(1 + (doc_count - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            for token, (doc_ids, _) in postings.items()
+        }
+        self._keys = keys
+        self._token_index = token_index
+        self.generation = generation
+
+    def _score(self, keyword: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """검색어와 일치하는 문서 아이디와 해당 문서들의 BM25 점수를 반환합니다."""
+        tokens = tokenize_query(keyword, substring=True)
+        if not tokens:
+            return None
+
+        matched = self._token_index.search(tokens)
+        if not matched:
+            return None
+
+        scores = np.zeros(len(self._keys), dtype=np.float32)
+        for token in tokens:
+            # 접두어 토큰은 일치하는 모든 색인 토큰의 점수를 더합니다.
+            for indexed_token in self._token_index.expand(token):
+                doc_ids, freqs = self._postings[indexed_token]
+                scores[doc_ids] += (
+                    self._idfs[indexed_token]
+                    * freqs
+                    * (self.k1 + 1)
+                    / (freqs + self._length_norms[doc_ids])
+                )
+
+        doc_ids = np.fromiter(matched, dtype=np.int32, count=len(matched))
+        return doc_ids, scores[doc_ids]
+
+    def search(self, keywords: Iterable[str]) -> list[tuple[Hashable, float]]:
+        """하나 이상의 검색어와 일치하는 문서의 (키, 관련도) 목록을 반환합니다."""
+        scores = np.zeros(len(self._keys), dtype=np.float32)
+        matched = np.zeros(len(self._keys), dtype=bool)
+        for keyword in keywords:
+            if result := self._score(keyword):
+                doc_ids, keyword_scores = result
+                scores[doc_ids] += keyword_scores
+                matched[doc_ids] = True
+
+        return [
+            (self._keys[doc_id], round(float(scores[doc_id]), 4))
+            for doc_id in np.flatnonzero(matched)
+        ]
@@ -0,0 +1,133 @@
+from typing import NamedTuple
+
+import polars as pl
+
+from app.constants import JobCategoryEnum
+from app.search.bm25 import BM25Index
+from app.store import get_table_generation
+
+# 응답에 포함하지 않고 필터링에만 사용하는 컬럼
+HIDDEN_COLUMNS = ["row_nr", "channel_name", "search_text"]
+
+
+def job_category_expr(channel_name: pl.Expr) -> pl.Expr:
+    """채널 이름에 처음으로 포함된 직군을 반환하는 표현식입니다. 없다면 null 입니다."""
+    return pl.coalesce(
+        [
+            pl.when(channel_name.str.contains(category.value, literal=True)).then(
+                pl.lit(category.value)
+            )
+            for category in JobCategoryEnum
+        ]
+    )
+
+
+class ContentsSnapshot(NamedTuple):
+    df: pl.DataFrame
+    generation: tuple[tuple[int, int], tuple[int, int]] | None
+
+
+class ContentsFrame:
+    """
+    글 게시판 API 에서 사용하는 콘텐츠와 유저를 조인한 데이터프레임입니다.
+    - 콘텐츠 url 로 중복을 제거하고 생성일시 내림차순으로 정렬해 둡니다.
+    - 직군과 소문자 검색용 문자열(제목, 태그, 작성자 이름)을 미리 계산해 둡니다.
+    - row_nr 은 정렬된 데이터프레임에서의 행 번호로, 검색 결과 캐시에서 사용합니다.
+    - 저장소의 세대(generation)가 바뀔 때만 다시 생성합니다.
+    """
+
+    def __init__(self) -> None:
+        self.generation: tuple[tuple[int, int], tuple[int, int]] | None = None
+        self._df = pl.DataFrame()
+        self._post_index = BM25Index()
+
+    def _refresh(self) -> None:
+        generation = (
+            get_table_generation("users"),
+            get_table_generation("contents"),
+        )
+        if self.generation == generation:
+            return
+
+        users_df = pl.read_csv(
+            "store/users.csv",
+            columns=["user_id", "name", "cohort", "channel_name"],
+        )
+        contents_df = pl.read_csv(
+            "store/contents.csv",
+            columns=[
+                "user_id",
+                "title",
+                "content_url",
+                "dt",
+                "category",
+                "tags",
+                "ts",
+            ],
+        )
+        channel_name = pl.col("channel_name").str.to_lowercase()
+        search_text = pl.concat_str(
+            [pl.col("title"), pl.col("tags").fill_null(""), pl.col("name")],
+            separator=",",
+        ).str.to_lowercase()
+        self._df = (
+            contents_df.unique(
+                subset=["content_url"], keep="first", maintain_order=True
+            )
+            .join(users_df, on="user_id", how="inner")
+            .with_columns(
+                job_category_expr(channel_name).alias("job_category"),
+                channel_name.alias("channel_name"),
+            )
+            .with_columns(search_text.alias("search_text"))
+            .sort("dt", descending=True)
+            .with_row_count("row_nr")
+            .select(
+                [
+                    "user_id",
+                    "title",
+                    "content_url",
+                    "dt",
+                    "category",
+                    "tags",
+                    "ts",
+                    "name",
+                    "cohort",
+                    "job_category",
+                    *HIDDEN_COLUMNS,
+                ]
+            )
+            .rechunk()
+        )
+        self.generation = generation
+
+    def get_snapshot(self) -> ContentsSnapshot:
+        """생성일시 내림차순으로 정렬된 데이터프레임과 그 세대를 함께 반환합니다."""
+        self._refresh()
+        return ContentsSnapshot(self._df, self.generation)
+
+    def get_post_index(self, snapshot: ContentsSnapshot) -> BM25Index:
+        """
+        스냅샷과 같은 세대의 BM25 색인을 반환합니다.
+        색인 생성 비용이 크므로 키워드 검색을 할 때 생성합니다.
+        """
+        if self._post_index.generation == snapshot.generation:
+            return self._post_index
+
+        post_index = BM25Index()
+        post_index.build(
+            (
+                (row["content_url"], row)
+                for row in snapshot.df.select(
+                    "content_url", "title", "tags", "name"
+                ).iter_rows(named=True)
+            ),
+            snapshot.generation,
+        )
+        # 그 사이 저장소가 바뀌었다면 지난 세대의 색인은 이번 검색에만 사용한다.
+        if snapshot.generation == self.generation:
+            self._post_index = post_index
+        return post_index
+
+
+contents_frame = ContentsFrame()
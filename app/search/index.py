@@ -0,0 +1,179 @@
+import bisect
+from typing import Iterable
+
+from app.models import ContentRecord
+from app.search.tokenizer import (
+    QueryToken,
+    decompose_hangul,
+    has_symbol,
+    tokenize,
+    tokenize_query,
+)
+
+
+class TokenIndex:
+    """
+    토큰 역색인입니다.
+    접두어 검색을 위해 자모로 분해한 토큰 목록을 정렬하여 가지고 있습니다.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, list[int]] = {}
+        self._prefix_keys: list[tuple[str, str]] | None = None
+
+    def add(self, doc_id: int, tokens: Iterable[str]) -> None:
+        """문서의 토큰을 색인에 추가합니다. 문서 아이디는 오름차순으로 추가해야 합니다."""
+        for token in set(tokens):
+            if token not in self._postings:
+                self._postings[token] = []
+                self._prefix_keys = None
+            self._postings[token].append(doc_id)
+
+    def _get_prefix_keys(self) -> list[tuple[str, str]]:
+        if self._prefix_keys is None:
+            self._prefix_keys = sorted(
+                (decompose_hangul(token), token) for token in self._postings
+            )
+        return self._prefix_keys
+
+    def expand(self, token: QueryToken) -> list[str]:
+        """검색어 토큰과 일치하는 색인 토큰 목록을 반환합니다."""
+        if not token.is_prefix:
+            return [token.text] if token.text in self._postings else []
+
+        # 자모 단위 접두어가 같은 토큰을 모두 찾습니다. 예) "비도" -> "비동", "비도"
+        prefix = decompose_hangul(token.text)
+        keys = self._get_prefix_keys()
+        tokens = []
+        for key, indexed_token in keys[bisect.bisect_left(keys, (prefix, "")) :]:
+            if not key.startswith(prefix):
+                break
+            tokens.append(indexed_token)
+        return tokens
+
+    def lookup(self, token: QueryToken) -> set[int]:
+        """토큰이 포함된 문서 아이디를 반환합니다."""
+        doc_ids: set[int] = set()
+        for indexed_token in self.expand(token):
+            doc_ids.update(self._postings[indexed_token])
+        return doc_ids
+
+    def search(self, tokens: list[QueryToken]) -> set[int]:
+        """모든 토큰이 포함된 문서 아이디를 반환합니다."""
+        doc_ids: set[int] | None = None
+        # 접두어 토큰은 후보가 많으므로 마지막에 교집합을 구합니다.
+        for token in sorted(tokens, key=lambda token: token.is_prefix):
+            matched = self.lookup(token)
+            doc_ids = matched if doc_ids is None else doc_ids & matched
+            if not doc_ids:
+                return set()
+        return doc_ids or set()
+
+
+class ContentIndex:
+    """
+    제출 콘텐츠(제목, 소개, 태그)의 토큰 역색인입니다.
+    - 검색어의 모든 토큰이 포함된 콘텐츠를 생성일시 내림차순으로 반환합니다.
+    - 저장소의 세대(generation)가 바뀌면 다시 생성하고, 글 제출 시에는 증분으로 추가합니다.
+    """
+
+    def __init__(self) -> None:
+        self.generation: tuple[int, int] | None = None
+        self._contents: list[ContentRecord] = []
+        self._token_index = TokenIndex()
+        self._ranks: list[int] | None = None  # 생성일시 내림차순 순위
+
+    def build(
+        self, contents: Iterable[ContentRecord], generation: tuple[int, int]
+    ) -> None:
+        """콘텐츠로 색인을 새로 생성합니다."""
+        self._contents = []
+        self._token_index = TokenIndex()
+        self._ranks = None
+        for content in contents:
+            self._add(content)
+        self.generation = generation
+
+    def add(
+        self,
+        content: ContentRecord,
+        *,
+        from_generation: tuple[int, int],
+        to_generation: tuple[int, int],
+    ) -> None:
+        """
+        새로 제출한 콘텐츠를 색인에 추가합니다.
+        색인이 추가 전 저장소 세대와 다르다면 다음 조회 때 다시 생성하도록 그대로 둡니다.
+        """
+        if self.generation != from_generation:
+            return
+        self._add(content)
+        self.generation = to_generation
+
+    def _add(self, content: ContentRecord) -> None:
+        if content.type != "submit":
+            return
+
+        content_id = len(self._contents)
+        self._contents.append(content)
+        # 필드 경계의 단어가 붙지 않도록 필드별로 토큰을 나눈다.
+        # 영문은 단어 중간의 검색어도 찾도록 접미어로 색인한다. 예) "script" -> "JavaScript"
+        self._token_index.add(
+            content_id,
+            [
+                token
+                for field in (content.title, content.description, content.tags)
+                for token in tokenize(field, substring=True)
+            ],
+        )
+        self._ranks = None
+
+    def _get_ranks(self) -> list[int]:
+        """콘텐츠 아이디별 생성일시 내림차순 순위를 반환합니다."""
+        if self._ranks is None:
+            # dt 는 '%Y-%m-%d %H:%M:%S' 형식이므로 문자열 정렬이 시간순 정렬과 같다.
+            # 같은 생성일시라면 저장된 순서를 유지한다.
+            order = sorted(
+                range(len(self._contents)),
+                key=lambda content_id: self._contents[content_id].dt,
+                reverse=True,
+            )
+            ranks = [0] * len(order)
+            for rank, content_id in enumerate(order):
+                ranks[content_id] = rank
+            self._ranks = ranks
+        return self._ranks
+
+    def _sort(self, content_ids: Iterable[int]) -> list[ContentRecord]:
+        """콘텐츠를 생성일시 내림차순으로 정렬하여 반환합니다."""
+        ranks = self._get_ranks()
+        return [
+            self._contents[content_id]
+            for content_id in sorted(content_ids, key=ranks.__getitem__)
+        ]
+
+    def fetch_all(self) -> list[ContentRecord]:
+        """모든 콘텐츠를 생성일시 내림차순으로 반환합니다."""
+        return self._sort(range(len(self._contents)))
+
+    def search(self, keyword: str) -> list[ContentRecord]:
+        """검색어의 모든 토큰이 포함된 콘텐츠를 생성일시 내림차순으로 반환합니다."""
+        if not keyword.strip():
+            return self.fetch_all()
+
+        # 토큰으로 나눌 수 없는 문자가 있는 검색어(예: "c++")는 문자열 포함 여부로 찾습니다.
+        if not has_symbol(keyword) and (
+            tokens := tokenize_query(keyword, substring=True)
+        ):
+            return self._sort(self._token_index.search(tokens))
+
+        keyword = keyword.lower()
+        return self._sort(
+            content_id
+            for content_id, content in enumerate(self._contents)
+            if keyword in (content.title + content.description + content.tags).lower()
+        )
+
+
+# 슬랙 글 검색에서 사용하는 콘텐츠 색인
+content_index = ContentIndex()
@@ -0,0 +1,40 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SearchResultCache(Generic[T]):
+    """
+    검색 조건별 검색 결과를 저장하는 LRU 캐시입니다.
+    결과를 저장할 때의 저장소 세대(generation)와 조회할 때의 세대가 다르면 사용하지 않습니다.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self.max_size = max_size
+        self._cache: OrderedDict[Hashable, tuple[Hashable, T]] = OrderedDict()
+
+    def get(self, key: Hashable, generation: Hashable) -> T | None:
+        """캐시된 검색 결과를 반환합니다. 없거나 세대가 다르면 None 을 반환합니다."""
+        value = self._cache.get(key)
+        if value is None:
+            return None
+
+        cached_generation, result = value
+        if cached_generation != generation:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return result
+
+    def set(self, key: Hashable, generation: Hashable, result: T) -> None:
+        """검색 결과를 캐시합니다. 최대 크기를 넘으면 가장 오래 사용하지 않은 결과를 지웁니다."""
+        self._cache[key] = (generation, result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 검색 결과를 지웁니다."""
+        self._cache.clear()
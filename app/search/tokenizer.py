@@ -0,0 +1,88 @@
+import regex as re
+from typing import NamedTuple
+
+# 한글 음절(가-힣)과 호환용 자모(ㄱ-ㅣ), 영문/숫자 단어
+_HANGUL_PATTERN = re.compile(r"[가-힣ㄱ-ㅣ]+")
+_ASCII_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+# 토큰으로 나눌 수 없는 문자(공백 제외). 예) "c++", "node.js" 의 "+", "."
+_SYMBOL_PATTERN = re.compile(r"[^\sa-z0-9가-힣ㄱ-ㅣ]")
+
+# 한글 음절을 호환용 자모로 분해하기 위한 초성, 중성, 종성 목록
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+
+class QueryToken(NamedTuple):
+    text: str
+    is_prefix: bool  # 입력 중인 마지막 토큰은 접두어로 검색합니다.
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 자모로 분해합니다. 예) "비동" -> "ㅂㅣㄷㅗㅇ" """
+    result = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            result.append(_CHOSEONG[code // 588])
+            result.append(_JUNGSEONG[code % 588 // 28])
+            if code % 28:
+                result.append(_JONGSEONG[code % 28])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def _tokenize_hangul(hangul: str) -> list[str]:
+    """한글 음절 unigram 과 bigram 을 반환합니다."""
+    return list(hangul) + [hangul[i : i + 2] for i in range(len(hangul) - 1)]
+
+
+def tokenize(text: str, substring: bool = False) -> list[str]:
+    """
+    색인할 문자열을 토큰으로 분리합니다.
+    - 영문/숫자는 단어 단위 토큰입니다.
+      substring 이 True 라면 단어 중간부터도 찾을 수 있도록 단어의 모든 접미어를 토큰으로 사용합니다.
+      예) "fastapi" -> "fastapi", "astapi", ..., "api", "pi", "i"
+    - 한글은 띄어쓰기와 관계없이 검색되도록 음절을 이어 붙인 뒤 음절 unigram, bigram 토큰으로 분리합니다.
+    """
+    text = text.lower()
+    tokens = _ASCII_WORD_PATTERN.findall(text)
+    if substring:
+        tokens = [word[i:] for word in tokens for i in range(len(word))]
+    tokens.extend(_tokenize_hangul("".join(_HANGUL_PATTERN.findall(text))))
+    return tokens
+
+
+def has_symbol(keyword: str) -> bool:
+    """검색어에 한글, 영문, 숫자, 공백이 아닌 문자가 있는지 반환합니다."""
+    return bool(_SYMBOL_PATTERN.search(keyword.lower()))
+
+
+def tokenize_query(keyword: str, substring: bool = False) -> list[QueryToken]:
+    """
+    검색어를 토큰으로 분리합니다.
+    - 한글은 음절 bigram(한 음절이면 unigram) 토큰입니다.
+    - 입력 중일 수 있는 마지막 영문 단어와 마지막 한글 토큰은 접두어(자모 단위)로 검색합니다.
+    - substring 이 True 라면 접미어로 색인한 단어를 찾도록 모든 영문 단어를 접두어로 검색합니다.
+      예) "script" -> "javascript", "fast api" -> "fastapi"
+    """
+    keyword = keyword.lower()
+    tokens: list[QueryToken] = []
+
+    words = _ASCII_WORD_PATTERN.findall(keyword)
+    tokens.extend(
+        QueryToken(word, is_prefix=substring or i == len(words) - 1)
+        for i, word in enumerate(words)
+    )
+
+    hangul = "".join(_HANGUL_PATTERN.findall(keyword))
+    if len(hangul) == 1:
+        tokens.append(QueryToken(hangul, is_prefix=True))
+    else:
+        bigrams = [hangul[i : i + 2] for i in range(len(hangul) - 1)]
+        tokens.extend(
+            QueryToken(bigram, is_prefix=i == len(bigrams) - 1)
+            for i, bigram in enumerate(bigrams)
+        )
+    return tokens
@@ -0,0 +1,322 @@
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+from pydantic import BaseModel
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.web.async_slack_response import AsyncSlackResponse
+
+from app.logging import log_event
+
+# 슬랙 API 등급(tier)별 분당 호출 제한입니다.
+# 참고문서: https://api.slack.com/apis/rate-limits
+TIER_LIMITS_PER_MINUTE = {1: 1, 2: 20, 3: 50, 4: 100}
+
+METHOD_TIERS = {
+    "chat.getPermalink": 4,
+    "chat.postEphemeral": 4,
+    "chat.update": 3,
+    "chat.delete": 3,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "conversations.open": 3,
+    "reactions.add": 3,
+    "users.info": 4,
+    "views.open": 4,
+    "views.publish": 4,
+    "views.update": 4,
+}
+DEFAULT_TIER = 3
+
+# 다시 호출하면 같은 메시지가 한 번 더 전송되는 메서드입니다.
+# 요청이 슬랙에 도착했는지 알 수 없는 오류(타임아웃, 5xx 등)는 다시 시도하지 않습니다.
+NON_IDEMPOTENT_METHODS = {"chat.postMessage", "chat.postEphemeral"}
+
+# chat.postMessage 는 등급 대신 채널당 초당 1개, 워크스페이스 전체 분당 수백 개로 제한합니다.
+# 참고문서: https://api.slack.com/methods/chat.postMessage#rate_limiting
+POST_MESSAGE_PER_CHANNEL = 1.0  # 초당
+POST_MESSAGE_PER_WORKSPACE = 300 / 60  # 초당
+
+# 일시적인 오류(5xx, 네트워크 오류)의 재시도 대기 시간은 1, 2, 4... 초로 늘리되 30초를 넘지 않습니다.
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+# 버킷이 이 수만큼 쌓이면 토큰이 가득 찬 채 쉬고 있는 버킷을 정리합니다. (채널별 버킷은 채널마다 생깁니다.)
+BUCKET_SWEEP_THRESHOLD = 1000
+
+
+class Priority(IntEnum):
+    """호출 우선순위입니다. 값이 작을수록 같은 버킷의 토큰을 먼저 받습니다."""
+
+    INTERACTIVE = 0  # 유저 동작에 대한 응답
+    JOB_STATUS = 1  # 대량 DM 작업의 진행 상황, 결과, 실패 알림
+    BULK = 2  # 리마인드, 구독 알림 같은 대량 DM
+    ADMIN = 3  # 관리자 채널 알림 (대량 DM 이 모두 전송된 뒤 전송될 수 있습니다.)
+
+
+class TokenBucket:
+    """
+    초당 rate 개씩 토큰을 채우고 최대 capacity 개까지 모아두는 토큰 버킷입니다.
+    - 토큰을 기다리는 호출은 우선순위, 요청 순서대로 토큰을 받습니다.
+    - Retry-After 응답을 받으면 그 시간 동안 토큰을 내주지 않습니다.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """토큰을 하나 가져옵니다. 토큰이 없다면 채워질 때까지 기다립니다."""
+        if not self._waiters and self._take():
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._schedule()
+        await future
+
+    @property
+    def waiting(self) -> int:
+        """토큰을 기다리는 호출 수를 반환합니다."""
+        return sum(not future.done() for *_, future in self._waiters)
+
+    @property
+    def is_idle(self) -> bool:
+        """기다리는 호출 없이 토큰이 가득 찼는지 반환합니다. 새로 만든 버킷과 같은 상태입니다."""
+        now = time.monotonic()
+        tokens = self._tokens + (now - self._updated_at) * self.rate
+        return (
+            not self._waiters and now >= self._paused_until and tokens >= self.capacity
+        )
+
+    def pause(self, seconds: float) -> None:
+        """seconds 초 동안 토큰을 내주지 않습니다."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _take(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+        if now < self._paused_until or self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _schedule(self) -> None:
+        """다음 토큰이 채워지는 시각에 기다리는 호출을 깨우도록 예약합니다."""
+        if self._timer is not None:
+            return
+        now = time.monotonic()
+        delay = max(self._paused_until - now, (1 - self._tokens) / self.rate, 0.0)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        self._timer = None
+        while self._waiters:
+            *_, future = self._waiters[0]
+            if future.done():  # 취소된 호출은 건너뛴다.
+                heapq.heappop(self._waiters)
+                continue
+            if not self._take():
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        if self._waiters:
+            self._schedule()
+
+
+class MethodMetrics(BaseModel):
+    calls: int = 0  # 호출 수
+    failures: int = 0  # 재시도 후에도 실패한 호출 수
+    retries: int = 0  # 재시도 수
+    rate_limited: int = 0  # 429 응답 수
+    wait_seconds: float = 0.0  # 토큰을 기다린 시간의 합
+
+
+class SlackDispatcher:
+    """
+    슬랙 API 호출을 메서드별 호출 제한과 우선순위에 맞춰 보내는 디스패처입니다.
+    - 등급이 있는 메서드는 메서드별 토큰 버킷을 사용합니다.
+    - chat.postMessage 는 채널별 버킷과 워크스페이스 전체 버킷을 함께 사용합니다.
+    - 429 응답을 받으면 Retry-After 만큼 해당 버킷을 멈추고, 일시적인 오류는 지수 백오프로 다시 시도합니다.
+    - 메시지 전송처럼 멱등이 아닌 메서드는 요청을 보내기 전에 실패한 연결 오류만 다시 시도합니다.
+    - 메서드별 호출, 실패, 재시도, 대기 시간을 metrics 에 기록합니다.
+    - 버킷이 많이 쌓이면 쉬고 있는 버킷을 지워 채널별 버킷이 계속 늘어나지 않게 합니다.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        bucket_sweep_threshold: int = BUCKET_SWEEP_THRESHOLD,
+    ) -> None:
+        self.max_retries = max_retries
+        self.metrics: dict[str, MethodMetrics] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._bucket_sweep_threshold = bucket_sweep_threshold
+        self._sweep_at = bucket_sweep_threshold
+
+    def _get_bucket(self, key: str, per_second: float) -> TokenBucket:
+        if key not in self._buckets:
+            if len(self._buckets) >= self._sweep_at:
+                self._evict_idle_buckets()
+            # 순간적으로 몰리는 요청은 1초 분량까지 허용합니다.
+            self._buckets[key] = TokenBucket(per_second, capacity=max(per_second, 1))
+        return self._buckets[key]
+
+    def _evict_idle_buckets(self) -> None:
+        """
+        토큰이 가득 찬 채 쉬고 있는 버킷을 지웁니다. 다시 필요하면 같은 상태로 새로 만듭니다.
+        남은 버킷이 많다면 매번 정리하지 않도록 다음 정리 시점을 늦춥니다.
+        """
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items() if not bucket.is_idle
+        }
+        self._sweep_at = max(self._bucket_sweep_threshold, len(self._buckets) * 2)
+
+    def _get_buckets(self, method: str, channel: str | None) -> list[TokenBucket]:
+        if method == "chat.postMessage":
+            # 채널 버킷을 먼저 기다려야 공유하는 워크스페이스 토큰을 붙잡고 기다리지 않는다.
+            buckets = [self._get_bucket(method, POST_MESSAGE_PER_WORKSPACE)]
+            if channel:
+                buckets.insert(
+                    0, self._get_bucket(f"{method}:{channel}", POST_MESSAGE_PER_CHANNEL)
+                )
+            return buckets
+
+        tier = METHOD_TIERS.get(method, DEFAULT_TIER)
+        return [self._get_bucket(method, TIER_LIMITS_PER_MINUTE[tier] / 60)]
+
+    async def call(
+        self,
+        client: AsyncWebClient,
+        method: str,
+        priority: Priority = Priority.INTERACTIVE,
+        **kwargs: Any,
+    ) -> AsyncSlackResponse:
+        """슬랙 API 메서드(예: chat.postMessage)를 호출 제한과 우선순위에 맞춰 호출합니다."""
+        metrics = self.metrics.setdefault(method, MethodMetrics())
+        api = getattr(client, method.replace(".", "_"))
+        metrics.calls += 1
+        attempt = 0
+        while True:
+            # 재시도 사이에 쉬던 버킷이 지워졌을 수 있으므로 시도할 때마다 버킷을 가져온다.
+            buckets = self._get_buckets(method, kwargs.get("channel"))
+            started_at = time.monotonic()
+            for bucket in buckets:
+                await bucket.acquire(priority)
+            metrics.wait_seconds += time.monotonic() - started_at
+
+            try:
+                return await api(**kwargs)
+            except (SlackApiError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                retry_after = self._get_retry_after(method, e, attempt)
+                if retry_after is None:
+                    metrics.failures += 1
+                    raise
+
+                attempt += 1
+                metrics.retries += 1
+                log_event(
+                    actor="slack_dispatcher",
+                    event="retry_slack_api",
+                    type="slack",
+                    description=f"{method} 호출을 {retry_after}초 후 다시 시도합니다. {e}",
+                    body={"attempt": attempt, "priority": priority.name},
+                )
+                if _is_rate_limited(e):
+                    metrics.rate_limited += 1
+                    for bucket in buckets:
+                        bucket.pause(retry_after)
+                else:
+                    await asyncio.sleep(retry_after)
+
+    def _get_retry_after(
+        self, method: str, error: Exception, attempt: int
+    ) -> float | None:
+        """다시 시도할 때까지 기다릴 시간을 반환합니다. 다시 시도하지 않는다면 None 을 반환합니다."""
+        if attempt >= self.max_retries:
+            return None
+        if isinstance(error, SlackApiError) and error.response.status_code == 429:
+            return float(error.response.headers.get("Retry-After", 1))
+        if method in NON_IDEMPOTENT_METHODS and not isinstance(
+            error, aiohttp.ClientConnectorError
+        ):
+            # 요청이 슬랙에 도착한 뒤 응답만 받지 못했을 수 있으므로 중복 전송하지 않는다.
+            return None
+        if isinstance(error, SlackApiError) and error.response.status_code < 500:
+            # channel_not_found 같은 요청 오류는 다시 시도해도 실패한다.
+            return None
+        return min(BACKOFF_BASE_SECONDS * 2**attempt, BACKOFF_MAX_SECONDS)
+
+    async def post_message(
+        self,
+        client: AsyncWebClient,
+        priority: Priority = Priority.INTERACTIVE,
+        **kwargs: Any,
+    ) -> AsyncSlackResponse:
+        """chat.postMessage 로 메시지를 전송합니다."""
+        return await self.call(client, "chat.postMessage", priority, **kwargs)
+
+    async def post_messages(
+        self,
+        client: AsyncWebClient,
+        messages: list[dict[str, Any]],
+        on_progress: Callable[[int, int], Awaitable[None]] | None = None,
+        progress_interval: int = 100,
+    ) -> list[Exception | None]:
+        """
+        여러 메시지를 대량 DM 우선순위로 동시에 전송하고, 메시지별 실패 예외(성공은 None)를 반환합니다.
+        on_progress 가 주어지면 progress_interval 개를 처리할 때마다 (처리한 수, 전체 수)로 호출합니다.
+        """
+
+        async def post(message: dict[str, Any]) -> Exception | None:
+            try:
+                await self.post_message(client, Priority.BULK, **message)
+            except Exception as e:
+                return e
+            return None
+
+        if not on_progress:
+            return await asyncio.gather(*(post(message) for message in messages))
+
+        # 진행 상황 알림이 남은 대량 DM 뒤에서 기다리지 않도록 progress_interval 개씩 나눠 전송한다.
+        errors: list[Exception | None] = []
+        for i in range(0, len(messages), progress_interval):
+            chunk = messages[i : i + progress_interval]
+            errors += await asyncio.gather(*(post(message) for message in chunk))
+            if len(errors) < len(messages):
+                await on_progress(len(errors), len(messages))
+        return errors
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """메서드별 호출 지표와 기다리는 호출 수를 반환합니다."""
+        return {
+            "methods": {
+                method: metrics.model_dump() for method, metrics in self.metrics.items()
+            },
+            "waiting": {
+                key: bucket.waiting
+                for key, bucket in self._buckets.items()
+                if bucket.waiting
+            },
+        }
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return isinstance(error, SlackApiError) and error.response.status_code == 429
+
+
+slack_dispatcher = SlackDispatcher()
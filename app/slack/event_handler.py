@@ -20,6 +20,7 @@ from app.slack.events import core as core_events
 from app.slack.events import log as log_events
 from app.slack.events import subscriptions as subscriptions_events
 from app.exception import BotException
+from app.slack.dispatcher import Priority, slack_dispatcher
 from app.slack.repositories import SlackRepository
 from app.slack.services.base import SlackService
 from app.slack.services.point import PointService
@@ -136,7 +137,9 @@ async def dependency_injection_middleware(
         f"channel: <#{channel_id}> "
         f"user_id: {user_id}"
     )
-    await app.client.chat_postMessage(channel=settings.ADMIN_CHANNEL, text=message)
+    await slack_dispatcher.post_message(
+        app.client, Priority.ADMIN, channel=settings.ADMIN_CHANNEL, text=message
+    )
     logger.error(message)
     raise BotException("사용자 정보를 찾을 수 없어요.")
 
@@ -171,7 +174,9 @@ async def handle_error(error, body):
         )
 
     # 관리자에게 에러를 알립니다.
-    await app.client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        app.client,
+        Priority.ADMIN,
         channel=settings.ADMIN_CHANNEL,
         text=f"🫢: {error=} 🕊️: {trace=} 👉🏼 💌: {body=}",
     )
@@ -245,7 +250,9 @@ async def handle_message(
             return
 
         message = f"👋🏼 <#{user.channel_id}>채널의 {user.name}님이 <#{channel_id}>을 남겼어요. 👀 <@{settings.SUPER_ADMIN}> <@{settings.ADMIN_IDS[1]}>"
-        await client.chat_postMessage(channel=settings.ADMIN_CHANNEL, text=message)
+        await slack_dispatcher.post_message(
+            client, Priority.ADMIN, channel=settings.ADMIN_CHANNEL, text=message
+        )
         return
 
     # 4. 커피챗 인증 메시지를 처리합니다.
@@ -286,7 +293,9 @@ async def handle_message(
 
 async def _notify_missing_user_info(client: AsyncWebClient, user_id: str):
     text = f"🥲 사용자 정보를 추가해주세요. 👉🏼 user_id: {user_id}"
-    await client.chat_postMessage(channel=settings.ADMIN_CHANNEL, text=text)
+    await slack_dispatcher.post_message(
+        client, Priority.ADMIN, channel=settings.ADMIN_CHANNEL, text=text
+    )
     logger.error(text)
 
 
@@ -4,6 +4,7 @@ from slack_sdk.web.async_client import AsyncWebClient
 from app.exception import BotException
 from app.models import User
 from app.slack_notification import send_point_noti_message
+from app.slack.dispatcher import slack_dispatcher
 from app.slack.services.base import SlackService
 from app.slack.services.point import PointService
 from app.slack.types import (
@@ -47,7 +48,9 @@ async def handle_coffee_chat_message(
         # 1초 대기하는 이유는 메시지 보다 더 먼저 전송 되어 오류가 발생할 수 있기 때문입니다.
         await asyncio.sleep(1)
         text = f"<@{user.user_id}> 님 커피챗 인증을 시작하려면 아래 `커피챗 인증` 버튼을 눌러주세요.\n만약 인증을 원치 않으시면 `안내 닫기` 버튼을 눌러주세요."
-        await client.chat_postEphemeral(
+        await slack_dispatcher.call(
+            client,
+            "chat.postEphemeral",
             user=user.user_id,
             channel=body["event"]["channel"],
             text=text,
@@ -91,7 +94,9 @@ async def handle_coffee_chat_message(
             selected_user_ids="",
         )
 
-        await client.reactions_add(
+        await slack_dispatcher.call(
+            client,
+            "reactions.add",
             channel=body["event"]["channel"],
             timestamp=body["event"]["ts"],
             name="white_check_mark",
@@ -216,7 +221,9 @@ async def submit_coffee_chat_proof_view(
     )
     message = history["messages"][0]
 
-    await client.reactions_add(
+    await slack_dispatcher.call(
+        client,
+        "reactions.add",
         channel=settings.COFFEE_CHAT_PROOF_CHANNEL,
         timestamp=message_ts,
         name="white_check_mark",
@@ -234,7 +241,8 @@ async def submit_coffee_chat_proof_view(
 
     participant_call_thread_ts = ""
     if participant_call_text:
-        res = await client.chat_postMessage(
+        res = await slack_dispatcher.post_message(
+            client,
             channel=settings.COFFEE_CHAT_PROOF_CHANNEL,
             thread_ts=message_ts,
             text=f"{participant_call_text} \n\n커피챗 인증을 위해 스레드로 후기를 남겨주세요. 인증이 확인된 멤버는 ✅가 표시돼요.\n\n커피챗 인증 내역은 <@{settings.TTOBOT_USER_ID}> 의 `홈` 탭 -> `내 커피챗 인증 내역 보기` 버튼을 통해 확인할 수 있어요.",
@@ -281,8 +289,8 @@ async def paper_plane_command(
     if user.user_id == settings.SUPER_ADMIN:
         remain_paper_planes = "∞"
     else:
-        paper_planes = service.fetch_current_week_paper_planes(user_id=user.user_id)
-        remain_paper_planes = 7 - len(paper_planes) if len(paper_planes) < 7 else 0
+        paper_plane_count = service.count_current_week_paper_planes(user.user_id)
+        remain_paper_planes = 7 - paper_plane_count if paper_plane_count < 7 else 0
 
     await client.views_open(
         trigger_id=body["trigger_id"],
@@ -3,7 +3,9 @@ import re
 
 import pandas as pd
 
+from app.permalinks import prefetch_permalink
 from app.slack_notification import send_point_noti_message
+from app.slack.dispatcher import slack_dispatcher
 from app.slack.components import static_select
 from app.constants import MAX_PASS_COUNT, ContentCategoryEnum
 from app.exception import BotException, ClientException
@@ -178,7 +180,8 @@ async def submit_view(
 
         # 해당 text 는 슬랙 활동 탭에서 표시되는 메시지이며, 누가 어떤 링크를 제출했는지 확인합니다. (alt_text 와 유사한 역할)
         text = f"*<@{content.user_id}>님 제출 완료.* 링크 : *<{content.content_url}|{re.sub('<|>', '', title if content.title != 'title unknown.' else content.content_url)}>*"
-        message = await client.chat_postMessage(
+        message = await slack_dispatcher.post_message(
+            client,
             channel=channel_id,
             text=text,
             blocks=[
@@ -222,6 +225,9 @@ async def submit_view(
         message = f"{user.name}({user.channel_name}) 님의 제출이 실패했어요. {str(e)}"  # type: ignore
         raise BotException(message)  # type: ignore
 
+    # 구독 알림 등에서 글 링크를 다시 가져오지 않도록 제출 메시지의 링크를 백그라운드에서 저장한다.
+    prefetch_permalink(client, channel_id, content.ts)
+
     # 포인트 지급 1. 글 제출 시 포인트 지급
     submission_point_msg, is_additional = point_service.grant_if_post_submitted(
         user_id=content.user_id, is_submit=is_submit
@@ -657,7 +663,8 @@ async def pass_view(
 
     try:
         content = await service.create_pass_content(ack, body, view)
-        message = await client.chat_postMessage(
+        message = await slack_dispatcher.post_message(
+            client,
             channel=channel_id,
             text=service.get_chat_message(content),
         )
@@ -722,7 +729,9 @@ async def web_search(
     await ack()
 
 
-def _fetch_blocks(contents: list[models.Content]) -> list[Block]:
+def _fetch_blocks(
+    contents: list[models.Content] | list[models.ContentRecord],
+) -> list[Block]:
     blocks: list[Block] = []
     blocks.append(SectionBlock(text="결과는 최대 20개까지만 표시해요."))
     for content in contents:
@@ -975,7 +984,7 @@ async def handle_bookmark_page(
 
 
 def _fetch_bookmark_blocks(
-    content_matrix: dict[int, list[models.Content]],
+    content_matrix: dict[int, list[models.ContentRecord]],
     bookmarks: list[models.Bookmark],
     page: int = 1,
 ) -> list[Block]:
@@ -1074,8 +1083,8 @@ async def open_overflow_action(
 
 
 def _get_content_metrix(
-    contents: list[models.Content], contents_per_page: int = 20
-) -> dict[int, list[models.Content]]:
+    contents: list[models.ContentRecord], contents_per_page: int = 20
+) -> dict[int, list[models.ContentRecord]]:
     """컨텐츠를 2차원 배열로 변환합니다."""
 
     content_matrix = {}
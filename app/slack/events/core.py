@@ -9,6 +9,7 @@ from app.client import SpreadSheetClient
 from app.config import settings
 from app.constants import BOT_IDS
 from app.models import CoffeeChatProof, Content, PointHistory, User
+from app.slack.dispatcher import Priority, slack_dispatcher
 from app.slack.services.base import SlackService
 from app.slack.services.point import PointMap, PointService
 from app.slack.types import (
@@ -72,13 +73,14 @@ async def open_deposit_view(
     if not user.deposit:
         text = "현재 예치금 확인 중이에요."
     else:
+        user_stats = service.get_user_stats(user.user_id)
+
         # 남은 패스 수
         remained_pass_count = 2
-        remained_pass_count -= user.pass_count
+        remained_pass_count -= user_stats.pass_count
 
         # 미제출 수
-        submit_status = user.get_submit_status()
-        not_submitted_count = list(submit_status.values()).count("미제출")
+        not_submitted_count = user_stats.not_submitted_count
 
         # 커피챗 인증 수
         coffee_chat_proofs = service.fetch_coffee_chat_proofs(user_id=user.user_id)
@@ -207,8 +209,8 @@ async def download_submission_history(
 
     contents = user.fetch_contents()
     if not contents:
-        await client.chat_postMessage(
-            channel=dm_channel_id, text="글 제출 내역이 없습니다.1"
+        await slack_dispatcher.post_message(
+            client, channel=dm_channel_id, text="글 제출 내역이 없습니다.1"
         )
         return None
 
@@ -233,7 +235,8 @@ async def download_submission_history(
         initial_comment=f"<@{user.user_id}> 님의 글 제출 내역 입니다.",
     )
 
-    await client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        client,
         channel=dm_channel_id,
         text=f"<@{user.user_id}> 님의 <{res['file']['permalink']}|글 제출 내역> 입니다.",
     )
@@ -316,7 +319,9 @@ async def admin_command(
         raise PermissionError("`/관리자` 명령어는 관리자만 호출할 수 있어요. 🤭")
 
     text = "관리자 메뉴입니다."
-    await client.chat_postEphemeral(
+    await slack_dispatcher.call(
+        client,
+        "chat.postEphemeral",
         channel=body["channel_id"],
         user=user.user_id,
         text=text,
@@ -375,8 +380,11 @@ async def handle_sync_store(
     ]["value"]
 
     try:
-        await client.chat_postMessage(
-            channel=settings.ADMIN_CHANNEL, text=f"{value} 데이터 동기화 시작"
+        await slack_dispatcher.post_message(
+            client,
+            Priority.ADMIN,
+            channel=settings.ADMIN_CHANNEL,
+            text=f"{value} 데이터 동기화 시작",
         )
         # # TODO: 슬랙으로 백업파일 보내기
         store = Store(client=SpreadSheetClient())
@@ -398,17 +406,24 @@ async def handle_sync_store(
         elif value == "구독":
             store.pull_subscriptions()
         else:
-            await client.chat_postMessage(
+            await slack_dispatcher.post_message(
+                client,
+                Priority.ADMIN,
                 channel=settings.ADMIN_CHANNEL,
                 text="동기화 테이블이 존재하지 않습니다.",
             )
 
-        await client.chat_postMessage(
-            channel=settings.ADMIN_CHANNEL, text=f"{value} 데이터 동기화 완료"
+        await slack_dispatcher.post_message(
+            client,
+            Priority.ADMIN,
+            channel=settings.ADMIN_CHANNEL,
+            text=f"{value} 데이터 동기화 완료",
         )
 
     except Exception as e:
-        await client.chat_postMessage(channel=settings.ADMIN_CHANNEL, text=str(e))
+        await slack_dispatcher.post_message(
+            client, Priority.ADMIN, channel=settings.ADMIN_CHANNEL, text=str(e)
+        )
 
 
 async def handle_invite_channel(
@@ -478,7 +493,9 @@ async def handle_invite_channel_view(
     if not channel_ids:
         channel_ids = await _fetch_public_channel_ids(client)
 
-    await client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        client,
+        Priority.ADMIN,
         channel=settings.ADMIN_CHANNEL,
         text=f"<@{user_id}> 님의 채널 초대를 시작합니다.\n\n채널 수 : {len(channel_ids)} 개\n",
     )
@@ -486,7 +503,9 @@ async def handle_invite_channel_view(
     for channel_id in channel_ids:
         await _invite_channel(client, user_id, channel_id)
 
-    await client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        client,
+        Priority.ADMIN,
         channel=settings.ADMIN_CHANNEL,
         text="채널 초대가 완료되었습니다.",
     )
@@ -531,7 +550,9 @@ async def _invite_channel(
             link = "<https://api.slack.com/methods/conversations.invite#errors|문서 확인하기>"
             result = f" -> 😵 ({e.response['error']}) 👉 {link}"
 
-    await client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        client,
+        Priority.ADMIN,
         channel=settings.ADMIN_CHANNEL,
         text=f"\n<#{channel_id}>" + result,
     )
@@ -563,9 +584,17 @@ async def handle_home_tab(
         )
         return
 
-    # 포인트 히스토리를 포함한 유저를 가져온다.
-    user_point_history = point_service.get_user_point(user_id=user.user_id)
-    combo_count = user.get_continuous_submit_count()
+    # 콤보 통계는 캐시에서, 포인트와 순위는 포인트 원장에서 가져온다.
+    user_stats = service.get_user_stats(user.user_id)
+    total_point = point_service.get_total_point(user.user_id)
+    leaderboard, my_rank = point_service.fetch_leaderboard(
+        limit=5, cohort=user.cohort, user_id=user.user_id
+    )
+    leaderboard_text = "\n".join(
+        f"{entry.rank}위. {entry.name} - *{entry.total_point} point*"
+        for entry in leaderboard
+    )
+    combo_count = user_stats.continuous_submit_count
 
     current_combo_point = ""
     if combo_count < 1:
@@ -581,8 +610,8 @@ async def handle_home_tab(
     if user.user_id == settings.SUPER_ADMIN:
         remain_paper_planes = "∞"
     else:
-        paper_planes = service.fetch_current_week_paper_planes(user_id=user.user_id)
-        remain_paper_planes = 7 - len(paper_planes) if len(paper_planes) < 7 else 0
+        paper_plane_count = service.count_current_week_paper_planes(user.user_id)
+        remain_paper_planes = 7 - paper_plane_count if paper_plane_count < 7 else 0
 
     # 홈 탭 메시지 구성
     await client.views_publish(
@@ -595,7 +624,7 @@ async def handle_home_tab(
                     text="🍭 내 글또 포인트",
                 ),
                 SectionBlock(
-                    text=f"현재 *{user.name[1:]}* 님이 획득한 총 포인트는 *{user_point_history.total_point} point* 입니다.",
+                    text=f"현재 *{user.name[1:]}* 님이 획득한 총 포인트는 *{total_point} point* 입니다.",
                 ),
                 ContextBlock(
                     elements=[
@@ -620,6 +649,26 @@ async def handle_home_tab(
                     ],
                 ),
                 DividerBlock(),
+                # 포인트 랭킹 섹션
+                HeaderBlock(
+                    text="🏆 포인트 랭킹",
+                ),
+                SectionBlock(
+                    text=leaderboard_text or "아직 포인트를 획득한 멤버가 없어요. 😅",
+                ),
+                ContextBlock(
+                    elements=[
+                        TextObject(
+                            type="mrkdwn",
+                            text=(
+                                f"*{user.name[1:]}* 님의 현재 순위는 *{my_rank}위* 입니다."
+                                if my_rank
+                                else "포인트를 획득하면 순위에 오를 수 있어요."
+                            ),
+                        ),
+                    ],
+                ),
+                DividerBlock(),
                 # 종이비행기 섹션
                 HeaderBlock(
                     text="✈️ 종이비행기 보내기",
@@ -799,8 +848,8 @@ async def download_point_history(
 
     user_point = point_service.get_user_point(user_id=user.user_id)
     if not user_point.point_histories:
-        await client.chat_postMessage(
-            channel=dm_channel_id, text="포인트 획득 내역이 없습니다."
+        await slack_dispatcher.post_message(
+            client, channel=dm_channel_id, text="포인트 획득 내역이 없습니다."
         )
         return None
 
@@ -825,7 +874,8 @@ async def download_point_history(
         initial_comment=f"<@{user.user_id}> 님의 포인트 획득 내역 입니다.",
     )
 
-    await client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        client,
         channel=dm_channel_id,
         text=f"<@{user.user_id}> 님의 <{res['file']['permalink']}|포인트 획득 내역> 입니다.",
     )
@@ -1035,8 +1085,8 @@ async def send_paper_plane_message_view(
     if user.user_id == settings.SUPER_ADMIN:
         pass
     else:
-        paper_planes = service.fetch_current_week_paper_planes(user_id=user.user_id)
-        if len(paper_planes) >= 7:
+        paper_plane_count = service.count_current_week_paper_planes(user.user_id)
+        if paper_plane_count >= 7:
             await ack(
                 response_action="errors",
                 errors={
@@ -1054,7 +1104,8 @@ async def send_paper_plane_message_view(
         text=text,
     )
 
-    await client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        client,
         channel=settings.THANKS_CHANNEL,
         text=f"💌 *<@{receiver_id}>* 님에게 종이비행기가 도착했어요!",
         blocks=[
@@ -1071,7 +1122,8 @@ async def send_paper_plane_message_view(
         ],
     )
 
-    await client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        client,
         channel=user.user_id,
         text=f"💌 *<@{receiver_id}>* 님에게 종이비행기를 보냈어요!",
         blocks=[
@@ -1092,7 +1144,9 @@ async def send_paper_plane_message_view(
     inflearn_coupon = get_inflearn_coupon(user_id=user.user_id)
     if not inflearn_coupon:
         # 인프런 쿠폰이 존재하지 않다면 관리자에게 알립니다.
-        await client.chat_postMessage(
+        await slack_dispatcher.post_message(
+            client,
+            Priority.ADMIN,
             channel=settings.ADMIN_CHANNEL,
             text=f"💌 *<@{user.user_id}>* 님의 인프런 쿠폰이 존재하지 않아요.",
         )
@@ -1124,7 +1178,8 @@ async def send_paper_plane_message_view(
         )  # 종이비행기 메시지 전송 후 5초 뒤에 전송. 이유는 바로 전송할 경우 본인 전송 알림 메시지와 구분이 어려움.
 
         try:
-            await client.chat_postMessage(
+            await slack_dispatcher.post_message(
+                client,
                 channel=user.user_id,
                 text=f"💌 *<@{settings.TTOBOT_USER_ID}>* 의 깜짝 선물이 담긴 종이비행기가 도착했어요!🎁",
                 blocks=[
@@ -1142,7 +1197,9 @@ async def send_paper_plane_message_view(
             )
             return None
         except Exception as e:
-            await client.chat_postMessage(
+            await slack_dispatcher.post_message(
+                client,
+                Priority.ADMIN,
                 channel=settings.ADMIN_CHANNEL,
                 text=f"💌 *<@{user.user_id}>* 님에게 인프런 쿠폰을 보냈으나 메시지 전송에 실패했어요. {e}",
             )
@@ -1356,8 +1413,8 @@ async def download_coffee_chat_history(
 
     proofs = service.fetch_coffee_chat_proofs(user_id=user.user_id)
     if not proofs:
-        await client.chat_postMessage(
-            channel=dm_channel_id, text="커피챗 인증 내역이 없습니다."
+        await slack_dispatcher.post_message(
+            client, channel=dm_channel_id, text="커피챗 인증 내역이 없습니다."
         )
         return None
 
@@ -1382,7 +1439,8 @@ async def download_coffee_chat_history(
         initial_comment=f"<@{user.user_id}> 님의 커피챗 인증 내역 입니다.",
     )
 
-    await client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        client,
         channel=dm_channel_id,
         text=f"<@{user.user_id}> 님의 <{res['file']['permalink']}|커피챗 인증 내역> 입니다.",
     )
@@ -1401,7 +1459,9 @@ async def handle_channel_created(
 
     channel_id = body["event"]["channel"]["id"]
     await client.conversations_join(channel=channel_id)
-    await client.chat_postMessage(
+    await slack_dispatcher.post_message(
+        client,
+        Priority.ADMIN,
         channel=settings.ADMIN_CHANNEL,
         text=f"새로 만들어진 <#{channel_id}> 채널에 또봇이 참여했습니다. 😋",
     )
@@ -1,4 +1,3 @@
-from datetime import datetime
 from app.constants import BOT_IDS
 from app.models import User
 from app.slack.services.base import SlackService
@@ -166,7 +165,7 @@ def _get_subscribe_member_view(
     user_subscriptions = service.fetch_subscriptions_by_user_id(user_id=user_id)
     subscription_list_blocks = [
         SectionBlock(
-            text=f"<@{subscription.target_user_id}> 님을 {datetime.strptime(subscription.created_at[:10], '%Y-%m-%d').strftime('%Y년 %m월 %d일')} 부터 구독하고 있어요.",
+            text=f"<@{subscription.target_user_id}> 님을 {subscription.created_at_.strftime('%Y년 %m월 %d일')} 부터 구독하고 있어요.",
             accessory=OverflowMenuElement(
                 action_id="unsubscribe_member",
                 options=[
@@ -1,12 +1,21 @@
 import csv
-from typing import Any
+from operator import itemgetter
+from typing import Any, Iterator
 import pandas as pd
 import polars as pl
 
 from app import store
 from app import models
+from app import paper_planes, points, stats
 from app.exception import BotException
-from app.utils import tz_now_to_str
+from app.search.index import ContentIndex, content_index
+from app.submission import (
+    SubmissionMatrix,
+    SubmissionOrderIndex,
+    get_round_calendar,
+    submission_order_index,
+)
+from app.utils import tz_now, tz_now_to_str
 
 
 class SlackRepository:
@@ -25,19 +34,12 @@ class SlackRepository:
             return user
         return None
 
-    def fetch_users(self) -> list[models.User]:
-        """모든 유저를 가져옵니다."""
-        users = [models.User(**user) for user in self._fetch_users()]
-        for user in users:
-            user.contents = self._fetch_contents(user.user_id)
-        return users
-
     def _get_user(self, user_id: str) -> models.User | None:
         """유저를 가져옵니다."""
         users = self._fetch_users()
         for user in users:
             if user["user_id"] == user_id:
-                return models.User(**user)
+                return models.User.from_row(user)
         return None
 
     def _fetch_users(self) -> list[dict[str, Any]]:
@@ -47,12 +49,34 @@ class SlackRepository:
             users = [dict(row) for row in reader]
             return users
 
+    def _read_rows(
+        self, table_name: str, fieldnames: tuple[str, ...]
+    ) -> Iterator[tuple[str, ...]]:
+        """저장소의 행을 fieldnames 순서의 튜플로 읽어옵니다."""
+        with open(f"store/{table_name}.csv") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            getter = itemgetter(*(header.index(name) for name in fieldnames))
+            for row in reader:
+                yield getter(row)
+
+    def _fetch_user_records(self) -> Iterator[models.UserRecord]:
+        """모든 유저를 콘텐츠 없이 읽기 전용 레코드로 가져옵니다."""
+        fieldnames = models.UserRecord._fields[:-1]  # contents 는 저장소 컬럼이 아니다.
+        for row in self._read_rows("users", fieldnames):
+            yield models.UserRecord._make((*row, []))
+
+    def _fetch_content_records(self) -> Iterator[models.ContentRecord]:
+        """모든 콘텐츠를 저장된 순서대로 읽기 전용 레코드로 가져옵니다."""
+        for row in self._read_rows("contents", models.ContentRecord._fields):
+            yield models.ContentRecord._make(row)
+
     def _fetch_contents(self, user_id: str) -> list[models.Content]:
         """유저의 콘텐츠를 오름차순(날짜)으로 정렬하여 가져옵니다."""
         with open("store/contents.csv") as f:
             reader = csv.DictReader(f)
             contents = [
-                models.Content(**content)
+                models.Content.from_row(content)
                 for content in reader
                 if content["user_id"] == user_id
             ]
@@ -64,33 +88,41 @@ class SlackRepository:
         if not user.contents:
             raise BotException("업데이트 대상 content 가 없어요.")
         store.content_upload_queue.append(user.recent_content.to_list_for_sheet())
+        generation = store.get_table_generation("contents")
         with open("store/contents.csv", "a", newline="", encoding="utf-8") as f:
             writer = csv.writer(f, quoting=csv.QUOTE_ALL)
             writer.writerow(user.recent_content.to_list_for_csv())
+        next_generation = store.get_table_generation("contents")
+        content_index.add(
+            user.recent_content.to_record(),
+            from_generation=generation,
+            to_generation=next_generation,
+        )
+        users_generation = store.get_table_generation("users")
+        submission_order_index.add(
+            user.channel_id,
+            user.user_id,
+            user.recent_content.dt,
+            user.recent_content.type,
+            from_generation=(users_generation, generation),
+            to_generation=(users_generation, next_generation),
+        )
+        stats.update_contents(user)
 
-    def fetch_contents(self) -> list[models.Content]:
-        """모든 콘텐츠를 가져옵니다."""
-        with open("store/contents.csv") as f:
-            reader = csv.DictReader(f)
-            contents = [
-                models.Content(**content)
-                for content in reader
-                if content["type"] == "submit"
-            ]
-            return sorted(contents, key=lambda content: content.dt_, reverse=True)
+    def _get_content_index(self) -> ContentIndex:
+        """콘텐츠 색인을 가져옵니다. 저장소가 바뀌었다면 색인을 다시 생성합니다."""
+        generation = store.get_table_generation("contents")
+        if content_index.generation != generation:
+            content_index.build(self._fetch_content_records(), generation)
+        return content_index
 
-    def fetch_contents_by_keyword(self, keyword: str) -> list[models.Content]:
-        """키워드가 포함된 콘텐츠를 가져옵니다."""
-        with open("store/contents.csv") as f:
-            reader = csv.DictReader(f)
-            contents = [
-                models.Content(**content)
-                for content in reader
-                if keyword.lower()
-                in (content["title"] + content["description"] + content["tags"]).lower()
-                and content["type"] == "submit"
-            ]
-            return sorted(contents, key=lambda content: content.dt_, reverse=True)
+    def fetch_contents(self) -> list[models.ContentRecord]:
+        """모든 제출 콘텐츠를 생성일시 내림차순으로 가져옵니다."""
+        return self._get_content_index().fetch_all()
+
+    def fetch_contents_by_keyword(self, keyword: str) -> list[models.ContentRecord]:
+        """키워드의 모든 토큰이 포함된 제출 콘텐츠를 생성일시 내림차순으로 가져옵니다."""
+        return self._get_content_index().search(keyword)
 
     def get_user_id_by_name(self, name: str) -> str | None:
         """이름으로 user_id를 가져옵니다."""
@@ -139,7 +171,7 @@ class SlackRepository:
         with open("store/bookmark.csv") as f:
             reader = csv.DictReader(f)
             bookmarks = [
-                models.Bookmark(**bookmark)  # type: ignore
+                models.Bookmark.from_row(bookmark)
                 for bookmark in reader
                 if bookmark["user_id"] == user_id and bookmark["status"] == status
             ]
@@ -192,7 +224,7 @@ class SlackRepository:
         with open("store/contents.csv") as f:
             reader = csv.DictReader(f)
             contents = [
-                models.Content(**content)  # type: ignore
+                models.Content.from_row(content)
                 for content in reader
                 if content["ts"] == ts
                 or (content["user_id"] == user_id and content["dt"] == dt)
@@ -216,7 +248,7 @@ class SlackRepository:
         with open("store/coffee_chat_proof.csv") as f:
             reader = csv.DictReader(f)
             proofs = [
-                models.CoffeeChatProof(**proof)  # type: ignore
+                models.CoffeeChatProof.from_row(proof)
                 for proof in reader
                 if proof["ts"] == ts
             ]
@@ -236,7 +268,7 @@ class SlackRepository:
         with open("store/coffee_chat_proof.csv") as f:
             reader = csv.DictReader(f)
             proofs = [
-                models.CoffeeChatProof(**proof)  # type: ignore
+                models.CoffeeChatProof.from_row(proof)
                 for proof in reader
                 if (not thread_ts or proof["thread_ts"] == thread_ts)
                 and (not user_id or proof["user_id"] == user_id)
@@ -245,16 +277,55 @@ class SlackRepository:
 
     def add_point(self, point_history: models.PointHistory) -> None:
         """포인트를 추가합니다."""
+        generation = points.get_point_ledger().generation
         with open("store/point_histories.csv", "a", newline="", encoding="utf-8") as f:
             writer = csv.writer(f, quoting=csv.QUOTE_ALL)
             writer.writerow(point_history.to_list_for_csv())
+        points.point_ledger.add(
+            point_history,
+            from_generation=generation,
+            to_generation=store.get_table_generation("point_histories"),
+        )
+
+    def get_total_point(self, user_id: str) -> int:
+        """유저의 총 포인트를 가져옵니다."""
+        return points.get_point_ledger().get_total_point(user_id)
+
+    def fetch_point_leaderboard(
+        self, limit: int, cohort: str | None = None, user_id: str | None = None
+    ) -> tuple[list[tuple[points.LeaderboardEntry, models.UserRecord]], int | None]:
+        """
+        총 포인트 상위 유저의 순위를 가져옵니다.
+        - cohort 가 주어지면 해당 기수 유저들 사이의 순위를 가져옵니다.
+        - user_id 가 주어지면 같은 유저 목록으로 계산한 해당 유저의 순위를 함께 가져옵니다.
+        """
+        users = {
+            user.user_id: user
+            for user in self._fetch_user_records()
+            if not cohort or user.cohort == cohort
+        }
+        ledger = points.get_point_ledger()
+        leaderboard = ledger.fetch_leaderboard(limit, user_ids=set(users))
+        rank = ledger.get_rank(user_id, user_ids=set(users)) if user_id else None
+        return [(entry, users[entry.user_id]) for entry in leaderboard], rank
+
+    def get_user_stats(self, user_id: str) -> stats.UserStats | None:
+        """유저의 통계를 가져옵니다. 캐시에 없다면 계산하여 캐시합니다."""
+        if user_stats := stats.get_user_stats(user_id):
+            return user_stats
+
+        user = self.get_user(user_id)
+        if not user:
+            return None
+
+        return stats.set_user_stats(user)
 
     def fetch_point_histories(self, user_id: str) -> list[models.PointHistory]:
         """포인트 히스토리를 가져옵니다."""
         with open("store/point_histories.csv") as f:
             reader = csv.DictReader(f)
             point_histories = [
-                models.PointHistory(**point_history)  # type: ignore
+                models.PointHistory.from_row(point_history)
                 for point_history in reader
                 if point_history["user_id"] == user_id
             ]
@@ -262,38 +333,74 @@ class SlackRepository:
                 point_histories, key=lambda point: point.created_at, reverse=True
             )
 
-    def fetch_channel_users(self, channel_id: str) -> list[models.User]:
-        """
-        채널의 유저를 가져옵니다.
-        성능향상을 위해 polars를 사용합니다.
-        """
-        users_df = pl.read_csv("store/users.csv", dtypes={"deposit": pl.Utf8})
-        users = users_df.filter(pl.col("channel_id") == channel_id).to_dicts()
-        users = [models.User(**user) for user in users]
+    def fetch_users_by_cohort(self, cohort: str) -> list[models.UserRecord]:
+        """기수의 유저를 콘텐츠 없이 읽기 전용 레코드로 가져옵니다."""
+        return [user for user in self._fetch_user_records() if user.cohort == cohort]
+
+    def fetch_submission_matrix(self, user_ids: list[str]) -> SubmissionMatrix:
+        """유저들의 회차별 제출 상태 행렬을 저장소의 콘텐츠 컬럼으로 한 번에 계산합니다."""
+        contents_df = pl.read_csv(
+            "store/contents.csv",
+            columns=["user_id", "dt", "type"],
+            infer_schema_length=0,  # 모든 컬럼을 문자열로 읽는다.
+        ).filter(pl.col("user_id").is_in(user_ids))
+        return SubmissionMatrix.from_columns(
+            user_ids,
+            contents_df["user_id"].to_list(),
+            contents_df["dt"].to_list(),
+            contents_df["type"].to_list(),
+            due_dates=models.DUE_DATES,
+            now_date=tz_now().date(),
+        )
 
-        contents_df = pl.read_csv("store/contents.csv", dtypes={"ts": pl.Utf8})
-        for user in users:
-            contents = contents_df.filter(pl.col("user_id") == user.user_id).to_dicts()
-            user.contents = [models.Content(**content) for content in contents]
+    def _get_submission_order_index(self) -> SubmissionOrderIndex:
+        """첫 제출 순서 색인을 가져옵니다. 저장소나 마감일이 바뀌었다면 색인을 다시 생성합니다."""
+        generation = (
+            store.get_table_generation("users"),
+            store.get_table_generation("contents"),
+        )
+        calendar = get_round_calendar(models.DUE_DATES)
+        index = submission_order_index
+        if index.generation != generation or index.calendar is not calendar:
+            channel_ids = {
+                user.user_id: user.channel_id for user in self._fetch_user_records()
+            }
+            contents = (
+                (user_id, dt, type)
+                for user_id, dt, type in self._read_rows(
+                    "contents", ("user_id", "dt", "type")
+                )
+            )
+            index.build(channel_ids, contents, calendar, generation)
+        return index
 
-        return users
+    def get_submission_rank(self, user_id: str, channel_id: str) -> int | None:
+        """
+        채널에서 현재 회차에 첫 제출한 순위를 가져옵니다.
+        활동 기간이 아니거나 현재 회차에 제출하지 않았다면 None 을 반환합니다.
+        """
+        index = self._get_submission_order_index()
+        calendar = get_round_calendar(models.DUE_DATES)
+        round = calendar.get_round(tz_now().date())
+        if not 0 < round < len(calendar):
+            return None
+        return index.get_rank(channel_id, round, user_id)
 
     def create_paper_plane(self, paper_plane: models.PaperPlane) -> None:
         """종이비행기를 생성합니다."""
+        generation = paper_planes.get_paper_plane_index().generation
         with open("store/paper_plane.csv", "a", newline="", encoding="utf-8") as f:
             writer = csv.writer(f, quoting=csv.QUOTE_ALL)
             writer.writerow(paper_plane.to_list_for_csv())
+        paper_planes.paper_plane_index.add(
+            paper_plane,
+            from_generation=generation,
+            to_generation=store.get_table_generation("paper_plane"),
+        )
 
-    def fetch_paper_planes(self, sender_id: str) -> list[models.PaperPlane]:
-        """종이비행기를 가져옵니다."""
-        with open("store/paper_plane.csv") as f:
-            reader = csv.DictReader(f)
-            paper_planes = [
-                models.PaperPlane(**paper_plane)  # type: ignore
-                for paper_plane in reader
-                if paper_plane["sender_id"] == sender_id
-            ]
-            return paper_planes
+    def count_current_week_paper_planes(self, sender_id: str) -> int:
+        """이번 주에 보낸 종이비행기 수를 가져옵니다."""
+        return paper_planes.get_paper_plane_index().count_current_week(sender_id)
 
     def create_subscription(self, subscription: models.Subscription) -> None:
         """구독을 생성합니다."""
@@ -314,7 +421,7 @@ class SlackRepository:
         with open("store/subscriptions.csv") as f:
             reader = csv.DictReader(f)
             subscriptions = [
-                models.Subscription(**subscription)  # type: ignore
+                models.Subscription.from_row(subscription)
                 for subscription in reader
                 if subscription["status"] == models.SubscriptionStatusEnum.ACTIVE
             ]
@@ -328,7 +435,7 @@ class SlackRepository:
         with open("store/subscriptions.csv") as f:
             reader = csv.DictReader(f)
             subscriptions = [
-                models.Subscription(**subscription)  # type: ignore
+                models.Subscription.from_row(subscription)
                 for subscription in reader
                 if subscription["status"] == models.SubscriptionStatusEnum.ACTIVE
                 and subscription["user_id"] == user_id
@@ -343,7 +450,7 @@ class SlackRepository:
         with open("store/subscriptions.csv") as f:
             reader = csv.DictReader(f)
             subscriptions = [
-                models.Subscription(**subscription)  # type: ignore
+                models.Subscription.from_row(subscription)
                 for subscription in reader
                 if subscription["status"] == models.SubscriptionStatusEnum.ACTIVE
                 and subscription["target_user_id"] == target_user_id
@@ -363,5 +470,5 @@ class SlackRepository:
                     subscription["id"] == subscription_id
                     and subscription["status"] == status
                 ):
-                    return models.Subscription(**subscription)  # type: ignore
+                    return models.Subscription.from_row(subscription)
         return None
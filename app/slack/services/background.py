@@ -1,16 +1,22 @@
+import asyncio
 import csv
 from datetime import timedelta
 import os
-import traceback
 from typing import TypedDict
 
 import pandas as pd
-import tenacity
 from app.constants import remind_message
 from app.logging import log_event
-from app.models import User
+from app.models import (
+    SubscriptionJobStatusEnum,
+    SubscriptionStatusEnum,
+    UserRecord,
+)
+from app.permalinks import get_permalink
+from app.slack.dispatcher import Priority, slack_dispatcher
 from app.slack.repositories import SlackRepository
 from slack_sdk.models.blocks import (
+    Block,
     SectionBlock,
     TextObject,
     ActionsBlock,
@@ -23,9 +29,26 @@ from slack_bolt.async_app import AsyncApp
 from app.config import settings
 
 
-import asyncio
+from app.utils import dict_to_json_str, str_to_dt, tz_now, tz_now_to_str
+
+
+# 구독 알림 전송 작업 테이블입니다. 메시지별 전송 상태(pending/sent/failed)를 가집니다.
+SUBSCRIPTION_JOBS_PATH = "store/_subscription_jobs.csv"
+
+# 전송할 때마다 바뀐 작업의 상태를 덧붙이는 기록입니다.
+# 작업 테이블을 읽을 때 반영하고, 전송을 마치면 작업 테이블에 합친 뒤 지웁니다.
+SUBSCRIPTION_JOB_EVENTS_PATH = "store/_subscription_job_events.csv"
+SUBSCRIPTION_JOB_STATE_FIELDS = ["status", "attempts", "next_retry_at", "error"]
 
-from app.utils import dict_to_json_str, tz_now
+# 구독 알림 작업 테이블을 읽고 쓰는 작업이 동시에 실행되지 않도록 하는 잠금입니다.
+subscription_job_lock = asyncio.Lock()
+
+# 실패한 메시지는 1, 2, 4... 분 후 다시 보내며, 최대 3번까지 시도한다.
+SUBSCRIPTION_RETRY_BASE_SECONDS = 60
+SUBSCRIPTION_MAX_ATTEMPTS = 3
+
+# 슬랙 메시지는 블록을 50개까지 담을 수 있으므로, 글 3개 블록씩 15개까지 한 메시지에 모은다.
+SUBSCRIPTION_DIGEST_MAX_POSTS = 15
 
 
 class SubscriptionMessage(TypedDict):
@@ -43,195 +66,380 @@ class BackgroundService:
 
     async def send_reminder_message_to_user(self, slack_app: AsyncApp) -> None:
         """사용자에게 리마인드 메시지를 전송합니다."""
-        users = self._repo.fetch_users()
+        # 10기 중 채널이 있는 사용자만 대상으로 한다. (채널 이름이 없다면 봇)
+        users = [
+            user
+            for user in self._repo.fetch_users_by_cohort("10기")
+            if user.channel_name != "-"
+        ]
 
-        target_users: list[User] = []
-        for user in users:
-            if user.cohort != "10기":  # 10기 외의 사용자 제외
-                continue
-            if user.channel_name == "-":  # 채널 이름이 없는 경우 제외
-                continue
-            if user.is_submit:  # 이미 제출한 경우 제외
-                continue
+        # 콘텐츠 컬럼을 한 번에 읽어 현재 회차 미제출자를 찾는다.
+        submission_matrix = self._repo.fetch_submission_matrix(
+            [user.user_id for user in users]
+        )
+        unsubmitted_user_ids = set(submission_matrix.fetch_unsubmitted_user_ids())
+        target_users = [user for user in users if user.user_id in unsubmitted_user_ids]
+
+        log_event(
+            actor="slack_reminder_service",
+            event="send_reminder_message_to_user",
+            type="reminder",
+            description=f"{len(target_users)} 명에게 리마인드 메시지를 전송합니다.",
+            body={"user_ids": [user.user_id for user in target_users]},
+        )
+
+        async def report_progress(done: int, total: int) -> None:
+            await slack_dispatcher.post_message(
+                slack_app.client,
+                Priority.JOB_STATUS,
+                channel=settings.ADMIN_CHANNEL,
+                text=f"리마인드 메시지 전송 중... ({done}/{total})",
+            )
 
-            target_users.append(user)
+        # 슬랙 호출 제한(채널당 초당 1개)에 맞춰 여러 유저에게 동시에 전송한다.
+        errors = await slack_dispatcher.post_messages(
+            slack_app.client,
+            [
+                {
+                    "channel": user.user_id,
+                    "text": remind_message.format(user_name=user.name),
+                }
+                for user in target_users
+            ],
+            on_progress=report_progress,
+        )
 
-        for user in target_users:
+        failed_users: list[UserRecord] = []
+        for user, error in zip(target_users, errors):
+            if error is None:
+                continue
+            failed_users.append(user)
             log_event(
                 actor="slack_reminder_service",
                 event="send_reminder_message_to_user",
-                type="reminder",
-                description=f"{user.name} 님에게 리마인드 메시지를 전송합니다.",
+                type="error",
+                description=f"{user.name} 님에게 리마인드 메시지 전송을 실패했습니다. {error}",
             )
 
-            await slack_app.client.chat_postMessage(
-                channel=user.user_id,
-                text=remind_message.format(user_name=user.name),
+        text = f"총 {len(target_users) - len(failed_users)} 명에게 리마인드 메시지를 전송했습니다."
+        if failed_users:
+            text += f"\n전송 실패 {len(failed_users)} 명: " + ", ".join(
+                f"<@{user.user_id}>" for user in failed_users
             )
-
-            # 슬랙은 메시지 전송을 초당 1개를 권장하기 때문에 1초 대기합니다.
-            # 참고문서: https://api.slack.com/methods/chat.postMessage#rate_limiting
-            await asyncio.sleep(1)
-
-        await slack_app.client.chat_postMessage(
+        await slack_dispatcher.post_message(
+            slack_app.client,
+            Priority.JOB_STATUS,
             channel=settings.ADMIN_CHANNEL,
-            text=f"총 {len(target_users)} 명에게 리마인드 메시지를 전송했습니다.",
+            text=text,
         )
 
     async def prepare_subscribe_message_data(self) -> None:
-        """사용자에게 구독 알림 메시지 목록을 임시 CSV 파일로 저장합니다."""
-
-        # 기존 임시 파일 삭제
-        if os.path.exists("store/_subscription_messages.csv"):
-            os.remove("store/_subscription_messages.csv")
-
-        # 모든 구독 정보를 가져옵니다
-        subscriptions = self._repo.fetch_subscriptions()
-
-        # 구독 대상자들의 user_id를 중복 없이 set으로 추출합니다
-        target_user_ids = {
-            subscription.target_user_id for subscription in subscriptions
-        }
-
-        yesterday = (tz_now() - timedelta(days=1)).date()
-        contents_df = pd.read_csv("store/contents.csv")
-
-        # dt 컬럼을 datetime 타입으로 변환하고 date 부분만 추출합니다
-        contents_df["dt"] = pd.to_datetime(contents_df["dt"]).dt.date
-
-        # 구독 대상자의 콘텐츠 중 어제 작성된 제출 글만 필터링합니다
-        filtered_contents = contents_df[
-            (contents_df["user_id"].isin(target_user_ids))
-            & (contents_df["dt"] == yesterday)
-            & (contents_df["type"] == "submit")
+        """
+        오늘 보낼 구독 알림 메시지를 전송 작업 테이블로 저장합니다.
+        오늘 작업 테이블이 이미 있다면 전송 상태를 유지하도록 그대로 둡니다.
+        """
+        today = tz_now().date().isoformat()
+        if os.path.exists(SUBSCRIPTION_JOBS_PATH):
+            job_dates = pd.read_csv(
+                SUBSCRIPTION_JOBS_PATH, usecols=["job_date"], dtype=str, nrows=1
+            )
+            if not job_dates.empty and job_dates["job_date"].iloc[0] == today:
+                return
+
+        # 활성 구독과 어제 작성된 제출 글을 각각 한 번씩 읽는다.
+        # ts 가 숫자로 바뀌지 않도록 모든 컬럼을 문자열로 읽는다.
+        subscriptions = pd.read_csv(
+            "store/subscriptions.csv",
+            usecols=["user_id", "target_user_id", "target_user_channel", "status"],
+            dtype=str,
+            na_filter=False,
+        )
+        subscriptions = subscriptions[
+            subscriptions["status"] == SubscriptionStatusEnum.ACTIVE.value
         ]
 
-        # 구독 알림 메시지 데이터를 저장할 리스트
-        subscription_messages: list[SubscriptionMessage] = []
+        yesterday = (tz_now() - timedelta(days=1)).date().isoformat()
+        contents = pd.read_csv(
+            "store/contents.csv",
+            usecols=["user_id", "dt", "type", "ts", "title"],
+            dtype=str,
+            na_filter=False,
+        )
+        contents = contents[
+            (contents["type"] == "submit") & contents["dt"].str.startswith(yesterday)
+        ]
 
-        # 각 구독 대상자별로 처리를 시작합니다
-        for target_user_id in target_user_ids:
-            target_contents = filtered_contents[
-                filtered_contents["user_id"] == target_user_id
-            ]
+        # 구독 대상자의 글과 구독자를 조인하여 구독자별 알림 메시지를 만든다.
+        merged = contents.merge(
+            subscriptions,
+            left_on="user_id",
+            right_on="target_user_id",
+            how="inner",
+            suffixes=("", "_subscriber"),
+        )
+        jobs = pd.DataFrame(
+            {
+                "user_id": merged["user_id_subscriber"],
+                "target_user_id": merged["user_id"],
+                "target_user_channel": merged["target_user_channel"],
+                "ts": merged["ts"],
+                "title": merged["title"],
+                "dt": merged["dt"].str[:10],  # 날짜 부분
+                "job_date": today,
+                "status": SubscriptionJobStatusEnum.PENDING.value,
+                "attempts": 0,
+                "next_retry_at": "",
+                "error": "",
+            }
+        )
+        # 지난 작업의 상태 기록이 새 작업 테이블에 반영되지 않도록 먼저 지운다.
+        if os.path.exists(SUBSCRIPTION_JOB_EVENTS_PATH):
+            os.remove(SUBSCRIPTION_JOB_EVENTS_PATH)
+        self._write_subscription_jobs(jobs)
 
-            # 해당 구독 대상자의 콘텐츠가 없으면 다음 대상자로 넘어갑니다
-            if len(target_contents) == 0:
-                continue
+    async def send_subscription_messages(self, slack_app: AsyncApp) -> None:
+        """
+        작업 테이블의 구독 알림을 구독자별 DM 으로 모아 전송합니다.
+        - 이미 전송한 메시지는 건너뛰므로, 중단된 작업을 다시 실행하면 남은 메시지만 전송합니다.
+        - 실패한 메시지는 다른 메시지 전송을 막지 않고, 지수 백오프 후 다시 전송합니다.
+        - 서버 시작 시 이어서 보내는 작업과 정기 작업이 겹치더라도 한 번에 하나씩만 전송합니다.
+        """
+        async with subscription_job_lock:
+            await self._send_subscription_messages(slack_app)
+
+    async def _send_subscription_messages(self, slack_app: AsyncApp) -> None:
+        if not os.path.exists(SUBSCRIPTION_JOBS_PATH):
+            return
 
-            # 현재 구독 대상자를 구독하는 모든 구독자 정보를 가져옵니다
-            target_subscriptions = self._repo.fetch_subscriptions_by_target_user_id(
-                target_user_id
-            )
+        jobs = self._read_subscription_jobs()
+        if jobs.empty or jobs["job_date"].iloc[0] != tz_now().date().isoformat():
+            return  # 지난 작업은 다시 보내지 않는다.
+        jobs["attempts"] = jobs["attempts"].astype(int)
 
-            # 구독자에게 보낼 알림을 배열에 담습니다.
-            for subscription in target_subscriptions:
-                for _, content in target_contents.iterrows():
-                    subscription_messages.append(
-                        {
-                            "user_id": subscription.user_id,
-                            "target_user_id": target_user_id,
-                            "target_user_channel": subscription.target_user_channel,
-                            "ts": content["ts"],
-                            "title": content["title"],
-                            "dt": content["dt"],
-                        }
-                    )
-
-        # 임시 CSV 파일에 저장합니다.
-        if subscription_messages:
-            pd.DataFrame(subscription_messages).to_csv(
-                "store/_subscription_messages.csv",
-                index=False,
-                quoting=csv.QUOTE_ALL,
+        def get_retryable() -> pd.Series:
+            return (jobs["status"] == SubscriptionJobStatusEnum.FAILED.value) & (
+                jobs["attempts"] < SUBSCRIPTION_MAX_ATTEMPTS
             )
 
-    async def send_subscription_messages(self, slack_app: AsyncApp) -> None:
-        """사용자에게 구독 알림 메시지를 전송합니다."""
-        if not os.path.exists("store/_subscription_messages.csv"):
-            return
-
-        df = pd.read_csv("store/_subscription_messages.csv")
-        for _, row in df.iterrows():
-            try:
-                message: SubscriptionMessage = row.to_dict()
-                await self._send_subscription_message(slack_app, message)
+        pending = jobs["status"] == SubscriptionJobStatusEnum.PENDING.value
+        if not (pending | get_retryable()).any():
+            return  # 이미 끝난 작업이다.
 
-            except Exception as e:
-                trace = traceback.format_exc()
-                error_message = f"⚠️ <@{row['user_id']}>님의 구독 알림 메시지 전송에 실패했습니다. 오류: {e} {trace}"
-                log_event(
-                    actor="slack_subscribe_service",
-                    event="send_subscription_message_to_user",
-                    type="error",
-                    description=error_message,
-                )
-                await slack_app.client.chat_postMessage(
-                    channel=settings.ADMIN_CHANNEL,
-                    text=error_message,
-                )
+        while True:
+            retryable = get_retryable()
+            due = (jobs["status"] == SubscriptionJobStatusEnum.PENDING.value) | (
+                retryable & (jobs["next_retry_at"] <= tz_now_to_str())
+            )
+            if due.any():
+                await self._send_subscription_jobs(slack_app, jobs, jobs.index[due])
                 continue
-
-        await slack_app.client.chat_postMessage(
+            if not retryable.any():
+                break
+            # 가장 먼저 다시 보낼 메시지의 시각까지 기다린다.
+            next_retry_at = str_to_dt(jobs.loc[retryable, "next_retry_at"].min())
+            await asyncio.sleep(max((next_retry_at - tz_now()).total_seconds(), 0))
+
+        # 전송을 마쳤으므로 상태 기록을 작업 테이블에 합친다.
+        self._write_subscription_jobs(jobs)
+        if os.path.exists(SUBSCRIPTION_JOB_EVENTS_PATH):
+            os.remove(SUBSCRIPTION_JOB_EVENTS_PATH)
+
+        sent = jobs[jobs["status"] == SubscriptionJobStatusEnum.SENT.value]
+        text = f"총 {sent['user_id'].nunique()} 명에게 {len(sent)} 개의 구독 알림을 전송했습니다."
+        failed = jobs[jobs["status"] == SubscriptionJobStatusEnum.FAILED.value]
+        if not failed.empty:
+            text += f"\n전송 실패 {len(failed)} 개: " + ", ".join(
+                f"<@{user_id}>" for user_id in failed["user_id"].unique()
+            )
+        await slack_dispatcher.post_message(
+            slack_app.client,
+            Priority.JOB_STATUS,
             channel=settings.ADMIN_CHANNEL,
-            text=f"총 {len(df['user_id'].unique())} 명에게 {len(df)} 개의 구독 알림 메시지를 전송했습니다.",
+            text=text,
         )
 
-    @tenacity.retry(
-        stop=tenacity.stop_after_attempt(3),
-        wait=tenacity.wait_fixed(1),
-        reraise=True,
-    )
-    async def _send_subscription_message(
-        self, slack_app: AsyncApp, message: SubscriptionMessage
+    async def _send_subscription_jobs(
+        self, slack_app: AsyncApp, jobs: pd.DataFrame, index: pd.Index
     ) -> None:
-        permalink_res = await slack_app.client.chat_getPermalink(
-            message_ts=message["ts"],
-            channel=message["target_user_channel"],
+        """작업들을 구독자별 다이제스트 DM 으로 동시에 전송하고, 전송할 때마다 바뀐 상태를 기록합니다."""
+        # 같은 글을 여러 명이 구독하더라도 글 링크는 글마다 한 번만 가져오고, 캐시에 있다면 호출하지 않는다.
+        posts = list(
+            dict.fromkeys(
+                zip(jobs.loc[index, "target_user_channel"], jobs.loc[index, "ts"])
+            )
         )
-
-        text = f"구독하신 <@{message['target_user_id']}>님의 새로운 글이 올라왔어요! 🤩"
-        blocks = [
-            SectionBlock(
-                text=text,
+        permalink_results = await asyncio.gather(
+            *(
+                get_permalink(slack_app.client, channel, ts, Priority.BULK)
+                for channel, ts in posts
             ),
-            ContextBlock(
-                elements=[
-                    TextObject(
-                        type="mrkdwn",
-                        text=f"글 제목 : {message['title']}\n제출 날짜 : {message['dt'][:4]}년 {int(message['dt'][5:7])}월 {int(message['dt'][8:10])}일",
-                    ),
-                ],
-            ),
-            ActionsBlock(
-                elements=[
-                    ButtonElement(
-                        text="글 보러가기",
-                        action_id="open_subscription_permalink",
-                        url=permalink_res["permalink"],
-                        style="primary",
-                        value=dict_to_json_str(
-                            {
-                                "user_id": message["user_id"],  # 구독자
-                                "ts": message["ts"],  # 클릭한 콘텐츠 id
-                            }
-                        ),
-                    ),
-                    ButtonElement(
-                        text="감사의 종이비행기 보내기",
-                        action_id="send_paper_plane_message",
-                        value=message["target_user_id"],
-                    ),
+            return_exceptions=True,
+        )
+        permalinks: dict[tuple[str, str], str] = {}
+        for post, result in zip(posts, permalink_results):
+            if isinstance(result, BaseException):
+                post_index = index[
+                    (jobs.loc[index, "target_user_channel"] == post[0])
+                    & (jobs.loc[index, "ts"] == post[1])
                 ]
-            ),
-            DividerBlock(),
+                self._fail_subscription_jobs(jobs, post_index, result)
+                self._append_subscription_job_events(jobs, post_index)
+                continue
+            permalinks[post] = result
+
+        # 구독자별로 글을 모아 다이제스트 DM 을 만든다.
+        subscriber_jobs: dict[str, list[int]] = {}
+        for i in index:
+            if (jobs.at[i, "target_user_channel"], jobs.at[i, "ts"]) in permalinks:
+                subscriber_jobs.setdefault(jobs.at[i, "user_id"], []).append(i)
+
+        async def send_digest(user_id: str, digest_index: list[int]) -> None:
+            columns = list(SubscriptionMessage.__annotations__)
+            messages: list[SubscriptionMessage] = jobs.loc[  # type: ignore
+                digest_index, columns
+            ].to_dict("records")
+            text = f"구독하신 멤버의 새로운 글이 {len(messages)}개 올라왔어요! 🤩"
+            try:
+                await slack_dispatcher.post_message(
+                    slack_app.client,
+                    Priority.BULK,
+                    channel=user_id,
+                    text=text,
+                    blocks=self._get_subscription_digest_blocks(
+                        text, messages, permalinks
+                    ),
+                )
+            except Exception as e:
+                self._fail_subscription_jobs(jobs, pd.Index(digest_index), e)
+            else:
+                jobs.loc[digest_index, "status"] = SubscriptionJobStatusEnum.SENT.value
+                jobs.loc[digest_index, "error"] = ""
+            # 재시작하더라도 보낸 메시지를 다시 보내지 않도록 바로 기록한다.
+            self._append_subscription_job_events(jobs, pd.Index(digest_index))
+
+        # 구독자별 DM 은 슬랙 호출 제한에 맞춰 동시에 전송한다.
+        await asyncio.gather(
+            *(
+                send_digest(user_id, user_index[i : i + SUBSCRIPTION_DIGEST_MAX_POSTS])
+                for user_id, user_index in subscriber_jobs.items()
+                for i in range(0, len(user_index), SUBSCRIPTION_DIGEST_MAX_POSTS)
+            )
+        )
+
+    def _fail_subscription_jobs(
+        self, jobs: pd.DataFrame, index: pd.Index, error: BaseException
+    ) -> None:
+        """작업들을 실패로 표시하고, 시도 횟수에 따라 다음 재시도 시각을 정합니다."""
+        attempts = jobs.loc[index, "attempts"] + 1
+        jobs.loc[index, "attempts"] = attempts
+        jobs.loc[index, "status"] = SubscriptionJobStatusEnum.FAILED.value
+        jobs.loc[index, "error"] = str(error)
+        jobs.loc[index, "next_retry_at"] = [
+            (
+                tz_now()
+                + timedelta(
+                    seconds=SUBSCRIPTION_RETRY_BASE_SECONDS * 2 ** (attempt - 1)
+                )
+            ).strftime("%Y-%m-%d %H:%M:%S")
+            for attempt in attempts
         ]
-        await slack_app.client.chat_postMessage(
-            channel=message["user_id"],
-            text=text,
-            blocks=blocks,
+        for user_id in jobs.loc[index, "user_id"].unique():
+            log_event(
+                actor="slack_subscribe_service",
+                event="send_subscription_message_to_user",
+                type="error",
+                description=f"<@{user_id}>님의 구독 알림 메시지 전송에 실패했습니다. 오류: {error}",
+            )
+
+    def _read_subscription_jobs(self) -> pd.DataFrame:
+        """작업 테이블을 읽고, 합치지 않은 상태 기록이 있다면 작업마다 마지막 상태를 반영합니다."""
+        jobs = pd.read_csv(SUBSCRIPTION_JOBS_PATH, dtype=str, na_filter=False)
+        if not os.path.exists(SUBSCRIPTION_JOB_EVENTS_PATH):
+            return jobs
+
+        fields = ["job_id", *SUBSCRIPTION_JOB_STATE_FIELDS]
+        with open(SUBSCRIPTION_JOB_EVENTS_PATH, newline="", encoding="utf-8") as f:
+            # 기록 중 중단되어 필드가 모자란 마지막 줄은 건너뛴다.
+            rows = [
+                row
+                for row in csv.reader(f)
+                if len(row) == len(fields) and row != fields
+            ]
+        events = pd.DataFrame(rows, columns=fields).drop_duplicates(
+            "job_id", keep="last"
         )
+        jobs.loc[events["job_id"].astype(int), SUBSCRIPTION_JOB_STATE_FIELDS] = events[
+            SUBSCRIPTION_JOB_STATE_FIELDS
+        ].to_numpy()
+        return jobs
+
+    def _append_subscription_job_events(
+        self, jobs: pd.DataFrame, index: pd.Index
+    ) -> None:
+        """작업 테이블 전체를 다시 쓰지 않도록 바뀐 작업들의 상태만 기록에 덧붙입니다."""
+        is_new = not os.path.exists(SUBSCRIPTION_JOB_EVENTS_PATH)
+        with open(SUBSCRIPTION_JOB_EVENTS_PATH, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            if is_new:
+                writer.writerow(["job_id", *SUBSCRIPTION_JOB_STATE_FIELDS])
+            writer.writerows(
+                [job_id, *state]
+                for job_id, state in zip(
+                    index,
+                    jobs.loc[index, SUBSCRIPTION_JOB_STATE_FIELDS].itertuples(
+                        index=False
+                    ),
+                )
+            )
 
-        # 슬랙은 메시지 전송을 초당 1개를 권장하기 때문에 1초 대기합니다.
-        # 참고문서: https://api.slack.com/methods/chat.postMessage#rate_limiting
-        await asyncio.sleep(1)
+    def _write_subscription_jobs(self, jobs: pd.DataFrame) -> None:
+        """작업 테이블을 저장합니다. 저장 중 중단되더라도 이전 파일이 깨지지 않도록 교체합니다."""
+        jobs.to_csv(f"{SUBSCRIPTION_JOBS_PATH}.tmp", index=False, quoting=csv.QUOTE_ALL)
+        os.replace(f"{SUBSCRIPTION_JOBS_PATH}.tmp", SUBSCRIPTION_JOBS_PATH)
+
+    def _get_subscription_digest_blocks(
+        self,
+        text: str,
+        messages: list[SubscriptionMessage],
+        permalinks: dict[tuple[str, str], str],
+    ) -> list[Block]:
+        """구독 알림 다이제스트 메시지의 블록을 반환합니다."""
+        blocks: list[Block] = [SectionBlock(text=text), DividerBlock()]
+        for message in messages:
+            blocks += [
+                SectionBlock(
+                    text=f"<@{message['target_user_id']}>님의 새 글",
+                ),
+                ContextBlock(
+                    elements=[
+                        TextObject(
+                            type="mrkdwn",
+                            text=f"글 제목 : {message['title']}\n제출 날짜 : {message['dt'][:4]}년 {int(message['dt'][5:7])}월 {int(message['dt'][8:10])}일",
+                        ),
+                    ],
+                ),
+                ActionsBlock(
+                    elements=[
+                        ButtonElement(
+                            text="글 보러가기",
+                            action_id="open_subscription_permalink",
+                            url=permalinks[
+                                (message["target_user_channel"], message["ts"])
+                            ],
+                            style="primary",
+                            value=dict_to_json_str(
+                                {
+                                    "user_id": message["user_id"],  # 구독자
+                                    "ts": message["ts"],  # 클릭한 콘텐츠 id
+                                }
+                            ),
+                        ),
+                        ButtonElement(
+                            text="감사의 종이비행기 보내기",
+                            action_id="send_paper_plane_message",
+                            value=message["target_user_id"],
+                        ),
+                    ]
+                ),
+            ]
+        return blocks
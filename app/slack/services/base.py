@@ -1,8 +1,6 @@
-from datetime import datetime, timedelta
 import random
 import re
 from typing import Any
-from zoneinfo import ZoneInfo
 
 import httpx
 from app.constants import URL_REGEX
@@ -15,7 +13,15 @@ from app.constants import paper_plane_color_maps
 
 from bs4 import BeautifulSoup
 
-from app.utils import tz_now, tz_now_to_str
+from app.search.result_cache import SearchResultCache
+from app.stats import UserStats
+from app.utils import tz_now_to_str
+
+
+# 글 검색 조건(키워드, 이름, 카테고리)별 검색 결과 캐시
+content_search_cache: SearchResultCache[tuple[models.ContentRecord, ...]] = (
+    SearchResultCache()
+)
 
 
 class SlackService:
@@ -28,8 +34,17 @@ class SlackService:
         keyword: str | None = None,
         name: str | None = None,
         category: str = "전체",
-    ) -> list[models.Content]:
+    ) -> list[models.ContentRecord]:
         """콘텐츠를 조건에 맞춰 가져옵니다."""
+        # 이름 검색은 유저 정보를 사용하므로 유저 저장소의 세대도 확인합니다.
+        generation = (
+            store.get_table_generation("contents"),
+            store.get_table_generation("users"),
+        )
+        cache_key = (keyword, name, category)
+        if (cached := content_search_cache.get(cache_key, generation)) is not None:
+            return list(cached)
+
         if keyword:
             contents = self._repo.fetch_contents_by_keyword(keyword)
         else:
@@ -42,6 +57,7 @@ class SlackService:
         if category != "전체":
             contents = [content for content in contents if content.category == category]
 
+        content_search_cache.set(cache_key, generation, tuple(contents))
         return contents
 
     def get_user(self, user_id) -> models.User:
@@ -239,7 +255,7 @@ class SlackService:
 
     def fetch_contents_by_ids(
         self, content_ids: list[str], keyword: str = ""
-    ) -> list[models.Content]:
+    ) -> list[models.ContentRecord]:
         """컨텐츠 아이디로 Contents 를 가져옵니다."""
         if keyword:
             contents = self._repo.fetch_contents_by_keyword(keyword)
@@ -272,7 +288,7 @@ class SlackService:
         self._repo.update_user_intro(user_id, new_intro)
 
     def fetch_users(self) -> list[models.User]:
-        users = [models.User(**user) for user in self._repo._fetch_users()]
+        users = [models.User.from_row(user) for user in self._repo._fetch_users()]
         return users
 
     def get_content_by(
@@ -377,30 +393,16 @@ class SlackService:
         store.paper_plane_upload_queue.append(model.to_list_for_sheet())
         return model
 
-    def fetch_current_week_paper_planes(
-        self,
-        user_id: str,
-    ) -> list[models.PaperPlane]:
-        """이번 주 종이비행기를 가져옵니다."""
-        today = tz_now()
-
-        # 지난주 토요일 00시 계산
-        last_saturday = today - timedelta(days=(today.weekday() + 2) % 7)
-        start_dt = last_saturday.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        # 이번주 금요일 23:59:59 계산
-        this_friday = start_dt + timedelta(days=6)
-        end_dt = this_friday.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        paper_planes = []
-        for plane in self._repo.fetch_paper_planes(sender_id=user_id):
-            plane_created_ad = datetime.fromisoformat(plane.created_at).replace(
-                tzinfo=ZoneInfo("Asia/Seoul")
-            )
-            if start_dt <= plane_created_ad <= end_dt:
-                paper_planes.append(plane)
+    def get_user_stats(self, user_id: str) -> UserStats:
+        """유저의 통계를 가져옵니다."""
+        user_stats = self._repo.get_user_stats(user_id)
+        if not user_stats:
+            raise BotException("해당 유저 정보가 없어요.")
+        return user_stats
 
-        return paper_planes
+    def count_current_week_paper_planes(self, user_id: str) -> int:
+        """이번 주에 보낸 종이비행기 수를 가져옵니다."""
+        return self._repo.count_current_week_paper_planes(sender_id=user_id)
 
     def fetch_subscriptions_by_user_id(
         self,
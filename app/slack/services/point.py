@@ -45,11 +45,7 @@ class PointMap(Enum):
 class UserPoint(BaseModel):
     user: User
     point_histories: list[PointHistory]
-    
-    @property
-    def total_point(self) -> int:
-        return sum([point_history.point for point_history in self.point_histories])
-
+    total_point: int  # 포인트 원장에서 가져온 총 포인트
 
     @property
     def point_history_text(self) -> str:
@@ -63,6 +59,12 @@ class UserPoint(BaseModel):
         return text
 
 
+class LeaderboardUser(BaseModel):
+    rank: int
+    user_id: str
+    name: str
+    total_point: int
+
 
 class PointService:
     def __init__(self, repo: SlackRepository) -> None:
@@ -74,7 +76,32 @@ class PointService:
         if not user:
             raise BotException("존재하지 않는 유저입니다.")
         point_histories = self._repo.fetch_point_histories(user_id)
-        return UserPoint(user=user, point_histories=point_histories)
+        total_point = self._repo.get_total_point(user_id)
+        return UserPoint(
+            user=user, point_histories=point_histories, total_point=total_point
+        )
+
+    def get_total_point(self, user_id: str) -> int:
+        """유저의 총 포인트를 가져옵니다."""
+        return self._repo.get_total_point(user_id)
+
+    def fetch_leaderboard(
+        self, limit: int, cohort: str | None = None, user_id: str | None = None
+    ) -> tuple[list[LeaderboardUser], int | None]:
+        """
+        총 포인트 상위 유저의 순위를 가져옵니다. cohort 가 주어지면 기수 내 순위를 가져옵니다.
+        user_id 가 주어지면 해당 유저의 순위(포인트 내역이 없다면 None)를 함께 가져옵니다.
+        """
+        leaderboard, rank = self._repo.fetch_point_leaderboard(limit, cohort, user_id)
+        return [
+            LeaderboardUser(
+                rank=entry.rank,
+                user_id=entry.user_id,
+                name=user.name,
+                total_point=entry.total_point,
+            )
+            for entry, user in leaderboard
+        ], rank
 
     def add_point_history(self, user_id: str, point_info: PointMap, point: int | None = None) -> str:
         """포인트 히스토리를 추가하고 알림 메시지를 반환합니다."""
@@ -136,31 +163,24 @@ class PointService:
 
     def grant_if_post_submitted_to_core_channel_ranking(self, user_id: str) -> str | None:
         """글 제출 포인트 지급 3. 코어채널 제출 순위에 따라 추가 포인트를 지급합니다."""
-        user = self._repo.get_user(user_id)
+        user = self._repo.get_only_user(user_id)
 
         if not user:
             raise BotException("유저 정보가 없어 글 제출 포인트를 지급할 수 없습니다.")
         
-        rank_map = {}
-        channel_users = self._repo.fetch_channel_users(user.channel_id)
-        for channel_user in channel_users:
-            if channel_user.is_submit is True:
-                content = channel_user.recent_content
-                rank_map[channel_user.user_id] = content.ts
-        
-        rank_user_ids = sorted(rank_map, key=lambda x: rank_map[x])[:3]
-        if user.user_id in rank_user_ids:
-            rank = rank_user_ids.index(user.user_id) + 1
-            if rank == 1:
-                point_info = PointMap.글_제출_코어채널_1등
-            elif rank == 2:
-                point_info = PointMap.글_제출_코어채널_2등
-            else:
-                point_info = PointMap.글_제출_코어채널_3등
-
-            return self.add_point_history(user_id, point_info)
-        
-        return None
+        # 채널, 회차별 첫 제출 순서 색인에서 순위를 바로 찾는다.
+        rank = self._repo.get_submission_rank(user.user_id, user.channel_id)
+        if rank is None or rank > 3:
+            return None
+
+        if rank == 1:
+            point_info = PointMap.글_제출_코어채널_1등
+        elif rank == 2:
+            point_info = PointMap.글_제출_코어채널_2등
+        else:
+            point_info = PointMap.글_제출_코어채널_3등
+
+        return self.add_point_history(user_id, point_info)
 
     def grant_if_coffee_chat_verified(self, user_id: str) -> str:
         """
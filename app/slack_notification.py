@@ -1,4 +1,5 @@
 from app.logging import logger
+from app.slack.dispatcher import Priority, slack_dispatcher
 
 
 from slack_sdk.web.async_client import AsyncWebClient
@@ -11,15 +12,32 @@ async def send_point_noti_message(
     client: AsyncWebClient,
     channel: str,
     text: str,
+    priority: Priority = Priority.INTERACTIVE,
     **kwargs: Any,
 ) -> None:
     """포인트 알림 메시지를 전송합니다."""
     try:
-        await client.chat_postMessage(channel=channel, text=text)
-    except Exception as e:
-        kwargs_str = ", ".join([f"{k}: {v}" for k, v in kwargs.items()])
-        text = text.replace("\n", " ")
-        logger.error(
-            f"포인트 알림 전송 에러 👉 error: {str(e)} :: channel(user_id): {channel} text: {text} {kwargs_str}"
+        await slack_dispatcher.post_message(
+            client, priority, channel=channel, text=text
         )
-        pass
+    except Exception as e:
+        _log_point_noti_error(e, channel, text, **kwargs)
+
+
+async def send_point_noti_messages(
+    client: AsyncWebClient,
+    messages: list[dict[str, str]],
+) -> None:
+    """여러 포인트 알림 메시지(channel, text)를 대량 DM 우선순위로 동시에 전송합니다."""
+    errors = await slack_dispatcher.post_messages(client, messages)
+    for message, error in zip(messages, errors):
+        if error is not None:
+            _log_point_noti_error(error, message["channel"], message["text"])
+
+
+def _log_point_noti_error(e: Exception, channel: str, text: str, **kwargs: Any) -> None:
+    kwargs_str = ", ".join([f"{k}: {v}" for k, v in kwargs.items()])
+    text = text.replace("\n", " ")
+    logger.error(
+        f"포인트 알림 전송 에러 👉 error: {str(e)} :: channel(user_id): {channel} text: {text} {kwargs_str}"
+    )
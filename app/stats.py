@@ -0,0 +1,73 @@
+from pydantic import BaseModel
+
+from app import models
+from app.submission import get_round_calendar
+from app.utils import tz_now
+
+
+class UserStats(BaseModel):
+    user_id: str
+    pass_count: int  # 패스 횟수
+    submit_status: dict[int, str]  # 현재 회차를 제외한 회차별 제출 여부
+    continuous_submit_count: int  # 연속 제출 횟수
+
+    @property
+    def not_submitted_count(self) -> int:
+        """미제출 회차 수를 반환합니다."""
+        return list(self.submit_status.values()).count("미제출")
+
+
+# 유저 아이디별 통계 캐시
+# 저장소에 쓰는 시점에 해당 유저의 통계를 갱신하고, 회차가 바뀌거나 저장소를 동기화하면 모두 비웁니다.
+user_stats_cache: dict[str, UserStats] = {}
+_cached_round: int | None = None
+
+
+def _get_current_round() -> int:
+    """현재 회차를 반환합니다."""
+    calendar = get_round_calendar(models.DUE_DATES)
+    return calendar.get_round(tz_now().date())
+
+
+def get_user_stats(user_id: str) -> UserStats | None:
+    """캐시된 유저 통계를 반환합니다. 회차가 바뀌었다면 캐시를 비웁니다."""
+    global _cached_round
+    current_round = _get_current_round()
+    if _cached_round != current_round:
+        user_stats_cache.clear()
+        _cached_round = current_round
+    return user_stats_cache.get(user_id)
+
+
+def set_user_stats(user: models.User) -> UserStats:
+    """유저의 통계를 계산하여 캐시합니다."""
+    submission_matrix = models.build_submission_matrix([user])
+    stats = UserStats(
+        user_id=user.user_id,
+        pass_count=user.pass_count,
+        submit_status=submission_matrix.get_submit_status(user.user_id),
+        continuous_submit_count=submission_matrix.get_continuous_submit_count(
+            user.user_id
+        ),
+    )
+    user_stats_cache[user.user_id] = stats
+    return stats
+
+
+def update_contents(user: models.User) -> None:
+    """유저의 콘텐츠가 추가되면 콘텐츠 통계를 갱신합니다."""
+    stats = user_stats_cache.get(user.user_id)
+    if not stats:
+        return
+
+    submission_matrix = models.build_submission_matrix([user])
+    stats.pass_count = user.pass_count
+    stats.submit_status = submission_matrix.get_submit_status(user.user_id)
+    stats.continuous_submit_count = submission_matrix.get_continuous_submit_count(
+        user.user_id
+    )
+
+
+def clear_user_stats() -> None:
+    """모든 유저 통계 캐시를 비웁니다."""
+    user_stats_cache.clear()
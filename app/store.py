@@ -2,6 +2,7 @@ import asyncio
 import csv
 import os
 from typing import Any
+from app import stats
 from app.client import SpreadSheetClient
 from app.logging import log_event
 from app.models import Bookmark
@@ -19,6 +20,15 @@ subscription_upload_queue: list[list[str]] = []
 subscription_update_queue: list[dict[str, Any]] = []
 
 
+def get_table_generation(table_name: str) -> tuple[int, int]:
+    """
+    저장소 파일의 세대를 (수정 시각, 크기)로 반환합니다.
+    세대가 바뀌었다면 파일 내용이 바뀐 것으로 판단합니다.
+    """
+    stat = os.stat(f"store/{table_name}.csv")
+    return stat.st_mtime_ns, stat.st_size
+
+
 class Store:
     def __init__(self, client: SpreadSheetClient) -> None:
         self._client = client
@@ -79,6 +89,9 @@ class Store:
             writer = csv.writer(f, quoting=csv.QUOTE_ALL)
             writer.writerows(values)
 
+        # 동기화된 데이터로 다시 계산하도록 통계 캐시를 비웁니다.
+        stats.clear_user_stats()
+
     def read(self, table_name: str) -> list[list[str]]:
         """저장소에서 데이터를 읽어옵니다."""
         with open(f"store/{table_name}.csv") as f:
@@ -0,0 +1,261 @@
+import bisect
+import datetime
+from enum import IntEnum
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+import numpy as np
+
+
+class SubmitStatus(IntEnum):
+    NOT_SUBMITTED = 0
+    SUBMIT = 1
+    PASS = 2
+
+    @property
+    def label(self) -> str:
+        return _STATUS_LABELS[self]
+
+
+_STATUS_LABELS = {
+    SubmitStatus.NOT_SUBMITTED: "미제출",
+    SubmitStatus.SUBMIT: "제출",
+    SubmitStatus.PASS: "패스",
+}
+
+_TYPE_TO_STATUS = {
+    "submit": SubmitStatus.SUBMIT,
+    "pass": SubmitStatus.PASS,
+}
+
+
+class RoundCalendar:
+    """
+    오름차순 마감일 리스트로 회차를 계산합니다.
+    n회차는 n-1회차 마감일 초과, n회차 마감일 이하의 기간입니다.
+    """
+
+    def __init__(self, due_dates: Sequence[datetime.date]) -> None:
+        self.due_dates = tuple(due_dates)
+        self._due_days = np.array(self.due_dates, dtype="datetime64[D]")
+
+    def __len__(self) -> int:
+        return len(self.due_dates)
+
+    def get_round(self, date: datetime.date) -> int:
+        """날짜가 속한 회차를 반환합니다. 마지막 마감일 이후라면 마감일 수를 반환합니다."""
+        return bisect.bisect_left(self.due_dates, date)
+
+    def get_rounds(self, days: np.ndarray) -> np.ndarray:
+        """datetime64[D] 배열의 회차를 한 번에 계산합니다."""
+        return np.searchsorted(self._due_days, days, side="left")
+
+    def is_in_season(self, round: int) -> bool:
+        """글또 활동 기간(마지막 마감일 이하)의 회차인지 여부를 반환합니다."""
+        return round < len(self.due_dates)
+
+
+@lru_cache(maxsize=8)
+def _get_round_calendar(due_dates: tuple[datetime.date, ...]) -> RoundCalendar:
+    return RoundCalendar(due_dates)
+
+
+def get_round_calendar(due_dates: Sequence[datetime.date]) -> RoundCalendar:
+    """마감일 리스트에 해당하는 회차 계산기를 반환합니다. 같은 마감일이라면 재사용합니다."""
+    return _get_round_calendar(tuple(due_dates))
+
+
+class SubmissionMatrix:
+    """
+    유저별, 회차별 제출 상태 행렬입니다.
+    - 행은 유저, 열은 회차(0회차 ~ 마지막 회차 이후)입니다.
+    - 같은 회차에 여러 콘텐츠가 있다면 가장 마지막 콘텐츠로 상태를 판단합니다.
+    - 기준일 이후의 콘텐츠는 반영하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        user_ids: Sequence[str],
+        statuses: np.ndarray,
+        calendar: RoundCalendar,
+        now_date: datetime.date,
+    ) -> None:
+        self.user_ids = list(user_ids)
+        self.statuses = statuses
+        self.calendar = calendar
+        self.now_date = now_date
+        self.current_round = calendar.get_round(now_date)
+        self._rows = {user_id: row for row, user_id in enumerate(self.user_ids)}
+
+    @classmethod
+    def from_columns(
+        cls,
+        user_ids: Sequence[str],
+        content_user_ids: Iterable[str],
+        content_dts: Iterable[str],
+        content_types: Iterable[str],
+        *,
+        due_dates: Sequence[datetime.date],
+        now_date: datetime.date,
+    ) -> "SubmissionMatrix":
+        """
+        콘텐츠 컬럼으로 제출 상태 행렬을 생성합니다.
+        콘텐츠는 생성일시 오름차순이어야 합니다. (저장소의 콘텐츠는 추가된 순서입니다.)
+        """
+        calendar = get_round_calendar(due_dates)
+        n_rounds = len(calendar) + 1  # 마지막 회차 이후 열을 포함합니다.
+        rows_by_user_id = {user_id: row for row, user_id in enumerate(user_ids)}
+
+        rows: list[int] = []
+        days: list[str] = []
+        statuses: list[int] = []
+        for user_id, dt, type in zip(content_user_ids, content_dts, content_types):
+            row = rows_by_user_id.get(user_id)
+            if row is None:
+                continue
+            rows.append(row)
+            days.append(dt[:10])  # "%Y-%m-%d %H:%M:%S" 형식의 날짜 부분
+            statuses.append(_TYPE_TO_STATUS.get(type, SubmitStatus.NOT_SUBMITTED))
+
+        matrix = np.zeros((len(rows_by_user_id), n_rounds), dtype=np.int8)
+        content_days = np.array(days, dtype="datetime64[D]")
+        in_range = content_days <= np.datetime64(now_date, "D")
+        cells = (
+            np.array(rows, dtype=np.int64) * n_rounds
+            + calendar.get_rounds(content_days)
+        )[in_range]
+        values = np.array(statuses, dtype=np.int8)[in_range]
+
+        if cells.size:
+            # 같은 셀에 여러 콘텐츠가 있다면 마지막 콘텐츠만 남깁니다.
+            order = np.argsort(cells, kind="stable")
+            sorted_cells = cells[order]
+            is_last = np.append(sorted_cells[1:] != sorted_cells[:-1], True)
+            matrix.flat[sorted_cells[is_last]] = values[order][is_last]
+
+        return cls(user_ids, matrix, calendar, now_date)
+
+    def _row(self, user_id: str) -> np.ndarray | None:
+        row = self._rows.get(user_id)
+        if row is None:
+            return None
+        return self.statuses[row]
+
+    @property
+    def past_rounds(self) -> range:
+        """제출 여부가 확정된 회차(현재 회차 제외, 0회차 제외)를 반환합니다."""
+        last_round = min(self.current_round, len(self.calendar))
+        return range(1, last_round)
+
+    def get_submit_status(self, user_id: str) -> dict[int, str]:
+        """현재 회차는 제외한 회차별 제출 여부를 반환합니다."""
+        row = self._row(user_id)
+        return {
+            round: SubmitStatus(row[round] if row is not None else 0).label
+            for round in self.past_rounds
+        }
+
+    def get_continuous_submit_count(self, user_id: str) -> int:
+        """내림차순으로 연속으로 제출한 횟수를 반환합니다."""
+        row = self._row(user_id)
+        if row is None:
+            return 0
+
+        count = 0
+        for round in reversed(self.past_rounds):
+            if row[round] == SubmitStatus.SUBMIT:
+                count += 1
+            elif row[round] == SubmitStatus.PASS:
+                # 패스는 연속 제출 횟수에 포함하지 않는다.
+                continue
+            else:  # 미제출은 연속 제출 횟수를 끊는다.
+                break
+        return count
+
+    def count_not_submitted(self, user_id: str) -> int:
+        """현재 회차를 제외한 미제출 회차 수를 반환합니다."""
+        return list(self.get_submit_status(user_id).values()).count("미제출")
+
+    def is_submit(self, user_id: str) -> bool:
+        """현재 회차의 제출여부를 반환합니다."""
+        if not 0 < self.current_round < len(self.calendar):
+            return False
+        row = self._row(user_id)
+        return row is not None and row[self.current_round] == SubmitStatus.SUBMIT
+
+    def fetch_unsubmitted_user_ids(self) -> list[str]:
+        """현재 회차를 제출하지 않은 유저 아이디를 반환합니다."""
+        if not 0 < self.current_round < len(self.calendar):
+            return list(self.user_ids)
+        submitted = self.statuses[:, self.current_round] == SubmitStatus.SUBMIT
+        return [
+            user_id
+            for user_id, is_submit in zip(self.user_ids, submitted.tolist())
+            if not is_submit
+        ]
+
+
+class SubmissionOrderIndex:
+    """
+    (채널 아이디, 회차) 별 첫 제출 순서 색인입니다.
+    - 유저가 회차에 처음 제출한 순서대로 순위(1부터)를 가지고 있습니다.
+    - 같은 회차에 다시 제출하거나 패스해도 첫 제출 순위는 바뀌지 않습니다.
+    - 저장소 세대(generation)나 마감일이 바뀌면 다시 생성하고, 글을 제출하면 증분으로 추가합니다.
+    """
+
+    def __init__(self) -> None:
+        self.generation: tuple[tuple[int, int], tuple[int, int]] | None = None
+        self.calendar: RoundCalendar | None = None
+        self._orders: dict[tuple[str, int], dict[str, int]] = {}
+
+    def build(
+        self,
+        channel_ids: dict[str, str],
+        contents: Iterable[tuple[str, str, str]],
+        calendar: RoundCalendar,
+        generation: tuple[tuple[int, int], tuple[int, int]],
+    ) -> None:
+        """
+        유저 아이디별 채널 아이디와 (유저 아이디, 생성일시, 타입) 콘텐츠로 색인을 새로 생성합니다.
+        콘텐츠는 생성일시 오름차순이어야 합니다. (저장소의 콘텐츠는 추가된 순서입니다.)
+        """
+        self._orders = {}
+        self.calendar = calendar
+        for user_id, dt, type in contents:
+            if channel_id := channel_ids.get(user_id):
+                self._add(channel_id, user_id, dt, type)
+        self.generation = generation
+
+    def add(
+        self,
+        channel_id: str,
+        user_id: str,
+        dt: str,
+        type: str,
+        *,
+        from_generation: tuple[tuple[int, int], tuple[int, int]],
+        to_generation: tuple[tuple[int, int], tuple[int, int]],
+    ) -> None:
+        """
+        새로 추가한 콘텐츠를 색인에 반영합니다.
+        색인이 추가 전 저장소 세대와 다르다면 다음 조회 때 다시 생성하도록 그대로 둡니다.
+        """
+        if self.generation != from_generation:
+            return
+        self._add(channel_id, user_id, dt, type)
+        self.generation = to_generation
+
+    def _add(self, channel_id: str, user_id: str, dt: str, type: str) -> None:
+        if type != "submit" or self.calendar is None:
+            return
+        # dt 는 "%Y-%m-%d %H:%M:%S" 형식이므로 날짜 부분으로 회차를 계산합니다.
+        round = self.calendar.get_round(datetime.date.fromisoformat(dt[:10]))
+        order = self._orders.setdefault((channel_id, round), {})
+        order.setdefault(user_id, len(order) + 1)
+
+    def get_rank(self, channel_id: str, round: int, user_id: str) -> int | None:
+        """채널에서 회차에 첫 제출한 순위를 반환합니다. 제출하지 않았다면 None 을 반환합니다."""
+        return self._orders.get((channel_id, round), {}).get(user_id)
+
+
+submission_order_index = SubmissionOrderIndex()
@@ -0,0 +1,212 @@
+import asyncio
+import csv
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import NamedTuple, Protocol
+
+import googletrans
+
+from app.logging import log_event
+from app.utils import is_english
+
+
+class Translator(Protocol):
+    def translate(self, text: str, dest: str) -> str:
+        """text 를 dest 언어로 번역합니다."""
+        ...
+
+
+class TranslatedKeywords(NamedTuple):
+    keywords: list[str]
+    # 제한 시간 안에 번역하지 못했거나 번역에 실패한 키워드가 있는지 여부
+    is_degraded: bool
+
+
+class GoogleTranslator:
+    """구글 번역기입니다. 번역 요청은 네트워크를 사용하는 동기 함수입니다."""
+
+    def __init__(self) -> None:
+        self._translator = googletrans.Translator()
+
+    def translate(self, text: str, dest: str) -> str:
+        return self._translator.translate(text, dest=dest).text
+
+
+class DictionaryTranslator:
+    """사전으로 번역하는 번역기입니다. 사전에 없는 단어는 그대로 반환합니다."""
+
+    def __init__(self, dictionary: dict[str, str]) -> None:
+        self._dictionary = dictionary
+
+    def translate(self, text: str, dest: str) -> str:
+        return self._dictionary.get(text, text)
+
+
+class TranslationCache:
+    """
+    (키워드, 번역 언어)별 번역 결과를 저장하는 LRU 캐시입니다.
+    - 유효기간(ttl)이 지난 번역은 사용하지 않습니다.
+    - 파일에 저장해 두고 서버가 재시작되면 다시 불러옵니다.
+    """
+
+    def __init__(self, path: str, max_size: int = 1000, ttl: int = 60 * 60 * 24 * 30):
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl  # 초
+        self._cache: OrderedDict[tuple[str, str], tuple[str, float]] | None = None
+
+    def _load(self) -> OrderedDict[tuple[str, str], tuple[str, float]]:
+        if self._cache is None:
+            self._cache = OrderedDict()
+            if os.path.exists(self.path):
+                with open(self.path, newline="", encoding="utf-8") as f:
+                    for row in csv.reader(f):
+                        # 형식이 맞지 않는 행은 건너뛴다.
+                        try:
+                            keyword, dest, text, expires_at = row
+                            self._cache[(keyword, dest)] = (text, float(expires_at))
+                        except ValueError:
+                            continue
+        return self._cache
+
+    def get(self, keyword: str, dest: str) -> str | None:
+        """캐시된 번역을 반환합니다. 없거나 유효기간이 지났다면 None 을 반환합니다."""
+        cache = self._load()
+        value = cache.get((keyword, dest))
+        if value is None:
+            return None
+
+        text, expires_at = value
+        if expires_at < time.time():
+            del cache[(keyword, dest)]
+            return None
+
+        cache.move_to_end((keyword, dest))
+        return text
+
+    def set(self, keyword: str, dest: str, text: str) -> None:
+        """번역을 캐시합니다. 최대 크기를 넘으면 가장 오래 사용하지 않은 번역을 지웁니다."""
+        cache = self._load()
+        cache[(keyword, dest)] = (text, time.time() + self.ttl)
+        cache.move_to_end((keyword, dest))
+        while len(cache) > self.max_size:
+            cache.popitem(last=False)
+
+    def dump(self) -> list[list[str]]:
+        """파일에 저장할 행을 반환합니다. 오래 사용하지 않은 번역부터 반환합니다."""
+        return [
+            [keyword, dest, text, str(expires_at)]
+            for (keyword, dest), (text, expires_at) in self._load().items()
+        ]
+
+    def write(self, rows: list[list[str]]) -> None:
+        """행을 파일에 저장합니다. 저장 중 중단되더라도 이전 파일이 깨지지 않도록 교체합니다."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".")
+        with open(fd, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f, quoting=csv.QUOTE_ALL).writerows(rows)
+        os.replace(tmp_path, self.path)
+
+    def save(self) -> None:
+        """캐시를 파일에 저장합니다."""
+        self.write(self.dump())
+
+
+translation_cache = TranslationCache("store/_translations.csv")
+_translator: Translator | None = None
+# 제한 시간이 지난 뒤에도 진행 중인 번역 작업입니다. 작업이 끝날 때까지 참조를 유지합니다.
+_background_tasks: set[asyncio.Task[str]] = set()
+
+
+def get_translator() -> Translator:
+    """번역기를 반환합니다. 번역기를 설정하지 않았다면 구글 번역기를 사용합니다."""
+    global _translator
+    if _translator is None:
+        _translator = GoogleTranslator()
+    return _translator
+
+
+def set_translator(translator: Translator) -> None:
+    """번역기를 교체합니다. 예) 테스트에서 DictionaryTranslator 사용"""
+    global _translator
+    _translator = translator
+
+
+async def translate_keywords(
+    keywords: list[str], timeout: float = 1.0
+) -> TranslatedKeywords:
+    """
+    키워드를 번역합니다.
+    - 영어는 한글로, 한글은 영어로 번역합니다. 둘 다 아니면 번역하지 않습니다.
+    - 캐시에 없는 키워드는 동시에 번역하고, timeout 초 안에 번역하지 못한 키워드는 제외합니다.
+    - 제외한 키워드도 번역이 끝나면 캐시하여 다음 검색에서 사용합니다.
+    - 제외한 키워드가 있다면 is_degraded 를 True 로 반환합니다.
+    """
+    results: dict[tuple[str, str], str] = {}
+    is_degraded = False
+    misses: list[tuple[str, str]] = []
+    for keyword in dict.fromkeys(keywords):
+        value = is_english(keyword)
+        if value is None:
+            continue
+
+        # 영어 -> 한글 번역, 한글이 없는 단어는 그대로 영어가 나올 수 있음.
+        dest = "ko" if value else "en"
+        if (text := translation_cache.get(keyword, dest)) is not None:
+            results[(keyword, dest)] = text
+        else:
+            misses.append((keyword, dest))
+
+    if misses:
+        translator = get_translator()
+        tasks = []
+        for keyword, dest in misses:
+            task = asyncio.create_task(
+                asyncio.to_thread(translator.translate, keyword, dest)
+            )
+            # 제한 시간이 지나도 번역이 끝나면 다음 검색을 위해 캐시한다.
+            task.add_done_callback(partial(_cache_translation, keyword, dest))
+            tasks.append(task)
+
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for (keyword, dest), task in zip(misses, tasks):
+            # 번역에 실패했거나 늦어지면 번역 없이 검색합니다.
+            if task in done and task.exception() is None:
+                results[(keyword, dest)] = task.result().lower()
+            else:
+                is_degraded = True
+
+        if pending:
+            _background_tasks.update(pending)
+            asyncio.gather(*pending, return_exceptions=True).add_done_callback(
+                _save_translations
+            )
+        else:
+            await asyncio.to_thread(translation_cache.write, translation_cache.dump())
+
+    return TranslatedKeywords(list(results.values()), is_degraded)
+
+
+def _cache_translation(keyword: str, dest: str, task: asyncio.Task[str]) -> None:
+    """번역 작업이 끝나면 결과를 캐시합니다. 실패했다면 기록만 남깁니다."""
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    if (error := task.exception()) is not None:
+        log_event(
+            actor="translator",
+            event="번역 실패",
+            type="translation",
+            description=f"{keyword} -> {dest}: {error!r}",
+        )
+        return
+    translation_cache.set(keyword, dest, task.result().lower())
+
+
+def _save_translations(_: asyncio.Future) -> None:
+    """제한 시간이 지난 뒤에 끝난 번역까지 반영하여 캐시를 파일에 저장합니다."""
+    asyncio.get_running_loop().run_in_executor(
+        None, translation_cache.write, translation_cache.dump()
+    )
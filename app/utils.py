@@ -8,12 +8,13 @@ import datetime
 
 from zoneinfo import ZoneInfo
 
-import googletrans
+
+SEOUL_TZ = ZoneInfo("Asia/Seoul")
 
 
 def tz_now(tz: str = "Asia/Seoul") -> datetime.datetime:
     """현재시간 반환합니다."""
-    return datetime.datetime.now(tz=ZoneInfo(tz))
+    return datetime.datetime.now(tz=SEOUL_TZ if tz == "Asia/Seoul" else ZoneInfo(tz))
 
 
 def tz_now_to_str(tz: str = "Asia/Seoul") -> str:
@@ -21,6 +22,16 @@ def tz_now_to_str(tz: str = "Asia/Seoul") -> str:
     return datetime.datetime.strftime(tz_now(tz), "%Y-%m-%d %H:%M:%S")
 
 
+def str_to_dt(value: str) -> datetime.datetime:
+    """'%Y-%m-%d %H:%M:%S' 형식의 문자열을 서울 시간대의 datetime 객체로 반환합니다."""
+    try:
+        # fromisoformat 이 strptime 보다 훨씬 빠르기 때문에 먼저 시도합니다.
+        dt = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        dt = datetime.datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+    return dt.replace(tzinfo=SEOUL_TZ)
+
+
 def generate_unique_id() -> str:
     """고유한 ID를 생성합니다."""
     # 무작위 문자열 6자리 + 밀리 세컨즈(문자로 치환된)
@@ -38,22 +49,6 @@ def is_english(text):
         return None
 
 
-def translate_keywords(keywords: list[str]) -> list[str]:
-    """키워드를 번역합니다."""
-    translator = googletrans.Translator()
-    results = []
-    for keyword in keywords:
-        value = is_english(keyword)
-        if value is True:
-            # 영어 -> 한글 번역, 한글이 없는 단어는 그대로 영어가 나올 수 있음.
-            results.append(translator.translate(keyword, dest="ko").text.lower())
-        elif value is False:
-            results.append(translator.translate(keyword, dest="en").text.lower())
-        else:
-            continue
-    return results
-
-
 def remove_emoji(message: str) -> str:
     """이모지를 제거합니다."""
     emoji_code_pattern = re.compile(r":[a-zA-Z0-9_\-]+:|:\p{Script=Hangul}+:")
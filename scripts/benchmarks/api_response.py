@@ -0,0 +1,72 @@
+"""
+종이비행기 1,000개 응답의 직렬화 시간과 크기를 비교합니다.
+- 기존: response_model 로 다시 검증한 뒤 표준 json 으로 직렬화합니다. (FastAPI 기본 경로)
+- 개선: 이미 검증한 dict 를 orjson 으로 바로 직렬화합니다.
+
+실행: PYTHONPATH=. python scripts/benchmarks/api_response.py
+"""
+
+import asyncio
+import gzip
+import timeit
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api import dto
+from app.models import PaperPlane
+
+N = 1_000
+
+
+def make_paper_planes(n: int) -> list[dict]:
+    return [
+        PaperPlane(
+            sender_id=f"U{i % 50}",
+            sender_name="글또",
+            receiver_id=f"U{(i + 1) % 50}",
+            receiver_name="또봇",
+            text="항상 좋은 글 감사합니다! 이번 글도 잘 읽었어요. " * 3,
+            text_color="#FFFFFF",
+            bg_color="blush_rosybrown",
+            color_label="#BC8F8F",
+        ).model_dump()
+        for i in range(n)
+    ]
+
+
+response_field = create_response_field(
+    name="Response_fetch_sent_paper_planes", type_=dto.PaperPlaneResponse
+)
+
+
+def render_default(data: list[dict]) -> bytes:
+    content = dto.PaperPlaneResponse(count=len(data), data=data, next_cursor=None)
+    serialized = asyncio.run(
+        serialize_response(field=response_field, response_content=content)
+    )
+    return JSONResponse(serialized).body
+
+
+def render_orjson(data: list[dict]) -> bytes:
+    return ORJSONResponse({"count": len(data), "data": data, "next_cursor": None}).body
+
+
+def main() -> None:
+    data = make_paper_planes(N)
+    before = timeit.timeit(lambda: render_default(data), number=20) / 20
+    after = timeit.timeit(lambda: render_orjson(data), number=20) / 20
+    body = render_orjson(data)
+    # GZipMiddleware 의 기본 압축 레벨은 9 입니다.
+    compressed = gzip.compress(body, compresslevel=9)
+
+    print(f"paper planes: {N}")
+    print(f"validate + json : {before * 1000:8.2f} ms")
+    print(f"orjson          : {after * 1000:8.2f} ms")
+    print(f"payload         : {len(body) / 1024:8.1f} KiB")
+    print(f"payload (gzip)  : {len(compressed) / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
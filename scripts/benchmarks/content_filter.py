@@ -0,0 +1,83 @@
+"""
+콘텐츠 10만 개에서 직군을 구하고 키워드가 포함된 콘텐츠를 찾는 시간을 비교합니다.
+- 기존: 행마다 파이썬 함수를 호출합니다. (apply)
+- 개선: polars 표현식으로 한 번에 계산합니다.
+
+실행: PYTHONPATH=. python scripts/benchmarks/content_filter.py
+"""
+
+import random
+import timeit
+
+import polars as pl
+
+from app.constants import JobCategoryEnum
+from app.search.frame import job_category_expr
+
+N = 100_000
+KEYWORDS = ["파이썬", "c++", "node.js"]
+WORDS = ["파이썬", "비동기", "회고", "c++", "node.js", "python", "데이터", "정리"]
+
+
+def make_df(n: int) -> pl.DataFrame:
+    random.seed(0)
+    categories = [category.value for category in JobCategoryEnum]
+    return pl.DataFrame(
+        {
+            "title": [" ".join(random.sample(WORDS, 3)) for _ in range(n)],
+            "content_url": [f"https://example.com/posts/{i}" for i in range(n)],
+            "tags": [",".join(random.sample(WORDS, 2)) for _ in range(n)],
+            "name": [f"글또{i % 500}" for i in range(n)],
+            "channel_name": [f"1_{random.choice(categories)}_1" for _ in range(n)],
+        }
+    )
+
+
+def match_with_apply(df: pl.DataFrame) -> int:
+    job_categories = [category.value for category in JobCategoryEnum]
+    df = df.with_columns(
+        pl.col("channel_name")
+        .apply(lambda x: next((cat for cat in job_categories if cat in x), None))
+        .alias("job_category")
+    )
+    matched_dfs = [
+        df.filter(
+            df.apply(
+                lambda row: keyword in f"{row[0]},{row[2]},{row[3]}".lower()
+            ).to_series()
+        )
+        for keyword in KEYWORDS
+    ]
+    return len(pl.concat(matched_dfs))
+
+
+def match_with_expr(df: pl.DataFrame) -> int:
+    search_text = pl.concat_str(
+        [pl.col("title"), pl.col("tags"), pl.col("name")], separator=","
+    ).str.to_lowercase()
+    df = df.with_columns(
+        job_category_expr(pl.col("channel_name").str.to_lowercase()).alias(
+            "job_category"
+        ),
+        search_text.alias("search_text"),
+    )
+    matched_dfs = [
+        df.filter(pl.col("search_text").str.contains(keyword, literal=True))
+        for keyword in KEYWORDS
+    ]
+    return len(pl.concat(matched_dfs))
+
+
+def main() -> None:
+    df = make_df(N)
+    assert match_with_apply(df) == match_with_expr(df)
+    before = timeit.timeit(lambda: match_with_apply(df), number=3) / 3
+    after = timeit.timeit(lambda: match_with_expr(df), number=3) / 3
+
+    print(f"contents: {N}, keywords: {KEYWORDS}")
+    print(f"apply      : {before * 1000:8.1f} ms")
+    print(f"expression : {after * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+콘텐츠 10만 개를 메모리에 올렸을 때 객체가 차지하는 크기를 측정합니다.
+문자열은 두 방식이 공유하므로 객체 자체의 크기만 비교합니다.
+
+실행: PYTHONPATH=. python scripts/benchmarks/content_memory.py
+"""
+
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+from app.models import Content, ContentRecord
+
+N = 100_000
+
+
+def make_rows(n: int) -> list[dict[str, str]]:
+    return [
+        {
+            "user_id": f"U{i % 500}",
+            "username": "글또",
+            "title": f"글 제목 {i}",
+            "content_url": f"https://example.com/posts/{i}",
+            "dt": "2024-10-13 21:30:00",
+            "category": "기술 & 언어",
+            "description": "",
+            "type": "submit",
+            "tags": "python,performance",
+            "curation_flag": "N",
+            "ts": f"1728822600.{i:06d}",
+        }
+        for i in range(n)
+    ]
+
+
+def measure(build: Callable[[], list[Any]]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main() -> None:
+    rows = make_rows(N)
+    content = measure(lambda: [Content(**row) for row in rows])
+    trusted = measure(lambda: [Content.from_row(row) for row in rows])
+    record = measure(lambda: [ContentRecord(**row) for row in rows])
+
+    print(f"contents: {N}")
+    print(f"Content(**row)       : {content / 2**20:6.1f} MiB")
+    print(f"Content.from_row     : {trusted / 2**20:6.1f} MiB")
+    print(f"ContentRecord        : {record / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+콘텐츠 5만 개를 생성일시로 정렬하는 시간을 측정합니다.
+
+실행: PYTHONPATH=. python scripts/benchmarks/content_sort.py
+"""
+
+import datetime
+import random
+import timeit
+from zoneinfo import ZoneInfo
+
+from app.models import Content
+
+N = 50_000
+REPEAT = 5
+
+
+def make_contents(n: int) -> list[Content]:
+    start = datetime.datetime(2024, 9, 29)
+    return [
+        Content(
+            dt=(
+                start + datetime.timedelta(seconds=random.randrange(10_000_000))
+            ).strftime("%Y-%m-%d %H:%M:%S"),
+            user_id=f"U{i % 500}",
+            username="글또",
+            type="submit",
+            ts=str(i),
+        )
+        for i in range(n)
+    ]
+
+
+def parse_every_access(content: Content) -> datetime.datetime:
+    """변경 전 Content.dt_ 와 같이 접근할 때마다 변환합니다."""
+    return datetime.datetime.strptime(content.dt, "%Y-%m-%d %H:%M:%S").replace(
+        tzinfo=ZoneInfo("Asia/Seoul")
+    )
+
+
+def main() -> None:
+    random.seed(0)
+    contents = make_contents(N)
+
+    before = min(
+        timeit.repeat(
+            lambda: sorted(contents, key=parse_every_access), number=1, repeat=REPEAT
+        )
+    )
+    # 처음 정렬할 때 한 번 변환하고, 이후 정렬은 캐시된 값을 사용합니다.
+    first = timeit.timeit(
+        lambda: sorted(contents, key=lambda content: content.dt_), number=1
+    )
+    after = min(
+        timeit.repeat(
+            lambda: sorted(contents, key=lambda content: content.dt_),
+            number=1,
+            repeat=REPEAT,
+        )
+    )
+
+    print(f"contents: {N}")
+    print(f"strptime per access : {before * 1000:8.1f} ms")
+    print(f"cached (first sort) : {first * 1000:8.1f} ms")
+    print(f"cached (next sorts) : {after * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+저장소 행 하나로 모델을 생성하는 비용을 측정합니다.
+
+실행: PYTHONPATH=. python scripts/benchmarks/row_hydration.py
+"""
+
+import timeit
+from typing import Any
+
+from app import models
+
+N = 20_000
+
+ROWS: dict[
+    type[models.Content] | type[models.User] | type[models.PointHistory],
+    dict[str, Any],
+] = {
+    models.Content: {
+        "user_id": "U0123456789",
+        "username": "글또",
+        "title": "파이썬 성능 최적화",
+        "content_url": "https://example.com/posts/1",
+        "dt": "2024-10-13 21:30:00",
+        "category": "기술 & 언어",
+        "description": "",
+        "type": "submit",
+        "tags": "python,performance",
+        "curation_flag": "N",
+        "ts": "1728822600.123456",
+    },
+    models.User: {
+        "user_id": "U0123456789",
+        "name": "글또",
+        "channel_name": "1_코어채널",
+        "channel_id": "C0123456789",
+        "intro": "안녕하세요.",
+        "deposit": "100000",
+        "cohort": "10기",
+    },
+    models.PointHistory: {
+        "id": "abcdef1728822600123",
+        "user_id": "U0123456789",
+        "reason": "글 제출",
+        "point": "100",
+        "category": "글쓰기",
+        "created_at": "2024-10-13 21:30:00",
+    },
+}
+
+
+def main() -> None:
+    print(f"{'model':<14}{'validate':>12}{'from_row':>12}")
+    for model, row in ROWS.items():
+        validate = min(timeit.repeat(lambda: model(**row), number=N, repeat=25))
+        from_row = min(timeit.repeat(lambda: model.from_row(row), number=N, repeat=25))
+        print(
+            f"{model.__name__:<14}"
+            f"{validate / N * 1e6:>9.2f} us"
+            f"{from_row / N * 1e6:>9.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
 import pytest
+from loguru import logger
 
 from app.slack.repositories import SlackRepository
 from app.slack.services.background import BackgroundService
 from app.slack.services.point import PointService
 
 
+@pytest.fixture(autouse=True, scope="session")
+def disable_log_file() -> None:
+    """테스트 실행 중 저장소의 로그 파일(store/logs.csv)에 로그를 쓰지 않습니다."""
+    logger.remove()
+
+
 @pytest.fixture
 def slack_repo() -> SlackRepository:
     return SlackRepository()
@@ -25,6 +32,8 @@ class FakeAsyncWebClient:
 
     async def chat_postMessage(self, **kwargs) -> None: ...
 
+    async def chat_getPermalink(self, **kwargs) -> None: ...
+
 
 class FakeSlackApp:
     def __init__(self) -> None:
@@ -0,0 +1,130 @@
+import json
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from starlette.requests import Request
+
+from app.api.views import contents
+from app.search.frame import contents_frame
+from app.translation import TranslatedKeywords
+
+
+def _write_store(store: Path) -> None:
+    (store / "users.csv").write_text(
+        '"user_id","name","cohort","channel_name"\n'
+        '"유저아이디","유저이름","10기","백엔드_1"\n',
+        encoding="utf-8",
+    )
+    (store / "contents.csv").write_text(
+        '"user_id","title","content_url","dt","category","tags","ts"\n'
+        '"유저아이디","파이썬 입문","https://example.com/1",'
+        '"2024-01-01 00:00:00","","","1.0"\n',
+        encoding="utf-8",
+    )
+
+
+def _request() -> Request:
+    return Request({"type": "http", "query_string": b"keyword=python", "headers": []})
+
+
+@pytest.mark.asyncio
+async def test_fetch_contents_store_changed_while_translating(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    검색어를 번역하는 동안 저장소가 바뀌어도 검색 결과가 올바른지 확인합니다.
+    - 번역 전에 가져온 데이터의 세대로 검색 결과를 캐시해야 합니다.
+    - 이후 같은 검색어로 검색하면 바뀐 저장소의 결과를 반환해야 합니다.
+    """
+    # given
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "store").mkdir()
+    _write_store(tmp_path / "store")
+    contents_frame.generation = None
+    contents.post_search_cache.clear()
+
+    async def translate_while_store_changes(keywords: list[str]) -> TranslatedKeywords:
+        if not translated_once:
+            translated_once.append(True)
+            with open("store/contents.csv", "a", encoding="utf-8") as f:
+                f.write(
+                    '"유저아이디","파이썬 심화","https://example.com/2",'
+                    '"2024-01-02 00:00:00","","","2.0"\n'
+                )
+        return TranslatedKeywords(keywords + ["파이썬"], is_degraded=False)
+
+    translated_once: list[bool] = []
+    mocker.patch.object(
+        contents, "translate_keywords", side_effect=translate_while_store_changes
+    )
+
+    # when
+    responses = [
+        json.loads(
+            (
+                await contents.fetch_contents(
+                    _request(), keyword="python", limit=50, cursor=None
+                )
+            ).body
+        )
+        for _ in range(2)
+    ]
+
+    # then
+    first, second = responses
+    assert [row["content_url"] for row in first["data"]] == ["https://example.com/1"]
+    assert [row["content_url"] for row in second["data"]] == [
+        "https://example.com/2",
+        "https://example.com/1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_contents_keyword_inside_word(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    검색어가 단어 중간에 있거나 한글, 영문이 아닌 문자여도 콘텐츠를 찾는지 확인합니다.
+    - "script" 로 "JavaScript" 글을 찾아야 합니다.
+    - "日本" 으로 "日本語" 글을 찾아야 합니다.
+    """
+    # given
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "store").mkdir()
+    _write_store(tmp_path / "store")
+    with open("store/contents.csv", "a", encoding="utf-8") as f:
+        f.write(
+            '"유저아이디","JavaScript 클로저","https://example.com/2",'
+            '"2024-01-02 00:00:00","","","2.0"\n'
+            '"유저아이디","日本語 공부","https://example.com/3",'
+            '"2024-01-03 00:00:00","","","3.0"\n'
+        )
+    contents_frame.generation = None
+    contents.post_search_cache.clear()
+    mocker.patch.object(
+        contents,
+        "translate_keywords",
+        return_value=TranslatedKeywords([], is_degraded=False),
+    )
+
+    # when
+    responses = [
+        json.loads(
+            (
+                await contents.fetch_contents(
+                    _request(), keyword=keyword, limit=50, cursor=None
+                )
+            ).body
+        )
+        for keyword in ["script", "日本"]
+    ]
+
+    # then
+    script, japanese = responses
+    assert [row["content_url"] for row in script["data"]] == ["https://example.com/2"]
+    assert [row["content_url"] for row in japanese["data"]] == ["https://example.com/3"]
@@ -0,0 +1,215 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.web.async_slack_response import AsyncSlackResponse
+
+from app.slack.dispatcher import Priority, SlackDispatcher, TokenBucket
+
+
+class _FakeClockEventLoop(asyncio.SelectorEventLoop):
+    """
+    실행할 작업이 없으면 기다리지 않고 다음 예약 시각으로 시간을 넘기는 이벤트 루프입니다.
+    부동소수점 오차로 토큰이 1개에 조금 못 미치더라도 시간이 흐르도록 최소 1us 씩 넘깁니다.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._now = 0.0
+
+    def time(self) -> float:
+        return self._now
+
+    def _run_once(self) -> None:
+        if not self._ready and self._scheduled:  # type: ignore[attr-defined]
+            next_when = self._scheduled[0].when()  # type: ignore[attr-defined]
+            self._now = max(self._now + 1e-6, next_when)
+        super()._run_once()  # type: ignore[misc]
+
+
+def _rate_limited_response(retry_after: str) -> AsyncSlackResponse:
+    return AsyncSlackResponse(
+        client=None,  # type: ignore
+        http_verb="POST",
+        api_url="https://slack.com/api/chat.postMessage",
+        req_args={},
+        data={"ok": False, "error": "ratelimited"},
+        headers={"Retry-After": retry_after},
+        status_code=429,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_retries_after_rate_limited() -> None:
+    """
+    429 응답을 받으면 Retry-After 만큼 기다린 뒤 다시 시도하는지 확인합니다.
+    - 재시도 횟수를 넘으면 예외를 그대로 전달해야 합니다.
+    """
+    # given
+    client = AsyncWebClient()
+    rate_limited = SlackApiError("ratelimited", _rate_limited_response("0"))
+    client.chat_postMessage = AsyncMock(  # type: ignore
+        side_effect=[rate_limited, {"ok": True}, rate_limited, rate_limited]
+    )
+    dispatcher = SlackDispatcher(max_retries=1)
+
+    # when
+    response = await dispatcher.call(
+        client, "chat.postMessage", channel="채널", text="안녕하세요"
+    )
+
+    # then
+    assert response == {"ok": True}
+    assert client.chat_postMessage.await_count == 2
+    assert client.chat_postMessage.await_args is not None
+    assert client.chat_postMessage.await_args.kwargs == {
+        "channel": "채널",
+        "text": "안녕하세요",
+    }
+    with pytest.raises(SlackApiError):
+        await dispatcher.call(client, "chat.postMessage", channel="채널", text="")
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_does_not_resend_timed_out_message(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    응답을 받지 못한 메시지 전송은 다시 시도하지 않는지 확인합니다.
+    - 타임아웃된 chat.postMessage 는 중복 전송하지 않도록 예외를 그대로 전달해야 합니다.
+    - 타임아웃된 chat.getPermalink 같은 조회는 다시 시도해야 합니다.
+    """
+    # given
+    monkeypatch.setattr("app.slack.dispatcher.BACKOFF_BASE_SECONDS", 0)
+    client = AsyncWebClient()
+    client.chat_postMessage = AsyncMock(  # type: ignore
+        side_effect=[asyncio.TimeoutError(), {"ok": True}]
+    )
+    client.chat_getPermalink = AsyncMock(  # type: ignore
+        side_effect=[asyncio.TimeoutError(), {"ok": True}]
+    )
+    dispatcher = SlackDispatcher()
+
+    # when
+    with pytest.raises(asyncio.TimeoutError):
+        await dispatcher.call(client, "chat.postMessage", channel="채널", text="")
+    response = await dispatcher.call(
+        client, "chat.getPermalink", channel="채널", message_ts="1"
+    )
+
+    # then
+    assert client.chat_postMessage.await_count == 1
+    assert dispatcher.metrics["chat.postMessage"].failures == 1
+    assert response == {"ok": True}
+    assert client.chat_getPermalink.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_priority() -> None:
+    """
+    토큰을 기다리는 호출은 우선순위가 높은 순서대로 토큰을 받는지 확인합니다.
+    - 유저 응답은 먼저 기다리던 대량 DM, 관리자 알림보다 먼저 토큰을 받아야 합니다.
+    - 대량 DM 작업의 진행 상황 알림은 기다리던 대량 DM 보다 먼저 토큰을 받아야 합니다.
+    """
+    # given
+    bucket = TokenBucket(rate=100, capacity=1)
+    await bucket.acquire()  # 남은 토큰을 모두 사용합니다.
+    order: list[Priority] = []
+
+    async def acquire(priority: Priority) -> None:
+        await bucket.acquire(priority)
+        order.append(priority)
+
+    # when
+    await asyncio.gather(
+        acquire(Priority.ADMIN),
+        acquire(Priority.BULK),
+        acquire(Priority.JOB_STATUS),
+        acquire(Priority.INTERACTIVE),
+    )
+
+    # then
+    assert order == [
+        Priority.INTERACTIVE,
+        Priority.JOB_STATUS,
+        Priority.BULK,
+        Priority.ADMIN,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_evicts_idle_buckets() -> None:
+    """
+    버킷이 많이 쌓이면 토큰이 가득 찬 채 쉬고 있는 버킷만 지우는지 확인합니다.
+    - 토큰을 사용한 채널의 버킷은 호출 제한을 지키도록 남아 있어야 합니다.
+    """
+    # given
+    client = AsyncWebClient()
+    client.chat_postMessage = AsyncMock(return_value={"ok": True})  # type: ignore
+    dispatcher = SlackDispatcher(bucket_sweep_threshold=3)
+    dispatcher._get_bucket("chat.postMessage:쉬는채널", 1.0)
+    await dispatcher.call(client, "chat.postMessage", channel="채널1", text="")
+
+    # when
+    await dispatcher.call(client, "chat.postMessage", channel="채널2", text="")
+
+    # then
+    assert set(dispatcher._buckets) == {
+        "chat.postMessage",
+        "chat.postMessage:채널1",
+        "chat.postMessage:채널2",
+    }
+
+
+def test_post_messages_reports_progress_before_last_message(
+    mocker: MockerFixture,
+) -> None:
+    """
+    대량 DM 을 보내는 중에 진행 상황 알림을 보내는지 확인합니다.
+    - 첫 진행 상황 알림은 마지막 DM 보다 먼저 전송해야 합니다.
+    - 워크스페이스 호출 제한(분당 300개) 때문에 250개를 보내는 데 수십 초가 걸려야 합니다.
+    """
+    # given
+    loop = _FakeClockEventLoop()
+    mocker.patch("app.slack.dispatcher.time", SimpleNamespace(monotonic=loop.time))
+    sent_channels: list[str] = []
+
+    async def post_message(**kwargs: Any) -> dict[str, Any]:
+        sent_channels.append(kwargs["channel"])
+        return {"ok": True}
+
+    client = AsyncWebClient()
+    client.chat_postMessage = AsyncMock(side_effect=post_message)  # type: ignore
+    dispatcher = SlackDispatcher()
+
+    async def report_progress(done: int, total: int) -> None:
+        await dispatcher.post_message(
+            client,
+            Priority.JOB_STATUS,
+            channel="관리자채널",
+            text=f"({done}/{total})",
+        )
+
+    # when
+    try:
+        errors = loop.run_until_complete(
+            dispatcher.post_messages(
+                client,
+                [{"channel": f"유저{i}", "text": ""} for i in range(250)],
+                on_progress=report_progress,
+            )
+        )
+    finally:
+        loop.close()
+
+    # then
+    assert errors == [None] * 250
+    assert loop.time() > 40
+    assert sent_channels.count("관리자채널") == 2
+    assert sent_channels.index("관리자채널") == 100
+    assert sent_channels.index("관리자채널") < sent_channels.index("유저249")
@@ -0,0 +1,103 @@
+import datetime
+
+from pytest_mock import MockerFixture
+
+from app.models import PaperPlane
+from app.paper_planes import PaperPlaneIndex
+from app.utils import SEOUL_TZ
+
+
+def _paper_plane_row(
+    id: str, sender_id: str, receiver_id: str, created_at: str
+) -> dict[str, str]:
+    return {
+        "id": id,
+        "sender_id": sender_id,
+        "sender_name": sender_id,
+        "receiver_id": receiver_id,
+        "receiver_name": receiver_id,
+        "text": "고마워요",
+        "text_color": "",
+        "bg_color": "",
+        "color_label": "",
+        "created_at": created_at,
+    }
+
+
+def test_count_current_week_paper_planes(mocker: MockerFixture) -> None:
+    """
+    이번 주에 보낸 종이비행기 수를 확인합니다.
+    - 토요일 0시부터 다음 금요일까지 보낸 종이비행기만 세야 합니다.
+    - 새로 보낸 종이비행기는 색인에 바로 반영해야 합니다.
+    """
+    # given
+    mocker.patch(
+        "app.paper_planes.tz_now",
+        return_value=datetime.datetime(2024, 10, 23, 12, 0, tzinfo=SEOUL_TZ),  # 수요일
+    )
+    index = PaperPlaneIndex()
+    index.build(
+        [
+            # 지난주 금요일
+            _paper_plane_row("id0", "유저", "받는사람", "2024-10-18 23:59:59"),
+            # 이번주 토요일
+            _paper_plane_row("id1", "유저", "받는사람", "2024-10-19 00:00:00"),
+            _paper_plane_row("id2", "다른유저", "받는사람", "2024-10-20 10:00:00"),
+        ],
+        generation=(1, 1),
+    )
+
+    # when
+    index.add(
+        PaperPlane(
+            sender_id="유저",
+            sender_name="유저",
+            receiver_id="받는사람",
+            receiver_name="받는사람",
+            text="고마워요",
+            text_color="",
+            bg_color="",
+            color_label="",
+            created_at="2024-10-23 12:00:00",
+        ),
+        from_generation=(1, 1),
+        to_generation=(2, 2),
+    )
+
+    # then
+    assert index.count_current_week("유저") == 2
+    assert index.count_current_week("다른유저") == 1
+
+
+def test_fetch_conversation_paper_planes() -> None:
+    """
+    두 유저가 주고받은 종이비행기를 최신순으로 가져오는지 확인합니다.
+    - 보낸 사람과 받은 사람 순서에 상관없이 같은 대화로 묶어야 합니다.
+    - 커서 이후의 종이비행기부터 가져와야 합니다.
+    - 커서가 있다면 offset 은 무시해야 합니다.
+    """
+    # given
+    index = PaperPlaneIndex()
+    index.build(
+        [
+            _paper_plane_row("id0", "A", "B", "2024-10-19 10:00:00"),
+            _paper_plane_row("id1", "B", "A", "2024-10-21 10:00:00"),
+            _paper_plane_row("id2", "A", "C", "2024-10-20 10:00:00"),
+            _paper_plane_row("id3", "A", "B", "2024-10-20 10:00:00"),
+        ],
+        generation=(1, 1),
+    )
+
+    # when
+    first_page = index.fetch_conversation("B", "A", offset=0, limit=2)
+    last = first_page.paper_planes[-1]
+    next_page = index.fetch_conversation(
+        "A", "B", offset=2, limit=2, cursor=(last.created_at, last.id)
+    )
+
+    # then
+    assert first_page.total == 3
+    assert [plane.id for plane in first_page.paper_planes] == ["id1", "id3"]
+    assert first_page.has_next
+    assert [plane.id for plane in next_page.paper_planes] == ["id0"]
+    assert not next_page.has_next
@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import cast
+
+from slack_sdk.web.async_client import AsyncWebClient
+
+import pytest
+from pytest_mock import MockerFixture
+from app.permalinks import get_permalink, permalink_cache
+from test.conftest import FakeSlackApp
+
+
+@pytest.mark.asyncio
+async def test_get_permalink(
+    slack_app: FakeSlackApp,
+    mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    메시지 링크를 한 번만 가져오고 저장소에 저장하는지 확인합니다.
+    - 이미 가져온 링크는 chat.getPermalink 를 다시 호출하지 않아야 합니다.
+    - 서버를 다시 시작해도 저장소에 저장한 링크를 사용해야 합니다.
+    """
+    # given
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "store").mkdir()
+    permalink_mock = mocker.patch.object(
+        slack_app.client,
+        "chat_getPermalink",
+        side_effect=lambda channel, message_ts: {
+            "permalink": f"{channel}/{message_ts}"
+        },
+    )
+    client = cast(AsyncWebClient, slack_app.client)
+
+    # when
+    first = await get_permalink(client, "채널", "1730086982.752900")
+    second = await get_permalink(client, "채널", "1730086982.752900")
+    permalink_cache.generation = None  # 서버 재시작
+    third = await get_permalink(client, "채널", "1730086982.752900")
+
+    # then
+    assert first == second == third == "채널/1730086982.752900"
+    assert permalink_mock.call_count == 1
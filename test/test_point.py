@@ -207,6 +207,7 @@ def test_grant_if_post_submitted_continuously(
         "get_user",
         return_value=user,
     )
+    mocker.patch.object(SlackRepository, "add_point")  # 저장소에 쓰지 않습니다.
 
     # when
     result = point_service.grant_if_post_submitted_continuously(user_id=user.user_id)
@@ -0,0 +1,46 @@
+from app.models import PointHistory
+from app.points import LeaderboardEntry, PointLedger
+
+
+def _point_row(user_id: str, point: int, category: str = "글쓰기") -> dict[str, str]:
+    return {"user_id": user_id, "point": str(point), "category": category}
+
+
+def test_point_ledger_leaderboard() -> None:
+    """
+    포인트 원장의 합계와 리더보드를 확인합니다.
+    - 포인트를 추가하면 총 포인트와 순위를 바로 갱신해야 합니다.
+    - 공동 순위는 같은 순위를 가지며, user_ids 가 주어지면 해당 유저들 사이의 순위를 반환해야 합니다.
+    """
+    # given
+    ledger = PointLedger()
+    ledger.build(
+        [
+            _point_row("유저1", 100),
+            _point_row("유저1", 10, category="커피챗"),
+            _point_row("유저2", 200),
+            _point_row("유저3", 150),
+        ],
+        generation=(1, 1),
+    )
+
+    # when
+    ledger.add(
+        PointHistory(user_id="유저1", reason="글 제출", point=90, category="글쓰기"),
+        from_generation=(1, 1),
+        to_generation=(2, 2),
+    )
+
+    # then
+    assert ledger.generation == (2, 2)
+    assert ledger.get_total_point("유저1") == 200
+    assert ledger.fetch_leaderboard(limit=3) == [
+        LeaderboardEntry(1, "유저1", 200),
+        LeaderboardEntry(1, "유저2", 200),
+        LeaderboardEntry(3, "유저3", 150),
+    ]
+    assert ledger.fetch_leaderboard(limit=1, user_ids={"유저1", "유저3"}) == [
+        LeaderboardEntry(1, "유저1", 200)
+    ]
+    assert ledger.get_rank("유저3", user_ids={"유저2", "유저3"}) == 2
+    assert ledger.get_rank("없는유저") is None
@@ -1,22 +1,50 @@
+import csv
 from datetime import timedelta
+from pathlib import Path
 from typing import cast
 
 from slack_bolt.async_app import AsyncApp
 
 import pytest
 from pytest_mock import MockerFixture
-from app.models import Content, User
-from app.slack.repositories import SlackRepository
+from app.models import Content, ContentRecord, User, UserRecord
 from app.slack.services.background import BackgroundService
 from app.utils import tz_now
 from test.conftest import FakeSlackApp
 
 
+def _write_store(store_path: Path, users: list[User]) -> None:
+    """유저와 콘텐츠를 저장소 csv 파일로 저장합니다."""
+    store_path.mkdir()
+    with open(store_path / "users.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(UserRecord._fields[:-1])
+        for user in users:
+            writer.writerow(
+                [
+                    user.user_id,
+                    user.name,
+                    user.channel_name,
+                    user.channel_id,
+                    user.intro,
+                    user.deposit,
+                    user.cohort,
+                ]
+            )
+    with open(store_path / "contents.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(ContentRecord._fields)
+        for user in users:
+            writer.writerows(content.to_list_for_csv() for content in user.contents)
+
+
 @pytest.mark.asyncio
 async def test_send_reminder_message_to_user(
     background_service: BackgroundService,
     slack_app: FakeSlackApp,
     mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """
     리마인드 대상 유저에게 메시지를 전송하는지 확인합니다.
@@ -31,10 +59,10 @@ async def test_send_reminder_message_to_user(
             tz_now().date(),  # 현재 회차 마감일
         ],
     )
-    mocker.patch.object(
-        SlackRepository,
-        "fetch_users",
-        return_value=[
+    monkeypatch.chdir(tmp_path)
+    _write_store(
+        tmp_path / "store",
+        [
             User(
                 user_id="리마인드 비대상1",
                 name="슬랙봇",
@@ -0,0 +1,144 @@
+from app.models import ContentRecord
+from app.search.bm25 import BM25Index
+from app.search.index import ContentIndex
+from app.search.result_cache import SearchResultCache
+from app.search.tokenizer import tokenize
+
+
+def _content_record(title: str, dt: str) -> ContentRecord:
+    return ContentRecord(
+        user_id="유저아이디",
+        username="유저이름",
+        title=title,
+        content_url=f"https://example.com/{title}",
+        dt=dt,
+        category="",
+        description="",
+        type="submit",
+        tags="",
+        curation_flag="N",
+        ts="",
+    )
+
+
+def test_tokenize() -> None:
+    """한글은 음절 unigram 과 bigram 으로, 영문과 숫자는 단어로 나누는지 확인합니다."""
+    # when
+    tokens = tokenize("비동기 React-Hooks")
+
+    # then
+    assert tokens == ["react", "hooks", "비", "동", "기", "비동", "동기"]
+
+
+def test_content_index_search() -> None:
+    """
+    콘텐츠 색인 검색 결과를 확인합니다.
+    - 띄어쓰기와 상관없이 한글 검색어가 포함된 콘텐츠를 찾아야 합니다.
+    - 마지막 음절은 초성, 중성만 입력해도 찾아야 합니다. 예) "비도" -> "비동기"
+    - 결과는 생성일시 내림차순이어야 합니다.
+    """
+    # given
+    index = ContentIndex()
+    index.build(
+        [
+            _content_record("파이썬비동기 정리", "2024-01-01 00:00:00"),
+            _content_record("파이썬 비동기 튜토리얼", "2024-01-02 00:00:00"),
+            _content_record("자바 동기화", "2024-01-03 00:00:00"),
+        ],
+        generation=(0, 0),
+    )
+
+    # when
+    contents = index.search("비동기")
+    prefix_contents = index.search("파이썬 비도")
+
+    # then
+    assert [content.title for content in contents] == [
+        "파이썬 비동기 튜토리얼",
+        "파이썬비동기 정리",
+    ]
+    assert prefix_contents == contents
+
+
+def test_content_index_search_field_boundary() -> None:
+    """
+    제목, 소개, 태그의 경계에 있는 단어도 찾는지 확인합니다.
+    - 필드 경계의 단어가 서로 붙지 않아야 합니다.
+    - 기호가 섞인 검색어는 문자열 포함 여부로 찾아야 합니다.
+    """
+    # given
+    content = _content_record("Learning FastAPI", "2024-01-01 00:00:00")
+    content = content._replace(description="Django vs flask", tags="python,backend")
+    other = _content_record("c언어 입문", "2024-01-02 00:00:00")
+    index = ContentIndex()
+    index.build([content, other], generation=(0, 0))
+
+    # when, then
+    assert index.search("django") == [content]
+    assert index.search("python") == [content]
+    assert index.search("c++") == []
+
+
+def test_content_index_search_ascii_substring() -> None:
+    """
+    영문 검색어가 단어 중간에 있어도 찾는지 확인합니다.
+    - "script" 로 "JavaScript" 를 찾아야 합니다.
+    - 띄어 쓴 "fast api" 로 붙여 쓴 "FastAPI" 를 찾아야 합니다.
+    """
+    # given
+    javascript = _content_record("JavaScript 클로저", "2024-01-01 00:00:00")
+    fastapi = _content_record("Learning FastAPI", "2024-01-02 00:00:00")
+    index = ContentIndex()
+    index.build([javascript, fastapi], generation=(0, 0))
+
+    # when, then
+    assert index.search("script") == [javascript]
+    assert index.search("fast api") == [fastapi]
+    assert index.search("java 클로저") == [javascript]
+
+
+def test_bm25_index_search() -> None:
+    """
+    BM25 색인 검색 결과를 확인합니다.
+    - 제목에 검색어가 있는 콘텐츠가 태그에만 있는 콘텐츠보다 관련도가 높아야 합니다.
+    - 검색어가 없는 콘텐츠는 결과에 포함하지 않아야 합니다.
+    """
+    # given
+    index = BM25Index()
+    index.build(
+        [
+            ("태그", {"title": "회고", "tags": "파이썬", "name": "글또"}),
+            ("제목", {"title": "파이썬 회고", "tags": "", "name": "글또"}),
+            ("없음", {"title": "자바 회고", "tags": "", "name": "글또"}),
+        ],
+        generation=0,
+    )
+
+    # when
+    relevance = dict(index.search(["파이썬"]))
+
+    # then
+    assert relevance.keys() == {"태그", "제목"}
+    assert relevance["제목"] > relevance["태그"]
+
+
+def test_search_result_cache() -> None:
+    """
+    검색 결과 캐시를 확인합니다.
+    - 저장소 세대가 같으면 캐시된 결과를 반환해야 합니다.
+    - 저장소 세대가 바뀌면 캐시된 결과를 사용하지 않아야 합니다.
+    - 최대 크기를 넘으면 가장 오래 사용하지 않은 결과를 지워야 합니다.
+    """
+    # given
+    cache: SearchResultCache[list[int]] = SearchResultCache(max_size=2)
+    cache.set("파이썬", (1, 1), [1, 2])
+    cache.set("자바", (1, 1), [3])
+
+    # when
+    cache.get("파이썬", (1, 1))  # 파이썬을 최근에 사용한 결과로 만듭니다.
+    cache.set("코틀린", (1, 1), [4])
+
+    # then
+    assert cache.get("파이썬", (1, 1)) == [1, 2]
+    assert cache.get("자바", (1, 1)) is None
+    assert cache.get("코틀린", (2, 2)) is None
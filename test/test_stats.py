@@ -0,0 +1,57 @@
+import datetime
+
+from pytest_mock import MockerFixture
+
+from app import stats
+from app.models import Content, User
+from app.utils import tz_now, tz_now_to_str
+
+
+def test_user_stats_cache(mocker: MockerFixture) -> None:
+    """
+    유저 통계 캐시가 저장소 쓰기에 맞춰 갱신되는지 확인합니다.
+    - 콘텐츠가 추가되면 캐시된 통계를 갱신해야 합니다.
+    - 회차가 바뀌면 캐시를 비워야 합니다.
+    """
+    # given
+    today = tz_now().date()
+    mocker.patch(
+        "app.models.DUE_DATES",
+        [
+            today - datetime.timedelta(days=28),  # 0회차
+            today - datetime.timedelta(days=14),  # 1회차
+            today,  # 2회차 (현재 회차)
+        ],
+    )
+    user = User(
+        user_id="유저아이디",
+        name="유저이름",
+        channel_name="채널이름",
+        channel_id="채널아이디",
+        intro="",
+        contents=[],
+    )
+    stats.clear_user_stats()
+    stats.get_user_stats(user.user_id)  # 현재 회차를 기록합니다.
+    stats.set_user_stats(user)
+
+    # when
+    user.contents.append(
+        Content(
+            dt=tz_now_to_str(),
+            user_id=user.user_id,
+            username="유저이름",
+            type="pass",
+        )
+    )
+    stats.update_contents(user)
+
+    # then
+    user_stats = stats.get_user_stats(user.user_id)
+    assert user_stats is not None
+    assert user_stats.pass_count == 1
+    assert user_stats.not_submitted_count == 1
+
+    # 다음 회차로 넘어가면 캐시를 비웁니다.
+    mocker.patch("app.models.DUE_DATES", [today - datetime.timedelta(days=28), today])
+    assert stats.get_user_stats(user.user_id) is None
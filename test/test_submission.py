@@ -0,0 +1,109 @@
+import datetime
+
+from app.submission import (
+    SubmissionMatrix,
+    SubmissionOrderIndex,
+    get_round_calendar,
+)
+
+
+DUE_DATES = [
+    datetime.date(2024, 1, 7),  # 0회차 - 시작일
+    datetime.date(2024, 1, 21),  # 1회차
+    datetime.date(2024, 2, 4),  # 2회차
+    datetime.date(2024, 2, 18),  # 3회차
+]
+
+
+def test_round_calendar_get_round() -> None:
+    """
+    날짜가 속한 회차를 계산하는지 확인합니다.
+    - 마감일 당일은 해당 회차에 포함되어야 합니다.
+    - 마지막 마감일 이후라면 마감일 수를 반환해야 합니다.
+    """
+    # given
+    calendar = get_round_calendar(DUE_DATES)
+
+    # when, then
+    assert calendar.get_round(datetime.date(2024, 1, 1)) == 0
+    assert calendar.get_round(datetime.date(2024, 1, 7)) == 0
+    assert calendar.get_round(datetime.date(2024, 1, 8)) == 1
+    assert calendar.get_round(datetime.date(2024, 2, 18)) == 3
+    assert calendar.get_round(datetime.date(2024, 2, 19)) == 4
+    assert not calendar.is_in_season(4)
+
+
+def test_submission_matrix() -> None:
+    """
+    유저들의 회차별 제출 상태를 한 번에 계산하는지 확인합니다.
+    - 같은 회차에 여러 콘텐츠가 있다면 마지막 콘텐츠로 상태를 판단해야 합니다.
+    - 연속 제출 횟수에서 패스는 건너뛰고 미제출은 끊어야 합니다.
+    - 현재 회차는 제출 여부에만 반영해야 합니다.
+    """
+    # given
+    contents = [
+        ("U1", "2024-01-10 10:00:00", "pass"),  # 1회차
+        ("U1", "2024-01-25 10:00:00", "submit"),  # 2회차
+        ("U1", "2024-02-06 10:00:00", "submit"),  # 3회차(현재 회차)
+        ("U2", "2024-01-25 10:00:00", "submit"),  # 2회차
+        ("U2", "2024-02-04 10:00:00", "pass"),  # 2회차의 마지막 콘텐츠
+    ]
+
+    # when
+    matrix = SubmissionMatrix.from_columns(
+        ["U1", "U2", "U3"],
+        [content[0] for content in contents],
+        [content[1] for content in contents],
+        [content[2] for content in contents],
+        due_dates=DUE_DATES,
+        now_date=datetime.date(2024, 2, 10),
+    )
+
+    # then
+    assert matrix.get_submit_status("U1") == {1: "패스", 2: "제출"}
+    assert matrix.get_submit_status("U2") == {1: "미제출", 2: "패스"}
+    assert matrix.get_continuous_submit_count("U1") == 1
+    assert matrix.get_continuous_submit_count("U2") == 0
+    assert matrix.count_not_submitted("U3") == 2
+    assert matrix.is_submit("U1")
+    assert matrix.fetch_unsubmitted_user_ids() == ["U2", "U3"]
+
+
+def test_submission_order_index() -> None:
+    """
+    채널, 회차별 첫 제출 순위를 확인합니다.
+    - 같은 회차에 다시 제출하거나 패스해도 첫 제출 순위는 바뀌지 않아야 합니다.
+    - 새로 제출한 콘텐츠는 색인에 바로 반영해야 합니다.
+    """
+    # given
+    index = SubmissionOrderIndex()
+    index.build(
+        {"U1": "C1", "U2": "C1", "U3": "C1", "U4": "C2"},
+        [
+            ("U2", "2024-01-25 09:00:00", "submit"),  # 2회차
+            ("U4", "2024-01-25 09:30:00", "submit"),  # 다른 채널
+            ("U3", "2024-01-25 09:40:00", "pass"),
+            ("U1", "2024-01-25 10:00:00", "submit"),
+            ("U2", "2024-01-26 10:00:00", "submit"),  # 추가 제출
+        ],
+        get_round_calendar(DUE_DATES),
+        generation=((1, 1), (1, 1)),
+    )
+
+    # when
+    index.add(
+        "C1",
+        "U3",
+        "2024-01-27 10:00:00",
+        "submit",
+        from_generation=((1, 1), (1, 1)),
+        to_generation=((1, 1), (2, 2)),
+    )
+
+    # then
+    assert index.generation == ((1, 1), (2, 2))
+    assert index.get_rank("C1", 2, "U2") == 1
+    assert index.get_rank("C1", 2, "U1") == 2
+    assert index.get_rank("C1", 2, "U3") == 3
+    assert index.get_rank("C2", 2, "U4") == 1
+    assert index.get_rank("C1", 1, "U1") is None
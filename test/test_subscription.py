@@ -0,0 +1,301 @@
+import asyncio
+import csv
+from datetime import timedelta
+from pathlib import Path
+from typing import cast
+
+from slack_bolt.async_app import AsyncApp
+
+import pytest
+from pytest_mock import MockerFixture
+from app.models import ContentRecord, SubscriptionStatusEnum
+from app.slack.services.background import BackgroundService, SubscriptionMessage
+from app.utils import tz_now
+from test.conftest import FakeSlackApp
+
+
+def _write_csv(path: Path, header: tuple[str, ...], rows: list[list[str]]) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _content_row(title: str, dt: str, type: str, ts: str) -> list[str]:
+    row = dict.fromkeys(ContentRecord._fields, "")
+    row.update(user_id="작성자", title=title, dt=dt, type=type, ts=ts)
+    return list(row.values())
+
+
+JOB_FIELDS = (
+    *SubscriptionMessage.__annotations__,
+    "job_date",
+    "status",
+    "attempts",
+    "next_retry_at",
+    "error",
+)
+
+
+def _job_row(
+    user_id: str, target_user_id: str, channel: str, ts: str, status: str = "pending"
+) -> list[str]:
+    today = tz_now().date().isoformat()
+    return [
+        user_id,
+        target_user_id,
+        channel,
+        ts,
+        "글",
+        today,
+        today,
+        status,
+        "0",
+        "",
+        "",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_prepare_subscribe_message_data(
+    background_service: BackgroundService,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    어제 제출한 글을 활성 구독자에게 보낼 알림 전송 작업으로 저장하는지 확인합니다.
+    - 구독자마다 구독 대상자의 어제 제출 글 하나당 메시지 하나를 만들어야 합니다.
+    - 취소한 구독, 어제가 아닌 글, 패스는 제외해야 합니다.
+    """
+    # given
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "store").mkdir()
+    yesterday = (tz_now() - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+    today = tz_now().strftime("%Y-%m-%d %H:%M:%S")
+    _write_csv(
+        tmp_path / "store" / "subscriptions.csv",
+        ("id", "user_id", "target_user_id", "target_user_channel", "status"),
+        [
+            ["1", "구독자1", "작성자", "채널", SubscriptionStatusEnum.ACTIVE.value],
+            ["2", "구독자2", "작성자", "채널", SubscriptionStatusEnum.ACTIVE.value],
+            ["3", "구독자3", "작성자", "채널", SubscriptionStatusEnum.CANCELED.value],
+        ],
+    )
+    _write_csv(
+        tmp_path / "store" / "contents.csv",
+        ContentRecord._fields,
+        [
+            _content_row("어제 글", yesterday, "submit", "1730086982.752900"),
+            _content_row("", yesterday, "pass", "1730086982.752901"),
+            _content_row("오늘 글", today, "submit", "1730086982.752902"),
+        ],
+    )
+
+    # when
+    await background_service.prepare_subscribe_message_data()
+
+    # then
+    with open("store/_subscription_jobs.csv") as f:
+        jobs = list(csv.DictReader(f))
+    assert jobs == [
+        {
+            "user_id": subscriber,
+            "target_user_id": "작성자",
+            "target_user_channel": "채널",
+            "ts": "1730086982.752900",
+            "title": "어제 글",
+            "dt": yesterday[:10],
+            "job_date": today[:10],
+            "status": "pending",
+            "attempts": "0",
+            "next_retry_at": "",
+            "error": "",
+        }
+        for subscriber in ["구독자1", "구독자2"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_subscription_messages(
+    background_service: BackgroundService,
+    slack_app: FakeSlackApp,
+    mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    구독 알림을 구독자별 다이제스트 DM 으로 전송하는지 확인합니다.
+    - 여러 구독자가 같은 글을 구독하더라도 글 링크는 글마다 한 번만 가져와야 합니다.
+    - 구독자마다 하나의 DM 에 모든 새 글을 담아야 합니다.
+    - 이미 전송한 작업은 다시 전송하지 않아야 합니다.
+    """
+    # given
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "store").mkdir()
+    _write_csv(
+        tmp_path / "store" / "_subscription_jobs.csv",
+        JOB_FIELDS,
+        [
+            _job_row("구독자1", "작성자1", "채널1", "1730086982.752900"),
+            _job_row("구독자1", "작성자2", "채널2", "1730086982.752901"),
+            _job_row("구독자2", "작성자1", "채널1", "1730086982.752900"),
+            _job_row("구독자3", "작성자1", "채널1", "1730086982.752900", "sent"),
+        ],
+    )
+    permalink_mock = mocker.patch.object(
+        slack_app.client,
+        "chat_getPermalink",
+        side_effect=lambda channel, message_ts: {
+            "permalink": f"{channel}/{message_ts}"
+        },
+    )
+    post_message_mock = mocker.patch.object(slack_app.client, "chat_postMessage")
+
+    # when
+    await background_service.send_subscription_messages(cast(AsyncApp, slack_app))
+
+    # then
+    assert permalink_mock.call_count == 2
+    digests = {
+        call.kwargs["channel"]: call.kwargs["text"]
+        for call in post_message_mock.call_args_list[:-1]
+    }
+    assert digests == {
+        "구독자1": "구독하신 멤버의 새로운 글이 2개 올라왔어요! 🤩",
+        "구독자2": "구독하신 멤버의 새로운 글이 1개 올라왔어요! 🤩",
+    }
+    assert (
+        post_message_mock.call_args_list[-1].kwargs["text"]
+        == "총 3 명에게 4 개의 구독 알림을 전송했습니다."
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_subscription_messages_retry(
+    background_service: BackgroundService,
+    slack_app: FakeSlackApp,
+    mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    전송에 실패한 구독 알림을 다시 전송하는지 확인합니다.
+    - 실패한 작업은 시도 횟수를 늘리고, 다음 재시도 시각에 다시 전송해야 합니다.
+    - 전송 상태는 작업 테이블에 저장해야 합니다.
+    """
+    # given
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "store").mkdir()
+    _write_csv(
+        tmp_path / "store" / "_subscription_jobs.csv",
+        JOB_FIELDS,
+        [_job_row("구독자1", "작성자1", "채널1", "1730086982.752900")],
+    )
+    mocker.patch("app.slack.services.background.SUBSCRIPTION_RETRY_BASE_SECONDS", 0)
+    mocker.patch.object(
+        slack_app.client,
+        "chat_getPermalink",
+        return_value={"permalink": "채널1/1730086982.752900"},
+    )
+    post_message_mock = mocker.patch.object(
+        slack_app.client,
+        "chat_postMessage",
+        side_effect=[Exception("일시적인 오류"), None, None],
+    )
+
+    # when
+    await background_service.send_subscription_messages(cast(AsyncApp, slack_app))
+
+    # then
+    assert [call.kwargs["channel"] for call in post_message_mock.call_args_list][
+        :2
+    ] == ["구독자1", "구독자1"]
+    with open("store/_subscription_jobs.csv") as f:
+        (job,) = list(csv.DictReader(f))
+    assert job["status"] == "sent"
+    assert job["attempts"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_send_subscription_messages_concurrently(
+    background_service: BackgroundService,
+    slack_app: FakeSlackApp,
+    mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """이어서 보내는 작업과 정기 작업이 동시에 실행되더라도 구독 알림을 한 번만 전송하는지 확인합니다."""
+    # given
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "store").mkdir()
+    _write_csv(
+        tmp_path / "store" / "_subscription_jobs.csv",
+        JOB_FIELDS,
+        [_job_row("구독자1", "작성자1", "채널1", "1730086982.752900")],
+    )
+    mocker.patch.object(
+        slack_app.client,
+        "chat_getPermalink",
+        return_value={"permalink": "채널1/1730086982.752900"},
+    )
+    post_message_mock = mocker.patch.object(slack_app.client, "chat_postMessage")
+
+    # when
+    await asyncio.gather(
+        background_service.send_subscription_messages(cast(AsyncApp, slack_app)),
+        background_service.send_subscription_messages(cast(AsyncApp, slack_app)),
+    )
+
+    # then
+    channels = [call.kwargs["channel"] for call in post_message_mock.call_args_list]
+    assert channels.count("구독자1") == 1
+
+
+@pytest.mark.asyncio
+async def test_send_subscription_messages_resume_from_events(
+    background_service: BackgroundService,
+    slack_app: FakeSlackApp,
+    mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    중단된 작업을 다시 실행하면 상태 기록을 반영하여 남은 알림만 전송하는지 확인합니다.
+    - 상태 기록에 전송 완료로 남은 작업은 다시 전송하지 않아야 합니다.
+    - 기록 중 중단되어 필드가 모자란 줄은 건너뛰어야 합니다.
+    - 전송을 마치면 상태 기록을 작업 테이블에 합치고 지워야 합니다.
+    """
+    # given
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "store").mkdir()
+    _write_csv(
+        tmp_path / "store" / "_subscription_jobs.csv",
+        JOB_FIELDS,
+        [
+            _job_row("구독자1", "작성자1", "채널1", "1730086982.752900"),
+            _job_row("구독자2", "작성자1", "채널1", "1730086982.752900"),
+        ],
+    )
+    with open(tmp_path / "store" / "_subscription_job_events.csv", "w") as f:
+        f.write(
+            '"job_id","status","attempts","next_retry_at","error"\n'
+            '"0","sent","0","",""\n'
+            '"1","se'
+        )
+    mocker.patch.object(
+        slack_app.client,
+        "chat_getPermalink",
+        return_value={"permalink": "채널1/1730086982.752900"},
+    )
+    post_message_mock = mocker.patch.object(slack_app.client, "chat_postMessage")
+
+    # when
+    await background_service.send_subscription_messages(cast(AsyncApp, slack_app))
+
+    # then
+    channels = [call.kwargs["channel"] for call in post_message_mock.call_args_list]
+    assert "구독자1" not in channels
+    assert channels.count("구독자2") == 1
+    assert not (tmp_path / "store" / "_subscription_job_events.csv").exists()
+    with open("store/_subscription_jobs.csv") as f:
+        assert [job["status"] for job in csv.DictReader(f)] == ["sent", "sent"]
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app import translation
+from app.translation import DictionaryTranslator, TranslationCache
+
+
+class SlowTranslator:
+    def translate(self, text: str, dest: str) -> str:
+        time.sleep(0.5)
+        return text
+
+
+@pytest.mark.asyncio
+async def test_translate_keywords(tmp_path, mocker: MockerFixture) -> None:
+    """
+    키워드 번역 결과를 확인합니다.
+    - 영어는 한글로, 한글은 영어로 번역해야 합니다.
+    - 번역 결과를 캐시하고 파일에 저장해야 합니다.
+    - 제한 시간 안에 번역하지 못하면 번역 없이 검색하고, 번역이 끝나면 캐시해야 합니다.
+    """
+    # given
+    path = str(tmp_path / "translations.csv")
+    mocker.patch.object(translation, "translation_cache", TranslationCache(path))
+    mocker.patch.object(translation, "_translator", None)
+    translation.set_translator(
+        DictionaryTranslator({"파이썬": "Python", "비동기": "async"})
+    )
+
+    # when
+    keywords = await translation.translate_keywords(["파이썬", "비동기", "c++"])
+
+    # then
+    assert keywords == (["python", "async"], False)
+    assert TranslationCache(path).get("파이썬", "en") == "python"
+
+    # 캐시된 키워드는 번역기를 사용하지 않고, 번역이 늦어지면 제외합니다.
+    translation.set_translator(SlowTranslator())
+    keywords = await translation.translate_keywords(["파이썬", "react"], timeout=0.1)
+    assert keywords == (["python"], True)
+    await asyncio.sleep(0.6)
+    assert translation.translation_cache.get("react", "ko") == "react"
+
+
+def test_translation_cache_skip_malformed_rows(tmp_path) -> None:
+    """저장 중 중단되어 형식이 맞지 않는 행은 건너뛰고 불러오는지 확인합니다."""
+    # given
+    path = tmp_path / "translations.csv"
+    path.write_text('"파이썬","en","python","9999999999.0"\n"비동기","en"', "utf-8")
+
+    # when
+    cache = TranslationCache(str(path))
+
+    # then
+    assert cache.get("파이썬", "en") == "python"
+    assert cache.get("비동기", "en") is None